@@ -0,0 +1,76 @@
+""" Benchmarking multi-producer/multi-consumer throughput of bounded_queue.py
+against Python's queue.Queue.
+
+Producers put n elements in total, consumers take elements one by one with
+get, or in batches with get_many. Reports elements per second.
+
+Usage:
+python -m benchmarks.bounded_queue_benchmark [n] [producers] [consumers]
+"""
+import queue
+import sys
+import threading
+import time
+from data_structures.queues.bounded_queue import BoundedQueue
+
+MAXSIZE = 1024
+BATCH = 64
+STOP = None  # sentinel telling a consumer to finish
+
+
+def consume_one(q):
+    while q.get() is not STOP:
+        pass
+
+
+def consume_many(q):
+    while True:
+        batch = q.get_many(BATCH)
+        stops = batch.count(STOP)
+        if stops:
+            for i in range(stops - 1):  # hand other consumers' sentinels back
+                q.put(STOP)
+            return
+
+
+def run(q, consume, n, producers, consumers):
+    """ Returns time in seconds to pass n elements through queue q.
+    """
+    def produce(count):
+        for i in range(count):
+            q.put(i)
+
+    producer_threads = [threading.Thread(target=produce, args=(n // producers,))
+                        for i in range(producers)]
+    consumer_threads = [threading.Thread(target=consume, args=(q,))
+                        for i in range(consumers)]
+    start = time.perf_counter()
+    for thread in producer_threads + consumer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    for i in range(consumers):
+        q.put(STOP)
+    for thread in consumer_threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def benchmark(n, producers, consumers):
+    candidates = [
+        ("queue.Queue, get", lambda: queue.Queue(MAXSIZE), consume_one),
+        ("BoundedQueue, get", lambda: BoundedQueue(MAXSIZE), consume_one),
+        (f"BoundedQueue, get_many({BATCH})", lambda: BoundedQueue(MAXSIZE), consume_many),
+    ]
+    print(f"n = {n}, producers = {producers}, consumers = {consumers}, maxsize = {MAXSIZE}")
+    print(f"{'queue':<30}{'time, s':>10}{'elements/s':>14}")
+    for name, make, consume in candidates:
+        elapsed = run(make(), consume, n, producers, consumers)
+        print(f"{name:<30}{elapsed:>10.3f}{n / elapsed:>14.0f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    producers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    consumers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    benchmark(n, producers, consumers)
@@ -0,0 +1,127 @@
+""" Benchmarking speedup of the modules compiled by build_compiled.py over
+their pure Python versions.
+
+The compiled module is imported the usual way, the pure Python one is loaded
+straight from its .py file, so both run side by side in one process. Modules
+that aren't compiled are reported as such.
+
+Usage:
+python build_compiled.py
+python -m benchmarks.compiled_benchmark [n]
+"""
+import importlib
+import importlib.util
+import os
+import random
+import sys
+import time
+from build_compiled import COMPILED, directory, is_compiled
+
+
+def load_pure(path, package, name):
+    """ Loads a module from a .py file, ignoring compiled modules. The module
+    is named inside its package, so its relative imports work.
+    """
+    spec = importlib.util.spec_from_file_location(f"{package}.pure_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_both(subpackage, name):
+    """ Returns pure Python and the importable, maybe compiled, versions of
+    a module.
+    """
+    package = f"data_structures.{subpackage}"
+    pure = load_pure(os.path.join(directory(subpackage), name + ".py"), package, name)
+    return pure, importlib.import_module(f"{package}.{name}")
+
+
+def heap_func(m, n):
+    data = [random.random() for i in range(n)]
+    m.build_heap(data)
+    for i in range(n):
+        m.insert(data, random.random())
+    pop = m.pop_min if hasattr(m, "pop_min") else m.pop_max
+    while data:
+        pop(data)
+
+
+def disjoint_set_class(m, n):
+    ds = m.DisjointSet()
+    for i in range(n):
+        ds.make_set(i)
+    for i in range(n):
+        ds.union(random.randrange(n), random.randrange(n))
+    for i in range(n):
+        ds.find(i)
+
+
+def disjoint_set_array(m, n):
+    ds = m.DisjointSet(n)
+    for i in range(n):
+        ds.union(random.randrange(n), random.randrange(n))
+    for i in range(n):
+        ds.find(i)
+
+
+def binary_search_tree(m, n):
+    bst = m.BinarySearchTree()
+    keys = random.sample(range(10 * n), n)
+    for k in keys:
+        bst[k] = k
+    for k in keys:
+        bst.get(k)
+    for k in keys[:n // 2]:
+        del bst[k]
+
+
+def queue(m, n):
+    q = m.Queue()
+    for i in range(n):
+        q.enqueue(i)
+    for i in range(n):
+        q.dequeue()
+
+
+WORKLOADS = {
+    "min_heap_func": heap_func,
+    "max_heap_func": heap_func,
+    "disjoint_set_class": disjoint_set_class,
+    "disjoint_set_array": disjoint_set_array,
+    "binary_search_tree_class": binary_search_tree,
+    "queue_via_linked_list": queue,
+    "queue_via_stacks": queue,
+    "queue_via_ring_buffer": queue,
+    "queue_via_stacks_realtime": queue,
+}
+
+
+def measure(workload, module, n):
+    random.seed(0)  # same input for both versions
+    start = time.perf_counter()
+    workload(module, n)
+    return time.perf_counter() - start
+
+
+def benchmark(n):
+    print(f"n = {n}")
+    print(f"{'module':<28}{'pure, s':>10}{'compiled, s':>13}{'speedup':>10}")
+    for subpackage, files in COMPILED.items():
+        for file in files:
+            name = file[:-len(".py")]
+            if name not in WORKLOADS:
+                continue
+            pure, module = load_both(subpackage, name)
+            pure_time = measure(WORKLOADS[name], pure, n)
+            if not is_compiled(module):
+                print(f"{name:<28}{pure_time:>10.3f}{'not built':>13}")
+                continue
+            compiled_time = measure(WORKLOADS[name], module, n)
+            print(f"{name:<28}{pure_time:>10.3f}{compiled_time:>13.3f}"
+                  f"{pure_time / compiled_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    benchmark(n)
@@ -0,0 +1,98 @@
+""" Benchmarking read throughput of concurrent_tree_class.py against
+binary_search_tree_class.py behind one global lock, with reader threads
+running alongside a growing number of writer threads.
+
+Readers look up random keys, writers insert and delete random keys, for a
+fixed time. With the global lock a reader waits whenever another thread
+holds the lock, including a writer or a reader preempted in the middle of
+a lookup. Readers of ConcurrentBinarySearchTree never wait for the lock.
+Under the GIL threads still take turns, so total read throughput doesn't
+grow with more reader threads, the difference is in how much of it
+writers take away.
+
+Usage:
+python -m benchmarks.concurrent_tree_benchmark [keys] [readers] [seconds]
+"""
+import random
+import sys
+import threading
+import time
+from data_structures.trees.binary_search_trees.binary_search_tree_class import BinarySearchTree
+from data_structures.trees.binary_search_trees.concurrent_tree_class import ConcurrentBinarySearchTree
+
+
+class LockedTree:
+    """ BinarySearchTree behind one lock, the usual way to share it.
+    """
+    def __init__(self):
+        self.tree = BinarySearchTree()
+        self.lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self.lock:
+            return self.tree[key]
+
+    def __setitem__(self, key, val):
+        with self.lock:
+            self.tree[key] = val
+
+    def __delitem__(self, key):
+        with self.lock:
+            del self.tree[key]
+
+
+def run(tree, present, churned, readers, writers, seconds):
+    """ Returns numbers of reads and writes done in seconds. Readers look up
+    present keys, writers insert and delete churned ones.
+    """
+    stop = threading.Event()
+    reads, writes = [0] * readers, [0] * writers
+
+    def read(i):
+        lookups = random.Random(i).choices(present, k=10**4)
+        while not stop.is_set():
+            for k in lookups:
+                tree[k]
+            reads[i] += len(lookups)
+
+    def write(i):
+        rng, own = random.Random(-i - 1), churned[i::writers]  # writers don't share keys
+        while not stop.is_set():
+            k = rng.choice(own)
+            tree[k] = k  # a key is inserted and then deleted
+            del tree[k]
+            writes[i] += 2
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)] + \
+              [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(reads), sum(writes)
+
+
+def benchmark(n, readers, seconds):
+    random.seed(0)
+    keys = random.sample(range(10**9), 2 * n)
+    present, churned = keys[:n], keys[n:]  # readers always find their keys
+    print(f"{n} keys, {readers} readers, {seconds} s per run")
+    print(f"{'writers':<9}{'locked reads/s':>16}{'writes/s':>10}{'concurrent reads/s':>20}{'writes/s':>10}")
+    for writers in (0, 1, 2, 4):
+        row = []
+        for cls in (LockedTree, ConcurrentBinarySearchTree):
+            tree = cls()
+            for k in present:
+                tree[k] = k
+            reads, writes = run(tree, present, churned, readers, writers, seconds)
+            row += [reads / seconds, writes / seconds]
+        print(f"{writers:<9}{row[0]:>16.0f}{row[1]:>10.0f}{row[2]:>20.0f}{row[3]:>10.0f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 2
+    benchmark(n, readers, seconds)
@@ -0,0 +1,59 @@
+""" Benchmarking import time of the data_structures package.
+
+Every import statement runs in a fresh interpreter, so nothing is cached in
+sys.modules, and reports the best time of the statement itself over a few
+runs, along with how many modules of the package it loaded. Importing one
+structure should load its module and the packages above it only, the star
+import loads everything and shows what lazy loading saves.
+
+Usage:
+python -m benchmarks.import_benchmark [runs]
+"""
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import data_structures",
+    "from data_structures import MinHeap",
+    "from data_structures.heaps import MinHeap",
+    "from data_structures.heaps.min_heap_class import MinHeap",
+    "from data_structures import Queue",
+    "from data_structures import LRUCache",
+    "from data_structures import BoundedQueue",
+    "from data_structures import SharedMemoryQueue",
+    "from data_structures import *",
+]
+
+CHILD = """
+import sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(elapsed, sum(m.startswith("data_structures") for m in sys.modules))
+"""
+
+
+def measure(statement, runs):
+    """ Returns best time in seconds of statement in a fresh interpreter,
+    and number of data_structures modules it loaded.
+    """
+    best = float("inf")
+    for i in range(runs):
+        output = subprocess.run([sys.executable, "-c", CHILD.format(statement=statement)],
+                                capture_output=True, text=True, check=True).stdout
+        elapsed, loaded = output.split()
+        best = min(best, float(elapsed))
+    return best, int(loaded)
+
+
+def benchmark(runs):
+    print(f"best of {runs} runs")
+    print(f"{'statement':<58}{'time, ms':>10}{'modules':>9}")
+    for statement in STATEMENTS:
+        elapsed, loaded = measure(statement, runs)
+        print(f"{statement:<58}{elapsed * 1000:>10.2f}{loaded:>9}")
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    benchmark(runs)
@@ -0,0 +1,84 @@
+""" Benchmarking queue implementations: queue_via_ring_buffer.py,
+queue_via_linked_list.py, queue_via_stacks.py and collections.deque.
+
+For every queue reports time of n enqueues followed by n dequeues, time of a
+steady state of interleaved enqueue/dequeue pairs and the slowest single
+dequeue, which shows latency spikes.
+
+Usage:
+python -m benchmarks.queue_benchmark [n]
+"""
+import collections
+import sys
+import time
+from data_structures.queues import queue_via_linked_list
+from data_structures.queues import queue_via_ring_buffer
+from data_structures.queues import queue_via_stacks
+
+
+class Deque:
+    """ collections.deque with the queue API of this package.
+    """
+
+    def __init__(self):
+        self.items = collections.deque()
+
+    def enqueue(self, x):
+        self.items.append(x)
+
+    def dequeue(self):
+        return self.items.popleft()
+
+
+def fill_drain(queue, n):
+    """ Returns time of n enqueues followed by n dequeues and the slowest dequeue.
+    """
+    start = time.perf_counter()
+    for i in range(n):
+        queue.enqueue(i)
+    slowest = 0
+    for i in range(n):
+        t = time.perf_counter()
+        queue.dequeue()
+        slowest = max(slowest, time.perf_counter() - t)
+    return time.perf_counter() - start, slowest
+
+
+def steady_state(queue, n, backlog=1000):
+    """ Returns time of n enqueue/dequeue pairs on a queue holding backlog elements.
+    """
+    for i in range(backlog):
+        queue.enqueue(i)
+    start = time.perf_counter()
+    for i in range(n):
+        queue.enqueue(i)
+        queue.dequeue()
+    return time.perf_counter() - start
+
+
+def benchmark(n):
+    candidates = [
+        ("ring buffer", queue_via_ring_buffer.Queue),
+        ("linked list", queue_via_linked_list.Queue),
+        ("two stacks", queue_via_stacks.Queue),
+        ("collections.deque", Deque),
+    ]
+    print(f"n = {n}")
+    print(f"{'queue':<20}{'fill/drain, s':>15}{'steady, s':>12}{'max dequeue, ms':>18}")
+    for name, cls in candidates:
+        total, slowest = fill_drain(cls(), n)
+        steady = steady_state(cls(), n)
+        print(f"{name:<20}{total:>15.4f}{steady:>12.4f}{slowest * 1000:>18.3f}")
+
+    # bulk operations of the ring buffer
+    q = queue_via_ring_buffer.Queue()
+    start = time.perf_counter()
+    q.enqueue_many(range(n))
+    while not q.empty():
+        q.dequeue_many(1024)
+    print(f"{'ring buffer, bulk':<20}{time.perf_counter() - start:>15.4f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    benchmark(n)
@@ -0,0 +1,59 @@
+""" Benchmarking latency distribution of single queue operations of
+queue_via_stacks.py, queue_via_stacks_realtime.py and queue_via_ring_buffer.py.
+
+Workload is bursty: a burst of enqueues followed by dequeues of the whole
+burst, repeated a few times. Reports percentiles of a dequeue latency, the
+amortized queue pays for the whole burst in a single dequeue.
+
+Usage:
+python -m benchmarks.queue_latency_benchmark [burst] [rounds]
+"""
+import sys
+import time
+from data_structures.queues import queue_via_ring_buffer
+from data_structures.queues import queue_via_stacks
+from data_structures.queues import queue_via_stacks_realtime
+
+
+def percentile(sorted_values, p):
+    """ Returns p-th percentile of a sorted list of values.
+    """
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+def dequeue_latencies(queue, burst, rounds):
+    """ Returns a sorted list of dequeue latencies in nanoseconds.
+    """
+    clock = time.perf_counter_ns
+    latencies = []
+    for r in range(rounds):
+        for i in range(burst):
+            queue.enqueue(i)
+        for i in range(burst):
+            start = clock()
+            queue.dequeue()
+            latencies.append(clock() - start)
+    latencies.sort()
+    return latencies
+
+
+def benchmark(burst, rounds):
+    candidates = [
+        ("two stacks", queue_via_stacks.Queue),
+        ("real-time stacks", queue_via_stacks_realtime.Queue),
+        ("ring buffer", queue_via_ring_buffer.Queue),
+    ]
+    print(f"burst = {burst}, rounds = {rounds}, dequeue latency in microseconds")
+    print(f"{'queue':<20}{'p50':>10}{'p99':>10}{'p99.9':>10}{'max':>12}{'total, s':>10}")
+    for name, cls in candidates:
+        latencies = dequeue_latencies(cls(), burst, rounds)
+        row = [percentile(latencies, p) / 1000 for p in (50, 99, 99.9)]
+        row.append(latencies[-1] / 1000)
+        print(f"{name:<20}" + "".join(f"{v:>10.2f}" for v in row[:3]) +
+              f"{row[3]:>12.2f}{sum(latencies) / 10**9:>10.4f}")
+
+
+if __name__ == "__main__":
+    burst = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    benchmark(burst, rounds)
@@ -0,0 +1,82 @@
+""" Benchmarking throughput of shared_memory_queue.py against
+multiprocessing.Queue, handing n fixed-size records from a producer process to
+a consumer process.
+
+Usage:
+python -m benchmarks.shared_memory_queue_benchmark [n] [record_size]
+"""
+import multiprocessing
+import sys
+import time
+from data_structures.queues.shared_memory_queue import SharedMemoryQueue
+
+CAPACITY = 4096
+
+
+def shm_consumer(name, n, zero_copy):
+    q = SharedMemoryQueue.attach(name)
+    total = 0
+    for i in range(n):
+        if zero_copy:
+            view = q.peek()
+            while view is None:
+                view = q.peek()
+            total += view[0]  # read the record in place
+            view.release()
+            q.advance()
+        else:
+            total += q.dequeue()[0]
+    q.close()
+
+
+def shm_run(n, record_size, zero_copy):
+    q = SharedMemoryQueue.create(record_size, CAPACITY)
+    record = bytes(record_size)
+    consumer = multiprocessing.Process(target=shm_consumer, args=(q.name, n, zero_copy))
+    consumer.start()
+    start = time.perf_counter()
+    for i in range(n):
+        q.enqueue(record)
+    consumer.join()
+    elapsed = time.perf_counter() - start
+    q.close()
+    q.unlink()
+    return elapsed
+
+
+def mp_consumer(q, n):
+    total = 0
+    for i in range(n):
+        total += q.get()[0]
+
+
+def mp_run(n, record_size):
+    q = multiprocessing.Queue(CAPACITY)
+    record = bytes(record_size)
+    consumer = multiprocessing.Process(target=mp_consumer, args=(q, n))
+    consumer.start()
+    start = time.perf_counter()
+    for i in range(n):
+        q.put(record)
+    consumer.join()
+    return time.perf_counter() - start
+
+
+def benchmark(n, record_size):
+    candidates = [
+        ("multiprocessing.Queue", lambda: mp_run(n, record_size)),
+        ("SharedMemoryQueue, copy", lambda: shm_run(n, record_size, False)),
+        ("SharedMemoryQueue, zero-copy", lambda: shm_run(n, record_size, True)),
+    ]
+    print(f"n = {n}, record size = {record_size} bytes")
+    print(f"{'queue':<30}{'time, s':>10}{'records/s':>14}{'MB/s':>10}")
+    for name, run in candidates:
+        elapsed = run()
+        print(f"{name:<30}{elapsed:>10.3f}{n / elapsed:>14.0f}"
+              f"{n * record_size / elapsed / 10**6:>10.1f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    record_size = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    benchmark(n, record_size)
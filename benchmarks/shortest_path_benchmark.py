@@ -0,0 +1,104 @@
+""" Benchmarking Dijkstra's shortest paths with radix_heap_class.py against
+min_heap_class.py and heapq on a large sparse random graph with integer
+weights.
+
+RadixHeap uses decrease_key, MinHeap and heapq push a new (distance, vertex)
+pair instead and skip outdated ones when they're popped, as usual for
+binary heaps without a position index.
+
+Usage:
+python -m benchmarks.shortest_path_benchmark [vertices] [edges per vertex] [max weight]
+"""
+import heapq
+import random
+import sys
+import time
+from data_structures.heaps.min_heap_class import MinHeap
+from data_structures.heaps.radix_heap_class import RadixHeap
+
+INF = float("inf")
+
+
+def random_graph(n, degree, max_weight):
+    """ Returns adjacency lists of a random directed graph with n vertices,
+    degree outgoing edges per vertex and a path through all vertices, so
+    every vertex is reachable from 0.
+    """
+    graph = [[] for i in range(n)]
+    for u in range(n):
+        if u + 1 < n:
+            graph[u].append((u + 1, random.randint(1, max_weight)))
+        for i in range(degree - 1):
+            graph[u].append((random.randrange(n), random.randint(1, max_weight)))
+    return graph
+
+
+def dijkstra_radix(graph, source):
+    dist = [INF] * len(graph)
+    dist[source] = 0
+    heap = RadixHeap()
+    heap.insert(0, source)
+    while not heap.empty():
+        d, u = heap.pop_min()
+        for v, w in graph[u]:
+            if d + w < dist[v]:
+                if v in heap:
+                    heap.decrease_key(v, d + w)
+                else:
+                    heap.insert(d + w, v)
+                dist[v] = d + w
+    return dist
+
+
+def dijkstra_min_heap(graph, source):
+    dist = [INF] * len(graph)
+    dist[source] = 0
+    heap = MinHeap()
+    heap.insert((0, source))
+    while not heap.empty():
+        d, u = heap.pop_min()
+        if d > dist[u]:
+            continue  # outdated pair
+        for v, w in graph[u]:
+            if d + w < dist[v]:
+                dist[v] = d + w
+                heap.insert((d + w, v))
+    return dist
+
+
+def dijkstra_heapq(graph, source):
+    dist = [INF] * len(graph)
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, w in graph[u]:
+            if d + w < dist[v]:
+                dist[v] = d + w
+                heapq.heappush(heap, (d + w, v))
+    return dist
+
+
+def benchmark(n, degree, max_weight):
+    random.seed(0)
+    graph = random_graph(n, degree, max_weight)
+    print(f"{n} vertices, {n * degree} edges, weights 1..{max_weight}")
+    print(f"{'priority queue':<16}{'time, s':>10}")
+    expected = None
+    for name, dijkstra in (("RadixHeap", dijkstra_radix), ("MinHeap", dijkstra_min_heap),
+                           ("heapq", dijkstra_heapq)):
+        start = time.perf_counter()
+        dist = dijkstra(graph, 0)
+        elapsed = time.perf_counter() - start
+        assert expected is None or dist == expected, f"{name} disagrees"
+        expected = dist
+        print(f"{name:<16}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    degree = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    max_weight = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    benchmark(n, degree, max_weight)
@@ -0,0 +1,63 @@
+""" Benchmarking skip_list.py against binary_search_tree_class.py as ordered
+maps: inserts, lookups and deletes of random keys, and range scans.
+
+BinarySearchTree has no range search, so its scans walk keys in order from
+the smallest one. Both the keys and the skip list's levels are seeded, so
+every run builds the same structures.
+
+Usage:
+python -m benchmarks.skip_list_benchmark [keys] [range scans] [keys per scan]
+"""
+import random
+import sys
+import time
+from data_structures.linked_lists.skip_list import SkipList
+from data_structures.trees.binary_search_trees.binary_search_tree_class import BinarySearchTree
+
+
+def bst_range(tree, lo, hi):
+    for node in BinarySearchTree._nodes(tree.root):
+        if node.key >= hi:
+            return
+        if node.key >= lo:
+            yield node.key, node.val
+
+
+def benchmark(n, scans, width):
+    random.seed(0)
+    keys = random.sample(range(10**9), n)
+    lookups = random.choices(keys, k=n)
+    ordered = sorted(keys)
+    starts = [random.randrange(n - width) for i in range(scans)]
+    print(f"{n} keys, {scans} range scans of {width} keys")
+    print(f"{'operation':<12}{'BST, s':>10}{'skip list, s':>14}")
+    trees = (BinarySearchTree(), SkipList(seed=0))
+    scan = (lambda lo, hi: bst_range(trees[0], lo, hi), trees[1].range)
+    rows = {}
+    for i, tree in enumerate(trees):
+        start = time.perf_counter()
+        for k in keys:
+            tree[k] = k
+        rows.setdefault("put", []).append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for k in lookups:
+            tree[k]
+        rows.setdefault("get", []).append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for s in starts:
+            found = sum(1 for pair in scan[i](ordered[s], ordered[s + width]))
+            assert found == width
+        rows.setdefault("range", []).append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for k in keys:
+            del tree[k]
+        rows.setdefault("delete", []).append(time.perf_counter() - start)
+    for name, (bst, skip_list) in rows.items():
+        print(f"{name:<12}{bst:>10.3f}{skip_list:>14.3f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    scans = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    width = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    benchmark(n, scans, width)
@@ -0,0 +1,94 @@
+""" Benchmarking restoring structures from a snapshot file against rebuilding
+them by replaying every insert/union and against pickle.
+
+For MinHeap, array-backed DisjointSet and BinarySearchTree of n random
+integers reports time to rebuild, to dump and load with pickle and to dump
+and load a snapshot, plus file sizes. Pickling a tree of nodes recurses
+once per level, so it fails on deep trees, snapshots don't.
+
+Usage:
+python -m benchmarks.snapshot_benchmark [n]
+"""
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+from data_structures.disjoint_sets.disjoint_set_array import DisjointSet
+from data_structures.heaps.min_heap_class import MinHeap
+from data_structures.trees.binary_search_trees.binary_search_tree_class import BinarySearchTree
+
+
+def build_heap(data):
+    heap = MinHeap()
+    for x in data:
+        heap.insert(x)
+    return heap
+
+
+def build_disjoint_set(data):
+    ds = DisjointSet(len(data))
+    for i, x in enumerate(data):
+        ds.union(i, x % len(data))
+    return ds
+
+
+def build_tree(data):
+    bst = BinarySearchTree()
+    for x in data:
+        bst[x] = x
+    return bst
+
+
+def measure(func, *args):
+    """ Returns result of func(*args) and time in seconds it took.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def pickle_dump(structure, path):
+    with open(path, "wb") as f:
+        pickle.dump(structure, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def pickle_load(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def benchmark(n):
+    data = random.sample(range(10 * n), n)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "structure")
+    print(f"n = {n}")
+    print(f"{'structure':<18}{'method':<10}{'dump, s':>10}{'load, s':>10}{'size, MB':>10}")
+    for name, cls, build in (("MinHeap", MinHeap, build_heap),
+                             ("DisjointSet", DisjointSet, build_disjoint_set),
+                             ("BinarySearchTree", BinarySearchTree, build_tree)):
+        structure, elapsed = measure(build, data)
+        print(f"{name:<18}{'replay':<10}{'':>10}{elapsed:>10.3f}")
+        try:
+            limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(10**5)  # pickle recurses for every tree level
+            dumped = measure(pickle_dump, structure, path)[1]
+            loaded = measure(pickle_load, path)[1]
+            size = os.path.getsize(path) / 2**20
+            print(f"{'':<18}{'pickle':<10}{dumped:>10.3f}{loaded:>10.3f}{size:>10.1f}")
+        except RecursionError:
+            print(f"{'':<18}{'pickle':<10}{'RecursionError':>20}")
+        finally:
+            sys.setrecursionlimit(limit)
+        dumped = measure(structure.dump, path)[1]
+        loaded = measure(cls.load, path)[1]
+        size = os.path.getsize(path) / 2**20
+        print(f"{'':<18}{'snapshot':<10}{dumped:>10.3f}{loaded:>10.3f}{size:>10.1f}")
+        os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    benchmark(n)
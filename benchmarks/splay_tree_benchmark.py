@@ -0,0 +1,84 @@
+""" Benchmarking lookups in splay_tree_class.py against
+binary_search_tree_class.py on skewed and local access patterns.
+
+Both trees get the same random keys in the same order, then the same
+lookups: uniform, as a baseline, Zipfian, where a few hot keys take most
+lookups, a sequential scan, and a random walk over neighbouring keys.
+Reports time and the average depth of the looked up keys, which is what
+splaying reduces; each rotation costs several times more than a step down
+the tree in Python, so time only improves when depth drops enough.
+
+Usage:
+python -m benchmarks.splay_tree_benchmark [keys] [lookups] [zipf exponent]
+"""
+import itertools
+import random
+import sys
+import time
+from data_structures.trees.binary_search_trees.binary_search_tree_class import BinarySearchTree
+from data_structures.trees.binary_search_trees.splay_tree_class import SplayTree
+
+
+def workloads(keys, m, s):
+    """ Returns a dictionary of lookup sequences of length m by name.
+    """
+    n = len(keys)
+    ordered = sorted(keys)
+    hot = random.sample(keys, n)  # hot keys are scattered over the key space
+    weights = itertools.accumulate(1 / rank**s for rank in range(1, n + 1))
+    start = random.randrange(n)
+    walk, i = [], random.randrange(n)
+    for j in range(m):
+        i = min(max(i + random.randint(-8, 8), 0), n - 1)
+        walk.append(ordered[i])
+    return {
+        "uniform": [random.choice(keys) for i in range(m)],
+        "zipfian": random.choices(hot, cum_weights=list(weights), k=m),
+        "sequential": [ordered[(start + i) % n] for i in range(m)],
+        "local walk": walk,
+    }
+
+
+def depth(tree, key):
+    """ Returns depth of a key in the tree, the root is at depth 1.
+    """
+    d, curr = 1, tree.root
+    while curr.key != key:
+        curr = curr.right if key > curr.key else curr.left
+        d += 1
+    return d
+
+
+def build(cls, keys):
+    tree = cls()
+    for k in keys:
+        tree[k] = k
+    return tree
+
+
+def benchmark(n, m, s):
+    random.seed(0)
+    keys = random.sample(range(10**9), n)
+    print(f"{n} keys, {m} lookups, zipf exponent {s}")
+    print(f"{'workload':<12}{'BST, s':>10}{'splay, s':>10}{'BST depth':>11}{'splay depth':>13}")
+    for name, lookups in workloads(keys, m, s).items():
+        times, depths = [], []
+        for cls in (BinarySearchTree, SplayTree):
+            tree = build(cls, keys)
+            start = time.perf_counter()
+            for k in lookups:
+                assert tree[k] == k
+            times.append(time.perf_counter() - start)
+            tree, total = build(cls, keys), 0  # same lookups again, measuring depth
+            for k in lookups:
+                total += depth(tree, k)
+                tree[k]
+            depths.append(total / m)
+        print(f"{name:<12}{times[0]:>10.3f}{times[1]:>10.3f}{depths[0]:>11.1f}{depths[1]:>13.1f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**5
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 3 * 10**5
+    s = float(sys.argv[3]) if len(sys.argv) > 3 else 1.1
+    benchmark(n, m, s)
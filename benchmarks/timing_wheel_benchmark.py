@@ -0,0 +1,108 @@
+""" Benchmarking timing_wheel.py against MinHeap and heapq timer queues under
+a high cancel ratio, like timeouts that are mostly cancelled because the
+operation they guard completes in time.
+
+Every tick schedules a batch of timers, most of them cancelled a few ticks
+later, and expires the due ones. Heaps can't find a timer to remove it, so
+they cancel lazily: cancelled timers stay in the heap until they reach its
+top. Reports total time and the largest number of entries held, including
+cancelled ones. Every queue must expire exactly the same timers.
+
+Usage:
+python -m benchmarks.timing_wheel_benchmark [timers] [cancel ratio]
+"""
+import heapq
+import random
+import sys
+import time
+from data_structures.heaps.min_heap_class import MinHeap
+from data_structures.heaps.timing_wheel import TimingWheel
+
+PER_TICK = 100
+HORIZON = 10**4  # most deadlines are within that many ticks
+FAR = 10**6  # some are much further, beyond the wheel
+
+
+def events(n, cancel_ratio):
+    """ Returns a list per tick of scheduled timers (id, deadline) and a list
+    per tick of timers cancelled at that tick.
+    """
+    ticks = n // PER_TICK
+    scheduled = [[] for i in range(ticks)]
+    cancelled = [[] for i in range(ticks)]
+    for i in range(n):
+        tick = i // PER_TICK
+        deadline = tick + random.randint(1, FAR if random.random() < 0.01 else HORIZON)
+        scheduled[tick].append((i, deadline))
+        cancel = tick + random.randint(0, min(deadline - tick - 1, 100))
+        if random.random() < cancel_ratio and cancel < ticks:
+            cancelled[cancel].append(i)
+    return scheduled, cancelled
+
+
+def run_wheel(scheduled, cancelled):
+    wheel = TimingWheel(slots=256, levels=2)  # 65536 ticks, the rest overflow
+    timers, expired, peak = {}, [], 0
+    for tick in range(len(scheduled)):
+        for i, deadline in scheduled[tick]:
+            timers[i] = wheel.schedule(deadline, i)
+        for i in cancelled[tick]:
+            wheel.cancel(timers.pop(i))
+        expired.extend(wheel.advance(tick + 1))
+        peak = max(peak, wheel.in_wheel + wheel.overflow.size)
+    return expired, peak
+
+
+def run_min_heap(scheduled, cancelled):
+    heap, live, expired, peak = MinHeap(), set(), [], 0
+    for tick in range(len(scheduled)):
+        for i, deadline in scheduled[tick]:
+            heap.insert((deadline, i))
+            live.add(i)
+        for i in cancelled[tick]:
+            live.discard(i)
+        while not heap.empty() and heap.get_min()[0] <= tick + 1:
+            deadline, i = heap.pop_min()
+            if i in live:
+                live.discard(i)
+                expired.append(i)
+        peak = max(peak, heap.size)
+    return expired, peak
+
+
+def run_heapq(scheduled, cancelled):
+    heap, live, expired, peak = [], set(), [], 0
+    for tick in range(len(scheduled)):
+        for i, deadline in scheduled[tick]:
+            heapq.heappush(heap, (deadline, i))
+            live.add(i)
+        for i in cancelled[tick]:
+            live.discard(i)
+        while heap and heap[0][0] <= tick + 1:
+            deadline, i = heapq.heappop(heap)
+            if i in live:
+                live.discard(i)
+                expired.append(i)
+        peak = max(peak, len(heap))
+    return expired, peak
+
+
+def benchmark(n, cancel_ratio):
+    random.seed(0)
+    scheduled, cancelled = events(n, cancel_ratio)
+    print(f"{n} timers, {sum(map(len, cancelled))} cancelled, {len(scheduled)} ticks")
+    print(f"{'timer queue':<14}{'time, s':>10}{'peak entries':>14}")
+    expected = None
+    for name, run in (("TimingWheel", run_wheel), ("MinHeap", run_min_heap), ("heapq", run_heapq)):
+        start = time.perf_counter()
+        expired, peak = run(scheduled, cancelled)
+        elapsed = time.perf_counter() - start
+        assert expected is None or sorted(expired) == expected, f"{name} disagrees"
+        expected = sorted(expired)
+        print(f"{name:<14}{elapsed:>10.3f}{peak:>14}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    cancel_ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.9
+    benchmark(n, cancel_ratio)
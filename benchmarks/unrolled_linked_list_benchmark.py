@@ -0,0 +1,74 @@
+""" Benchmarking unrolled_linked_list.py against singly_linked_list_2.py and
+Python list: memory per element, building, iteration and find.
+
+Usage:
+python -m benchmarks.unrolled_linked_list_benchmark [n]
+"""
+import sys
+import time
+import tracemalloc
+from data_structures.linked_lists.singly_linked_list_2 import SinglyLinkedList
+from data_structures.linked_lists.unrolled_linked_list import UnrolledLinkedList
+
+
+def build_singly(n):
+    linked_list = SinglyLinkedList()
+    for i in range(n):
+        linked_list.push_back(i)
+    return linked_list
+
+
+def iter_singly(linked_list):
+    curr = linked_list.head
+    while curr:
+        yield curr.data
+        curr = curr.next_node
+
+
+def build_unrolled(n):
+    unrolled = UnrolledLinkedList()
+    for i in range(n):
+        unrolled.push_back(i)
+    return unrolled
+
+
+def measure_memory(build, n):
+    """ Returns number of bytes allocated per element by build(n), including
+    the int elements themselves, which cost the same for every structure.
+    """
+    tracemalloc.start()
+    structure = build(n)
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return size / n
+
+
+def measure_time(func, *args):
+    """ Returns time in seconds taken by func(*args).
+    """
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def benchmark(n):
+    candidates = [
+        ("SinglyLinkedList", build_singly, iter_singly, lambda s, x: s.find(x)),
+        ("UnrolledLinkedList", build_unrolled, iter, lambda s, x: s.find(x)),
+        ("list", lambda n: [i for i in range(n)], iter, lambda s, x: x in s),
+    ]
+    print(f"n = {n}")
+    print(f"{'structure':<20}{'bytes/elem':>12}{'build, s':>12}{'iterate, s':>12}{'find, s':>12}")
+    for name, build, iterate, find in candidates:
+        memory = measure_memory(build, n)
+        build_time = measure_time(build, n)
+        structure = build(n)
+        iter_time = measure_time(lambda: sum(1 for x in iterate(structure)))
+        find_time = measure_time(find, structure, -1)  # worst case, not present
+        print(f"{name:<20}{memory:>12.1f}{build_time:>12.4f}{iter_time:>12.4f}{find_time:>12.4f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    benchmark(n)
@@ -0,0 +1,82 @@
+""" Optional compiled build of the core data structures with mypyc.
+https://mypyc.readthedocs.io
+
+mypyc compiles the very same Python modules into C extension modules and
+places them next to the sources, in the data_structures package, with their
+shared runtime library in the repository root. Python's import system prefers
+an extension module to a .py file of the same name, so the compiled version
+is picked up automatically at import, with identical API, and the pure Python
+module is used whenever the extension is missing. Nothing has to be changed
+in the code that imports the structures.
+
+Building needs mypy (pip install mypy) and a C compiler. Compiled modules are
+specific to the Python version and platform they're built with. Interpreted
+classes can't inherit from compiled ones, so running a compiled module's file
+as a script, e.g. python -m data_structures.queues.deque_via_ring_buffer,
+fails while it's built.
+
+Usage:
+python build_compiled.py  # compiles the modules in-place
+python build_compiled.py --clean  # removes compiled modules, back to pure Python
+python -m benchmarks.compiled_benchmark  # speedup of every compiled module
+"""
+import glob
+import os
+import shutil
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# subpackage of data_structures: compiled modules
+COMPILED = {
+    "heaps": ["min_heap_func.py", "max_heap_func.py"],
+    "disjoint_sets": ["disjoint_set_class.py", "disjoint_set_array.py"],
+    # compiled classes can't be subclassed by interpreted ones, so the splay
+    # and interval trees and the deque are compiled together with the classes
+    # they extend
+    "trees.binary_search_trees": ["binary_search_tree_class.py", "splay_tree_class.py",
+                                  "interval_tree_class.py"],
+    "queues": ["queue_via_linked_list.py", "queue_via_stacks.py",
+               "queue_via_ring_buffer.py", "deque_via_ring_buffer.py",
+               "queue_via_stacks_realtime.py"],
+}
+
+
+def is_compiled(module):
+    """ Returns True if an imported module is a compiled extension module.
+    """
+    return not module.__file__.endswith(".py")
+
+
+def directory(subpackage):
+    """ Returns path of a subpackage of data_structures.
+    """
+    return os.path.join(ROOT, "data_structures", *subpackage.split("."))
+
+
+def build():
+    """ Compiles every module listed in COMPILED in-place, together, so they
+    share one runtime library.
+    """
+    paths = [os.path.join(directory(subpackage), module)
+             for subpackage, modules in COMPILED.items() for module in modules]
+    print(f"compiling {len(paths)} modules...")
+    subprocess.run([sys.executable, "-m", "mypyc", *paths], cwd=ROOT, check=True)
+
+
+def clean():
+    """ Removes compiled modules and build artifacts.
+    """
+    for path in [ROOT] + [directory(subpackage) for subpackage in COMPILED]:
+        for so in glob.glob(os.path.join(path, "*.so")) + glob.glob(os.path.join(path, "*.pyd")):
+            os.remove(so)
+    shutil.rmtree(os.path.join(ROOT, "build"), ignore_errors=True)
+    shutil.rmtree(os.path.join(ROOT, ".mypy_cache"), ignore_errors=True)
+
+
+if __name__ == "__main__":
+    if "--clean" in sys.argv[1:]:
+        clean()
+    else:
+        build()
@@ -0,0 +1,51 @@
+""" Data structures in pure Python.
+
+Every structure is importable from the top-level package, or from its
+subpackage, and loaded lazily: importing the package, or one structure from
+it, doesn't import the modules of the other structures. Where a subpackage
+has several implementations of one structure, e.g. queues, the name refers
+to the default one, the others are imported from their modules.
+
+Usage:
+from data_structures import MinHeap, BinarySearchTree
+from data_structures.queues import Queue
+from data_structures.queues.queue_via_stacks import Queue
+"""
+from ._lazy import attach
+
+__version__ = "0.1.0"
+
+__getattr__, __dir__, __all__ = attach(__name__, globals(), {
+    "DisjointSet": "disjoint_sets.disjoint_set_class",
+    "SpanningForest": "disjoint_sets.kruskal",
+    "MinHeap": "heaps.min_heap_class",
+    "MaxHeap": "heaps.max_heap_class",
+    "MinMaxHeap": "heaps.min_max_heap_class",
+    "RadixHeap": "heaps.radix_heap_class",
+    "TimingWheel": "heaps.timing_wheel",
+    "heapsort": "heaps.heap_sort",
+    "SinglyLinkedList": "linked_lists.singly_linked_list_2",
+    "DoublyLinkedList": "linked_lists.doubly_linked_list",
+    "UnrolledLinkedList": "linked_lists.unrolled_linked_list",
+    "SkipList": "linked_lists.skip_list",
+    "LRUCache": "linked_lists.caches",
+    "LFUCache": "linked_lists.caches",
+    "memoize": "linked_lists.caches",
+    "Queue": "queues.queue_via_ring_buffer",
+    "Deque": "queues.deque_via_ring_buffer",
+    "BoundedQueue": "queues.bounded_queue",
+    "AsyncBoundedQueue": "queues.async_bounded_queue",
+    "SharedMemoryQueue": "queues.shared_memory_queue",
+    "SlidingWindowMin": "queues.sliding_window",
+    "SlidingWindowMax": "queues.sliding_window",
+    "TimeWindowMin": "queues.sliding_window",
+    "TimeWindowMax": "queues.sliding_window",
+    "Stack": "stacks.stack_via_array",
+    "AggregateStack": "stacks.aggregate_stack",
+    "MinMaxSumStack": "stacks.aggregate_stack",
+    "AggregateQueue": "stacks.aggregate_stack",
+    "BinarySearchTree": "trees.binary_search_trees.binary_search_tree_class",
+    "SplayTree": "trees.binary_search_trees.splay_tree_class",
+    "ConcurrentBinarySearchTree": "trees.binary_search_trees.concurrent_tree_class",
+    "IntervalTree": "trees.binary_search_trees.interval_tree_class",
+})
@@ -0,0 +1,45 @@
+""" Lazy attribute loading for the packages of data_structures, PEP 562.
+https://peps.python.org/pep-0562/
+
+Importing a package imports none of its modules. A module is imported the
+first time one of its names, or the module itself, is accessed as an
+attribute of the package, and the result is cached in the package namespace,
+so only the first access goes through __getattr__. Importing one structure
+doesn't load the others.
+
+Usage:
+__getattr__, __dir__, __all__ = attach(__name__, globals(), {
+    "MinHeap": "min_heap_class",  # name: module, relative to the package
+})
+"""
+import importlib
+
+
+def attach(package, namespace, exports):
+    """ Returns __getattr__, __dir__ and __all__ for a package, given its
+    name, globals() and a mapping of exported names to the modules, relative
+    to the package, they're defined in. Submodules and subpackages are
+    available as attributes as well.
+    """
+    def __getattr__(name):
+        if name.startswith("_"):
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        if name in exports:
+            value = getattr(importlib.import_module(f"{package}.{exports[name]}"), name)
+        else:
+            try:
+                value = importlib.import_module(f"{package}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise  # missing dependency of an existing module
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        import pkgutil  # imports typing, too slow for package import time
+        modules = (m.name for m in pkgutil.iter_modules(namespace["__path__"])
+                   if not m.name.startswith("_"))
+        return sorted(set(namespace) | set(exports) | set(modules))
+
+    return __getattr__, __dir__, list(exports)
@@ -0,0 +1,14 @@
+""" Disjoint sets, a.k.a. union-find: a class over arbitrary elements, an
+array-based class over integers 0..n-1, functions over dicts, and Kruskal's
+minimum spanning tree on top of them.
+
+Usage:
+from data_structures.disjoint_sets import DisjointSet  # disjoint_set_class.py
+from data_structures.disjoint_sets.disjoint_set_array import DisjointSet
+"""
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, globals(), {
+    "DisjointSet": "disjoint_set_class",
+    "SpanningForest": "kruskal",
+})
@@ -0,0 +1,116 @@
+""" Implementing Disjoint Set data structure on top of two flat arrays.
+https://en.wikipedia.org/wiki/Disjoint-set_data_structure
+
+Elements are integers 0..n-1, so instead of a Node object or a dictionary entry
+per element we keep one slot in the parent array and one slot in the rank
+array. Both find and union are iterative, so there's no recursion limit even
+for very long parent chains.
+
+Usage:
+ds = DisjointSet(n)  # creates n singleton sets 0, 1, ..., n-1
+ds.make_set()  # creates a new singleton set, returns its element
+ds.find(x)  # returns parent of a set x
+ds.union(x, y)  # creates a union of a set x and a set y, returns True if merged
+ds.connected(x, y)  # checks if x and y are in the same set
+ds.components  # current number of disjoint sets
+ds.dump(path)  # writes parent and rank arrays to a snapshot file
+ds = DisjointSet.load(path)  # reads them back mapped from the file, without copying
+
+Time complexity for find and union operations is O(lg(n)), with union by rank
+and path compression it's practically O(1).
+"""
+from .. import snapshot
+
+
+class DisjointSet:
+    def __init__(self, n=0):
+        self.parent = list(range(n))  # parent[x]: parent of element x
+        self.rank = [0] * n  # rank[x]: upper bound on height of x's subtree
+        self.components = n  # number of disjoint sets
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self.parent)})"
+
+    def make_set(self):
+        """ Creates a new singleton set and returns its element.
+        Time complexity: O(1).
+        """
+        x = len(self.parent)
+        if not isinstance(self.parent, list):  # loaded from a snapshot
+            self.parent, self.rank = self.parent.tolist(), self.rank.tolist()
+        self.parent.append(x)
+        self.rank.append(0)
+        self.components += 1
+        return x
+
+    def find(self, x):
+        """ Returns parent of a set containing x. Compresses the path on the way
+        to the root. Time complexity: O(1).
+        """
+        parent = self.parent
+        root = x
+        while parent[root] != root:  # find the root
+            root = parent[root]
+        while parent[x] != root:  # compress path, point every node to the root
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, x, y):
+        """ Merges sets containing x and y. Returns True if sets were merged,
+        False if x and y were already in the same set. Time complexity: O(1).
+        """
+        root1 = self.find(x)
+        root2 = self.find(y)
+        if root1 == root2:  # already in the same set, do nothing
+            return False
+        rank = self.rank
+        # attach set with the lower rank to set with higher rank
+        if rank[root1] > rank[root2]:
+            self.parent[root2] = root1
+        elif rank[root2] > rank[root1]:
+            self.parent[root1] = root2
+        else:  # ranks are equal
+            rank[root1] += 1
+            self.parent[root2] = root1
+        self.components -= 1
+        return True
+
+    def connected(self, x, y):
+        """ Returns True if x and y are in the same set, False otherwise.
+        """
+        return self.find(x) == self.find(y)
+
+    def dump(self, path):
+        """ Writes parent and rank arrays to a snapshot file, see snapshot.py.
+        Time complexity: O(n).
+        """
+        snapshot.dump(path, self.__class__.__name__,
+                      [("q", self.parent), ("B", self.rank), ("q", [self.components])])
+
+    @classmethod
+    def load(cls, path):
+        """ Returns disjoint sets read from a snapshot file written by dump.
+        Parent and rank arrays aren't copied, they're mapped from the file,
+        find and union work on them in place, make_set copies them into lists.
+        Time complexity: O(1).
+        """
+        ds = cls()
+        ds.parent, ds.rank, components = snapshot.load(path, cls.__name__)
+        ds.components = components[0]
+        return ds
+
+
+if __name__ == "__main__":
+    ds = DisjointSet(5)
+    print(f"disjoint sets: {ds.parent}, components: {ds.components}")
+
+    x, y = 1, 3
+    print(f"Merging sets {x} and {y}...")
+    ds.union(x, y)
+    print(f"Parent of set {x} is {ds.find(x)}")
+    print(f"Parent of set {y} is {ds.find(y)}")
+    print(f"Are {x} and {y} connected? {ds.connected(x, y)}")
+    print(f"disjoint sets: {ds.parent}, components: {ds.components}")
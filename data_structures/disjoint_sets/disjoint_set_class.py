@@ -7,7 +7,10 @@ Usage:
 make_set(x)  # creates an empty set containing x
 find(x)  # returns parent of a set x
 union(x, y)  # creates a union of a set x and a set y
+dump(path)  # writes elements, parent and rank arrays to a snapshot file
+DisjointSet.load(path)  # reads them back
 """
+from .. import snapshot
 
 
 class Node:
@@ -67,3 +70,31 @@ class DisjointSet:
         else:  # parent2.rank == parent1.rank
             parent1.rank += 1
             parent2.parent = parent1
+
+    def dump(self, path):
+        """ Writes the sets to a snapshot file as flat arrays: elements, index
+        of every element's parent and ranks, see snapshot.py.
+        Time complexity: O(n).
+        """
+        elements = list(self.nodes)
+        index = {data: i for i, data in enumerate(elements)}
+        nodes = self.nodes.values()
+        snapshot.dump(path, self.__class__.__name__, [
+            (snapshot.typecode(elements), elements),
+            ("q", [index[node.parent.data] for node in nodes]),
+            ("B", [node.rank for node in nodes]),
+        ])
+
+    @classmethod
+    def load(cls, path):
+        """ Returns disjoint sets read from a snapshot file written by dump.
+        Time complexity: O(n).
+        """
+        ds = cls()
+        elements, parents, ranks = snapshot.load(path, cls.__name__)
+        nodes = [Node(data) for data in elements]
+        for node, parent, rank in zip(nodes, parents, ranks):
+            node.parent = nodes[parent]
+            node.rank = rank
+        ds.nodes = dict(zip(elements, nodes))
+        return ds
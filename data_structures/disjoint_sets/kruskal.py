@@ -0,0 +1,253 @@
+""" Kruskal's minimum spanning forest algorithm and incremental connectivity
+built on the array-backed Disjoint Set.
+https://en.wikipedia.org/wiki/Kruskal%27s_algorithm
+
+Edges are (u, v, weight) tuples, vertices can be any hashable objects. Every
+vertex gets an integer element in disjoint_set_array.DisjointSet, so all
+find/union calls go through flat parent and rank arrays.
+
+Edges don't have to fit into memory: sorted_edges reads them in chunks, sorts
+every chunk and spills it to a temporary file, then lazily merges the sorted
+runs. If the whole input fits into a single chunk, edges are ordered lazily
+with a heap, so stopping early pays only for the edges actually popped.
+
+Usage:
+forest = kruskal(edges)  # minimum spanning forest of an iterable of edges
+forest = kruskal(read_edges(path), num_vertices=n)  # stops once forest is a tree
+forest.add_edge(u, v, w)  # adds an edge to the graph, keeps the forest minimal
+forest.connected(u, v)  # checks if u and v are in the same tree
+forest.components  # number of trees in the forest
+forest.weight  # total weight of the forest
+forest.edges()  # yields (u, v, weight) edges of the forest
+"""
+import heapq
+import os
+import pickle
+import tempfile
+from itertools import islice
+from operator import itemgetter
+
+from .disjoint_set_array import DisjointSet
+
+
+WEIGHT = itemgetter(2)  # sort key of an (u, v, weight) edge
+
+
+class SpanningForest:
+    """ Minimum spanning forest of a graph that grows edge by edge.
+    """
+
+    def __init__(self):
+        self.index = dict()  # vertex: its element in the disjoint set
+        self.vertices = []  # element: vertex
+        self.sets = DisjointSet()
+        self.adjacency = []  # element: dictionary neighbour element -> weight
+        self.weight = 0  # total weight of the forest
+        self.size = 0  # number of edges in the forest
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(vertices={len(self.vertices)}, "
+                f"edges={self.size}, weight={self.weight})")
+
+    @property
+    def components(self):
+        """ Number of trees in the forest.
+        """
+        return self.sets.components
+
+    def element(self, vertex):
+        """ Returns element of a vertex in the disjoint set, adds the vertex to
+        the forest as a new tree if it's not there yet. Time complexity: O(1).
+        """
+        x = self.index.get(vertex)
+        if x is None:
+            x = self.sets.make_set()
+            self.index[vertex] = x
+            self.vertices.append(vertex)
+            self.adjacency.append(dict())
+        return x
+
+    def add_vertex(self, vertex):
+        """ Adds a vertex to the forest as a new tree, does nothing if the
+        vertex is already present. Time complexity: O(1).
+        """
+        self.element(vertex)
+
+    def connected(self, u, v):
+        """ Returns True if u and v are in the same tree, False otherwise.
+        Time complexity: O(1).
+        """
+        if u not in self.index or v not in self.index:
+            return u == v
+        return self.sets.connected(self.index[u], self.index[v])
+
+    def link(self, x, y, weight):
+        """ Adds an edge between elements x and y to the forest.
+        Method shouldn't be used directly.
+        """
+        self.adjacency[x][y] = weight
+        self.adjacency[y][x] = weight
+        self.weight += weight
+        self.size += 1
+
+    def cut(self, x, y):
+        """ Removes an edge between elements x and y from the forest.
+        Method shouldn't be used directly.
+        """
+        weight = self.adjacency[x].pop(y)
+        del self.adjacency[y][x]
+        self.weight -= weight
+        self.size -= 1
+
+    def add_edge(self, u, v, weight):
+        """ Adds an edge to the graph while keeping the forest minimal. If u and
+        v are in different trees the edge joins them. Otherwise the edge closes
+        a cycle and replaces the heaviest edge on the tree path from u to v if
+        it's lighter. Returns True if the forest has changed.
+        Time complexity: O(1) if the edge joins two trees, O(n) otherwise.
+        """
+        x = self.element(u)
+        y = self.element(v)
+        if x == y:  # self-loop never belongs to the forest
+            return False
+        if self.sets.union(x, y):  # edge joins two trees
+            self.link(x, y, weight)
+            return True
+        a, b, heaviest = self.heaviest_on_path(x, y)
+        if weight >= heaviest:  # edge is the heaviest one on the cycle
+            return False
+        # trees don't change, so the disjoint set stays valid
+        self.cut(a, b)
+        self.link(x, y, weight)
+        return True
+
+    def heaviest_on_path(self, x, y):
+        """ Returns (a, b, weight) of the heaviest edge on the tree path between
+        connected elements x and y. Time complexity: O(n).
+        """
+        adjacency = self.adjacency
+        prev = {x: x}  # element: previous element on the path from x
+        stack = [x]
+        while stack:  # iterative depth first search from x till y
+            curr = stack.pop()
+            if curr == y:
+                break
+            for nxt in adjacency[curr]:
+                if nxt not in prev:
+                    prev[nxt] = curr
+                    stack.append(nxt)
+
+        edge, heaviest = None, None
+        curr = y
+        while curr != x:  # walk the path back from y to x
+            before = prev[curr]
+            weight = adjacency[before][curr]
+            if heaviest is None or weight > heaviest:
+                edge, heaviest = (before, curr), weight
+            curr = before
+        return edge[0], edge[1], heaviest
+
+    def edges(self):
+        """ Yields (u, v, weight) edges of the forest.
+        """
+        vertices = self.vertices
+        for x, neighbours in enumerate(self.adjacency):
+            for y, weight in neighbours.items():
+                if x < y:  # every edge is stored twice, yield it once
+                    yield vertices[x], vertices[y], weight
+
+
+def read_edges(path, vertex_type=int, weight_type=float):
+    """ Lazily yields (u, v, weight) edges from a text file with one
+    "u v weight" edge per line. Empty lines and lines starting with # are skipped.
+    """
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            u, v, weight = fields
+            yield vertex_type(u), vertex_type(v), weight_type(weight)
+
+
+def _read_run(path):
+    """ Yields edges of a sorted run spilled to disk by sorted_edges.
+    """
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def sorted_edges(edges, chunk_size=10**6):
+    """ Yields edges in non-decreasing order of weight, keeps at most chunk_size
+    edges in memory. Time complexity: O(m * lg(m)), m is a number of edges.
+    """
+    edges = iter(edges)
+    chunk = list(islice(edges, chunk_size))
+    if len(chunk) < chunk_size:  # the whole input fits into a single chunk
+        heap = [(edge[2], i, edge) for i, edge in enumerate(chunk)]
+        heapq.heapify(heap)  # O(m) time, edges are popped only when needed
+        while heap:
+            yield heapq.heappop(heap)[2]
+        return
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        runs = []
+        while chunk:  # sort every chunk and spill it to disk
+            chunk.sort(key=WEIGHT)
+            path = os.path.join(tmpdir, f"run{len(runs)}")
+            with open(path, "wb") as f:
+                for edge in chunk:
+                    pickle.dump(edge, f, pickle.HIGHEST_PROTOCOL)
+            runs.append(path)
+            chunk = list(islice(edges, chunk_size))
+
+        readers = [_read_run(path) for path in runs]
+        try:
+            yield from heapq.merge(*readers, key=WEIGHT)
+        finally:
+            for reader in readers:  # close files before the directory is removed
+                reader.close()
+
+
+def kruskal(edges, num_vertices=None, chunk_size=10**6):
+    """ Returns minimum spanning forest of a graph given by an iterable of
+    (u, v, weight) edges. If num_vertices is given, stops as soon as the forest
+    becomes a single spanning tree. Time complexity: O(m * lg(m)).
+    """
+    forest = SpanningForest()
+    union = forest.sets.union
+    element = forest.element
+    last = None if num_vertices is None else num_vertices - 1
+    for u, v, weight in sorted_edges(edges, chunk_size):
+        if forest.size == last:  # a single component remains
+            break
+        x = element(u)
+        y = element(v)
+        # edges come in weight order, so an edge within a tree is never useful
+        if union(x, y):
+            forest.link(x, y, weight)
+    return forest
+
+
+if __name__ == "__main__":
+    edges = [("a", "b", 4), ("a", "h", 8), ("b", "h", 11), ("b", "c", 8),
+             ("h", "i", 7), ("h", "g", 1), ("i", "g", 6), ("i", "c", 2),
+             ("c", "f", 4), ("c", "d", 7), ("g", "f", 2), ("d", "f", 14),
+             ("d", "e", 9), ("f", "e", 10)]
+    forest = kruskal(edges, num_vertices=9)
+    print(f"minimum spanning tree: {sorted(forest.edges(), key=WEIGHT)}")
+    print(f"total weight: {forest.weight}")
+    assert forest.weight == 37  # self-check
+
+    forest = SpanningForest()
+    for u, v, weight in edges:
+        forest.add_edge(u, v, weight)
+    print(f"incrementally built tree weight: {forest.weight}")
+    assert forest.weight == 37  # self-check
@@ -0,0 +1,88 @@
+""" Testing kruskal.py.
+"""
+import random
+from data_structures.disjoint_sets.kruskal import SpanningForest, kruskal, sorted_edges
+
+
+def random_edges(n, m):
+    """ Returns a list of m random (u, v, weight) edges over n vertices.
+    """
+    return [(random.randrange(n), random.randrange(n), random.randrange(1, 100))
+            for i in range(m)]
+
+
+def prim_weight(n, edges):
+    """ Returns total weight of minimum spanning forest found by a naive O(n * m)
+    Prim's algorithm, used as a reference.
+    """
+    total = 0
+    seen = set()
+    for start in range(n):
+        if start in seen:
+            continue
+        seen.add(start)
+        while True:
+            best = None
+            for u, v, w in edges:
+                if (u in seen) != (v in seen) and (best is None or w < best[2]):
+                    best = (u, v, w)
+            if best is None:
+                break
+            total += best[2]
+            seen.add(best[0] if best[1] in seen else best[1])
+    return total
+
+
+def sorted_edges_test():
+    """ Tests that sorted_edges orders edges both in memory and through spilled runs.
+    """
+    edges = random_edges(50, 1000)
+    for chunk_size in (10**4, 1000, 64, 1):
+        weights = [w for u, v, w in sorted_edges(edges, chunk_size)]
+        assert weights == sorted(w for u, v, w in edges)
+    print("<<< sorted_edges test is good >>>")
+
+
+def kruskal_test():
+    """ Tests kruskal against a naive Prim's algorithm.
+    """
+    for i in range(20):
+        n = random.randrange(1, 30)
+        edges = random_edges(n, random.randrange(0, 80))
+        forest = kruskal(edges, chunk_size=16)
+        assert forest.weight == prim_weight(n, edges)
+        assert len(forest) == len(list(forest.edges()))
+    print("<<< kruskal test is good >>>")
+
+
+def early_stop_test():
+    """ Tests that kruskal stops once the forest is a single tree.
+    """
+    n = 100
+    edges = [(i, i + 1, 1) for i in range(n - 1)] + [(0, n - 1, 2), (n + 5, n + 6, 3)]
+    forest = kruskal(edges, num_vertices=n)
+    assert forest.components == 1 and forest.weight == n - 1
+    assert not forest.connected(n + 5, n + 6)  # was never read
+    print("<<< early stop test is good >>>")
+
+
+def add_edge_test():
+    """ Tests that incremental add_edge keeps the forest minimal.
+    """
+    for i in range(20):
+        n = random.randrange(1, 30)
+        edges = random_edges(n, random.randrange(0, 80))
+        forest = SpanningForest()
+        for k, (u, v, w) in enumerate(edges):
+            forest.add_edge(u, v, w)
+            assert forest.weight == prim_weight(n, edges[:k + 1])
+        for u, v, w in edges:
+            assert forest.connected(u, v)
+    print("<<< add_edge test is good >>>")
+
+
+if __name__ == "__main__":
+    sorted_edges_test()
+    kruskal_test()
+    early_stop_test()
+    add_edge_test()
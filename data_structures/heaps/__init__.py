@@ -0,0 +1,18 @@
+""" Heaps: binary min, max and min-max heap classes, min and max heaps as
+functions over plain lists, heap sort, a radix heap for monotone
+integer keys, and a hierarchical timing wheel for timers.
+
+Usage:
+from data_structures.heaps import MinHeap
+from data_structures.heaps import min_heap_func
+"""
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, globals(), {
+    "MinHeap": "min_heap_class",
+    "MaxHeap": "max_heap_class",
+    "MinMaxHeap": "min_max_heap_class",
+    "RadixHeap": "radix_heap_class",
+    "TimingWheel": "timing_wheel",
+    "heapsort": "heap_sort",
+})
@@ -3,7 +3,7 @@ and has O(n * lg(n)) running time in the worst case.
 https://en.wikipedia.org/wiki/Heapsort
 """
 import random
-import max_heap_func as mh
+from . import max_heap_func as mh
 
 
 def heapsort(array):
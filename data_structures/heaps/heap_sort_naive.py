@@ -1,7 +1,7 @@
 """ Naive implementation of heap sort algorithm using Min Heap data structure.
 """
 import random
-from min_heap_class import MinHeap
+from .min_heap_class import MinHeap
 
 
 def heap_sort_naive(array):
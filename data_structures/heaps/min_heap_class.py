@@ -10,6 +10,8 @@ All operations take at most O(lg(n)) time, where n is number of nodes:
 6) h.build_heap()  # erases current heap and creates a new one from iterable
 7) h.remove(i)  # removes an element at index i
 8) h.set_value(i, new)  # sets value of element at index i to new
+9) h.dump(path)  # writes the heap to a snapshot file, O(n)
+10) h = MinHeap.load(path)  # reads the heap back, maps numbers from the file
 
 Very good and detailed explanation videos on heaps and priority queues:
 https://www.coursera.org/learn/data-structures week 3
@@ -17,6 +19,7 @@ https://www.coursera.org/learn/data-structures week 3
 Following is based on this implementation:
 https://runestone.academy/runestone/static/pythonds/Trees/BinaryHeapImplementation.html
 """
+from .. import snapshot
 
 
 class MinHeap:
@@ -68,6 +71,7 @@ class MinHeap:
     def insert(self, x):
         """ Adds an element x to the the heap. Time complexity: O(lg(n)).
         """
+        self._thaw()
         self.heaplist.append(x)  # append it to the end of the heap
         self.size += 1  # adjust size of the heap
         self.sift_up(self.size)  # self.size is a current index of x
@@ -85,6 +89,7 @@ class MinHeap:
         """
         if self.empty():
             raise Exception("Cannot pop an element from an empty heap.")
+        self._thaw()
 
         removed = self.heaplist[1]  # save the minimum element
         self.heaplist[1] = self.heaplist[self.size]  # put the last element at the root
@@ -94,14 +99,22 @@ class MinHeap:
         return removed
 
     def remove(self, i):
-        """ Removes an element at position i. Time complexity: O(lg(n)).
+        """ Removes an element at position i and returns it. The last element
+        takes its place and is sifted up or down, so it works for any
+        comparable elements, e.g. tuples. Time complexity: O(lg(n)).
         """
         if i < 1 or i > self.size:
             raise Exception(f"Element at index {i} doesn't exist.")
+        self._thaw()
 
-        self.heaplist[i] = float("-inf")
-        self.sift_up(i)  # sift removed node up to the root
-        self.pop_max()  # remove it from the heap
+        removed = self.heaplist[i]
+        last = self.heaplist.pop()  # actually remove the last element from array
+        self.size -= 1
+        if i <= self.size:  # removed element wasn't the last one
+            self.heaplist[i] = last
+            self.sift_up(i)
+            self.sift_down(i)
+        return removed
 
     def set_value(self, i, new):
         """ Changes an element at index i to new while maintaining heap order
@@ -109,6 +122,7 @@ class MinHeap:
         """
         if i < 1 or i > self.size:
             raise Exception(f"Element at index {i} doesn't exist.")
+        self._thaw()
 
         if new > self.heaplist[i]:
             self.heaplist[i] = new
@@ -128,6 +142,32 @@ class MinHeap:
             self.sift_down(i)
             i -= 1
 
+    def _thaw(self):
+        """ Copies heaplist loaded from a snapshot, a memoryview of fixed size
+        mapped from the file, into a list before the heap changes.
+        Time complexity: O(n) once, O(1) afterwards.
+        """
+        if not isinstance(self.heaplist, list):
+            self.heaplist = self.heaplist.tolist()
+
+    def dump(self, path):
+        """ Writes the heap to a snapshot file, heaplist as one raw array if
+        it's numbers, see snapshot.py. Time complexity: O(n).
+        """
+        code = snapshot.typecode(self.heaplist, start=1)  # 0th is a placeholder
+        snapshot.dump(path, self.__class__.__name__, [(code, self.heaplist)])
+
+    @classmethod
+    def load(cls, path):
+        """ Returns a heap read from a snapshot file written by dump. A heap of
+        numbers isn't copied, its heaplist is mapped from the file until the
+        heap changes. Time complexity: O(1) for numbers, O(n) otherwise.
+        """
+        heap = cls()
+        [heap.heaplist] = snapshot.load(path, cls.__name__)
+        heap.size = len(heap.heaplist) - 1
+        return heap
+
 
 if __name__ == "__main__":
     minheap = MinHeap()
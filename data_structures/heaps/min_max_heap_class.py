@@ -0,0 +1,208 @@
+""" Implementing min-max heap, a.k.a. double-ended priority queue.
+https://en.wikipedia.org/wiki/Min-max_heap
+
+One array holds both orders: levels alternate between min levels, starting
+with the root, and max levels. An element on a min level is less than or
+equal to every element below it, an element on a max level is greater than
+or equal to every element below it. So the minimum is the root and the
+maximum is one of its children. Compared to a MinHeap and a MaxHeap side by
+side, every element is stored and inserted once, and either end can be
+removed without deleting it from the other heap.
+
+Same API as MinHeap and MaxHeap, except that both ends are available:
+1) h = MinMaxHeap()  # initializes an empty min-max heap
+2) h.empty()  # checks if heap is empty
+3) h.insert(x)  # inserts element x into the heap, O(lg(n))
+4) h.get_min(), h.get_max()  # return current minimum or maximum element, O(1)
+5) h.pop_min(), h.pop_max()  # remove minimum or maximum element and return it, O(lg(n))
+6) h.build_heap(seq)  # erases current heap and creates a new one from a list, O(n)
+
+Keeping the best n elements out of a stream:
+h.insert(x)
+if h.size > n:
+    h.pop_min()
+"""
+
+
+def is_min_level(i):
+    """ Returns True if index i is on a min level: levels 0, 2, 4... have an
+    odd number of bits in their indexes. Time complexity: O(1).
+    """
+    return i.bit_length() & 1 == 1
+
+
+class MinMaxHeap:
+    def __init__(self):
+        self.heaplist = [0]  # 0 is for convenience, the root is at index 1
+        self.size = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.heaplist})"
+
+    def empty(self):
+        """ Returns True if heap is empty, False otherwise. Time complexity: O(1).
+        """
+        return self.size == 0
+
+    def swap(self, i, j):
+        self.heaplist[i], self.heaplist[j] = self.heaplist[j], self.heaplist[i]
+
+    def sift_up(self, i):
+        """ Sifts an element at index i up the heap until min-max heap order
+        property is restored. Time complexity: O(lg(n)).
+        """
+        if i == 1:
+            return
+        heaplist, parent = self.heaplist, i // 2
+        if is_min_level(i):
+            if heaplist[i] > heaplist[parent]:  # belongs to max levels above
+                self.swap(i, parent)
+                self.sift_up_max(parent)
+            else:
+                self.sift_up_min(i)
+        else:
+            if heaplist[i] < heaplist[parent]:  # belongs to min levels above
+                self.swap(i, parent)
+                self.sift_up_min(parent)
+            else:
+                self.sift_up_max(i)
+
+    def sift_up_min(self, i):
+        """ Sifts an element at index i up the min levels, jumping to the
+        grandparent each time. Time complexity: O(lg(n)).
+        """
+        heaplist = self.heaplist
+        while i // 4 > 0 and heaplist[i] < heaplist[i // 4]:
+            self.swap(i, i // 4)
+            i //= 4
+
+    def sift_up_max(self, i):
+        """ Sifts an element at index i up the max levels, jumping to the
+        grandparent each time. Time complexity: O(lg(n)).
+        """
+        heaplist = self.heaplist
+        while i // 4 > 0 and heaplist[i] > heaplist[i // 4]:
+            self.swap(i, i // 4)
+            i //= 4
+
+    def extreme_descendant_index(self, i, smaller):
+        """ Returns an index of the minimum, or the maximum if smaller is
+        False, of children and grandchildren of element at index i.
+        Time complexity: O(1).
+        """
+        heaplist = self.heaplist
+        best = 2 * i
+        for j in (2 * i + 1, 4 * i, 4 * i + 1, 4 * i + 2, 4 * i + 3):
+            if j > self.size:
+                break
+            if (heaplist[j] < heaplist[best]) if smaller else (heaplist[j] > heaplist[best]):
+                best = j
+        return best
+
+    def sift_down(self, i):
+        """ Sifts an element at index i down the heap until min-max heap order
+        property is restored. Time complexity: O(lg(n)).
+        """
+        smaller = is_min_level(i)
+        heaplist = self.heaplist
+        while 2 * i <= self.size:  # while there're still some children below
+            m = self.extreme_descendant_index(i, smaller)
+            if not ((heaplist[m] < heaplist[i]) if smaller else (heaplist[m] > heaplist[i])):
+                return  # order is restored
+            self.swap(i, m)
+            if m < 4 * i:  # a child, there's nothing below it to fix
+                return
+            # a grandchild, it might now be out of order with its parent
+            if (heaplist[m] > heaplist[m // 2]) if smaller else (heaplist[m] < heaplist[m // 2]):
+                self.swap(m, m // 2)
+            i = m
+
+    def insert(self, x):
+        """ Adds an element x to the heap. Time complexity: O(lg(n)).
+        """
+        self.heaplist.append(x)
+        self.size += 1
+        self.sift_up(self.size)
+
+    def get_min(self):
+        """ Returns minimum element from the heap. Time complexity: O(1).
+        """
+        if self.empty():
+            return
+        return self.heaplist[1]
+
+    def max_index(self):
+        """ Returns an index of the maximum element: the root if it's alone,
+        otherwise the larger of its children. Time complexity: O(1).
+        """
+        if self.size == 1:
+            return 1
+        if self.size == 2 or self.heaplist[2] >= self.heaplist[3]:
+            return 2
+        return 3
+
+    def get_max(self):
+        """ Returns maximum element from the heap. Time complexity: O(1).
+        """
+        if self.empty():
+            return
+        return self.heaplist[self.max_index()]
+
+    def pop_at(self, i):
+        """ Removes an element at index i, fills its place with the last
+        element and returns it. Time complexity: O(lg(n)).
+        """
+        removed = self.heaplist[i]
+        last = self.heaplist.pop()
+        self.size -= 1
+        if i <= self.size:
+            self.heaplist[i] = last
+            self.sift_down(i)
+        return removed
+
+    def pop_min(self):
+        """ Pops(deletes) minimum element from the heap.
+        Returns popped element. Time complexity: O(lg(n)).
+        """
+        if self.empty():
+            raise Exception("Cannot pop an element from an empty heap.")
+        return self.pop_at(1)
+
+    def pop_max(self):
+        """ Pops(deletes) maximum element from the heap.
+        Returns popped element. Time complexity: O(lg(n)).
+        """
+        if self.empty():
+            raise Exception("Cannot pop an element from an empty heap.")
+        return self.pop_at(self.max_index())
+
+    def build_heap(self, seq):
+        """ Builds min-max heap from an iterable. Erases current heap.
+        Time complexity: O(n).
+        """
+        self.size = len(seq)
+        self.heaplist = [0] + seq[:]  # O(n) space
+        i = len(seq) // 2
+        while i > 0:
+            self.sift_down(i)
+            i -= 1
+
+
+if __name__ == "__main__":
+    import random
+
+    heap = MinMaxHeap()
+    heap.build_heap([5, 1, 9, 3, 7])
+    print(heap)
+    print(f"min: {heap.get_min()}, max: {heap.get_max()}")
+    heap.insert(0)
+    heap.insert(10)
+    print(f"popping min...{heap.pop_min()}, popping max...{heap.pop_max()}")
+    print(f"min: {heap.get_min()}, max: {heap.get_max()}")
+
+    best = MinMaxHeap()  # keeps the 5 largest numbers out of a stream
+    for x in random.sample(range(100), 50):
+        best.insert(x)
+        if best.size > 5:
+            best.pop_min()
+    print(f"5 largest: {sorted(best.heaplist[1:])}, largest: {best.get_max()}")
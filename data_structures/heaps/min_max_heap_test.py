@@ -0,0 +1,77 @@
+""" Testing min_max_heap_class.py.
+"""
+import random
+from data_structures.heaps.min_max_heap_class import MinMaxHeap, is_min_level
+
+
+def order_is_valid(heap):
+    """ Returns True if every element on a min level is <= every element
+    below it and every element on a max level is >= every element below it.
+    """
+    heaplist = heap.heaplist
+    assert len(heaplist) == heap.size + 1
+    for i in range(2, heap.size + 1):
+        j = i // 2
+        while j > 0:  # every ancestor
+            if is_min_level(j):
+                assert heaplist[j] <= heaplist[i]
+            else:
+                assert heaplist[j] >= heaplist[i]
+            j //= 2
+    return True
+
+
+def random_operations_test():
+    """ Tests MinMaxHeap against a sorted list with random inserts and pops
+    at both ends, with many equal elements.
+    """
+    heap, reference = MinMaxHeap(), []
+    for i in range(3000):
+        operation = random.random()
+        if operation < 0.5 or not reference:
+            x = random.randrange(100)
+            heap.insert(x)
+            reference.append(x)
+            reference.sort()
+        elif operation < 0.75:
+            assert heap.pop_min() == reference.pop(0)
+        else:
+            assert heap.pop_max() == reference.pop()
+        assert heap.size == len(reference)
+        if reference:
+            assert heap.get_min() == reference[0] and heap.get_max() == reference[-1]
+        if i % 100 == 0:
+            assert order_is_valid(heap)
+    print("<<< random operations test is good >>>")
+
+
+def build_heap_test():
+    """ Tests build_heap, then pops alternating between both ends.
+    """
+    for n in (0, 1, 2, 3, 10, 1000):
+        data = [random.randrange(n + 1) for i in range(n)]
+        heap = MinMaxHeap()
+        heap.build_heap(data)
+        assert order_is_valid(heap)
+        data.sort()
+        popped_min, popped_max = [], []
+        while not heap.empty():
+            popped_min.append(heap.pop_min())
+            if not heap.empty():
+                popped_max.append(heap.pop_max())
+        assert popped_min + popped_max[::-1] == data
+    heap = MinMaxHeap()
+    assert heap.get_min() is None and heap.get_max() is None
+    for pop in (heap.pop_min, heap.pop_max):
+        try:
+            pop()
+            flag = True
+        except Exception:
+            flag = False
+        assert not flag
+    print("<<< build heap test is good >>>")
+
+
+if __name__ == "__main__":
+    random_operations_test()
+    build_heap_test()
@@ -0,0 +1,169 @@
+""" Implementing radix heap, a monotone priority queue of non-negative
+integer keys.
+https://en.wikipedia.org/wiki/Radix_heap
+
+Works when keys never go below the last popped minimum, which is the case
+for distances in Dijkstra's shortest paths. Elements are kept in buckets by
+the highest bit in which their key differs from the last popped key, so
+instead of comparison-based sifting each element moves only to lower
+buckets, at most once per bit of the keys: O(lg(C)) amortized per element,
+where C is the largest key.
+
+Every element is a key and an item, items are hashable and unique, like
+vertices of a graph, which lets decrease_key find them.
+
+Usage:
+h = RadixHeap()  # initializes an empty radix heap
+h.empty()  # checks if heap is empty
+h.insert(key, item)  # inserts item with integer key >= last popped key, O(1)
+h.get_min()  # returns (key, item) with the minimum key, None if heap is empty
+h.pop_min()  # removes (key, item) with the minimum key and returns it, O(lg(C)) amortized
+h.decrease_key(item, key)  # lowers key of an item in the heap, O(1)
+item in h  # checks if item is in the heap
+"""
+
+
+class RadixHeap:
+    def __init__(self):
+        self.buckets = [[]]  # buckets[b]: entries whose key differs from last in bit b - 1
+        self.entries = dict()  # item: its current entry, [key, item]
+        self.last = 0  # last popped key, no key can be lower
+        self.size = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={self.size}, last={self.last})"
+
+    def __contains__(self, item):
+        return item in self.entries
+
+    def empty(self):
+        """ Returns True if heap is empty, False otherwise. Time complexity: O(1).
+        """
+        return self.size == 0
+
+    def bucket(self, key):
+        """ Returns index of the bucket for key: 0 for the last popped key,
+        otherwise 1 + position of the highest bit differing from it.
+        Time complexity: O(1).
+        """
+        return (key ^ self.last).bit_length()
+
+    def _push(self, entry):
+        """ Adds entry to its bucket, creating buckets as keys grow.
+        """
+        b = self.bucket(entry[0])
+        while b >= len(self.buckets):
+            self.buckets.append([])
+        self.buckets[b].append(entry)
+
+    def insert(self, key, item):
+        """ Adds item with an integer key to the heap. Raises an exception if
+        key is below the last popped key or item is already in the heap.
+        Time complexity: O(1).
+        """
+        if key < self.last:
+            raise Exception(f"Key {key} is less than the last popped key {self.last}.")
+        if item in self.entries:
+            raise Exception(f"Item {item} is already in the heap, use decrease_key.")
+        entry = [key, item]
+        self.entries[item] = entry
+        self._push(entry)
+        self.size += 1
+
+    def decrease_key(self, item, key):
+        """ Lowers key of an item in the heap. If the item changes bucket, the
+        old entry is left behind as stale and skipped later.
+        Time complexity: O(1).
+        """
+        entry = self.entries[item]
+        if key > entry[0]:
+            raise Exception(f"New key {key} is greater than current key {entry[0]}.")
+        if key < self.last:
+            raise Exception(f"Key {key} is less than the last popped key {self.last}.")
+        if self.bucket(key) == self.bucket(entry[0]):
+            entry[0] = key  # stays in the same bucket
+            return
+        entry = [key, item]
+        self.entries[item] = entry
+        self._push(entry)
+
+    def _refill(self):
+        """ Makes sure bucket 0 holds the minimum: finds the lowest non-empty
+        bucket, makes its minimum key the last key and redistributes the
+        bucket, every entry lands in a lower one. Drops stale entries.
+        Time complexity: O(lg(C)) amortized.
+        """
+        entries, buckets = self.entries, self.buckets
+        for b in range(1, len(buckets)):
+            live = [e for e in buckets[b] if entries.get(e[1]) is e]
+            buckets[b] = []
+            if live:
+                self.last = min(e[0] for e in live)
+                for entry in live:
+                    buckets[(entry[0] ^ self.last).bit_length()].append(entry)
+                return
+
+    def _live_min(self):
+        """ Returns a live entry with the minimum key from the end of bucket 0,
+        refilling it first if needed, dropping stale entries on the way.
+        """
+        bucket, entries = self.buckets[0], self.entries
+        while True:
+            while bucket:
+                entry = bucket[-1]
+                if entries.get(entry[1]) is entry:
+                    return entry
+                bucket.pop()  # stale, its item was popped or its key decreased
+            self._refill()
+
+    def get_min(self):
+        """ Returns (key, item) with the minimum key without removing it, None if
+        heap is empty. Unlike pop_min it doesn't redistribute buckets, so the
+        last popped key stays the lowest key that can be inserted, and returns
+        the same item pop_min would pop. Drops stale entries on the way.
+        Time complexity: O(lg(C) + k), k is size of the lowest non-empty bucket.
+        """
+        if self.empty():
+            return
+        entries = self.entries
+        for bucket in self.buckets:
+            live = [e for e in bucket if entries.get(e[1]) is e]
+            bucket[:] = live
+            if live:  # pop_min takes the last entry with the minimum key
+                key, item = min(reversed(live), key=lambda e: e[0])
+                return key, item
+
+    def pop_min(self):
+        """ Pops(deletes) the item with the minimum key from the heap.
+        Returns (key, item). Time complexity: O(lg(C)) amortized.
+        """
+        if self.empty():
+            raise Exception("Cannot pop an element from an empty heap.")
+        bucket, entries = self.buckets[0], self.entries
+        while bucket:  # fast path, the minimum is already in bucket 0
+            key, item = entry = bucket.pop()
+            if entries.get(item) is entry:
+                break
+        else:
+            key, item = self._live_min()
+            bucket.pop()
+        del entries[item]
+        self.size -= 1
+        return key, item
+
+
+if __name__ == "__main__":
+    heap = RadixHeap()
+    for key, item in [(7, "a"), (3, "b"), (12, "c"), (3, "d")]:
+        print(f"inserting...{item} with key {key}")
+        heap.insert(key, item)
+    print(f"What's the current min? {heap.get_min()}")
+    print(f"popping min element...{heap.pop_min()}")
+    heap.decrease_key("c", 4)
+    print("decreasing key of c to 4")
+    while not heap.empty():
+        print(f"popping min element...{heap.pop_min()}")
+    try:
+        heap.insert(1, "e")
+    except Exception as e:
+        print(e)
@@ -0,0 +1,86 @@
+""" Testing radix_heap_class.py.
+"""
+import random
+from data_structures.heaps.radix_heap_class import RadixHeap
+
+
+def random_operations_test():
+    """ Tests RadixHeap against a dictionary of current keys with random
+    monotone inserts, decrease_key and pops. Items with equal keys can be
+    popped in any order, so popped keys are checked against the minimum.
+    """
+    heap, keys = RadixHeap(), dict()  # item: its current key
+    last, item = 0, 0
+    for i in range(5000):
+        operation = random.random()
+        if operation < 0.45 or not keys:
+            key = last + random.choice((0, random.randrange(16), random.randrange(10**6)))
+            heap.insert(key, item)
+            keys[item] = key
+            item += 1
+        elif operation < 0.7:
+            j = random.choice(list(keys))
+            key = random.randint(last, keys[j])
+            heap.decrease_key(j, key)
+            keys[j] = key
+        elif operation < 0.85:  # peeking doesn't change what can be inserted
+            key, j = heap.get_min()
+            assert key == min(keys.values()) == keys[j]
+        else:
+            expected = min(keys.values())
+            key, j = heap.pop_min()
+            assert key == expected == keys.pop(j)
+            last = key
+        assert heap.size == len(keys) and all(j in heap for j in list(keys)[:5])
+    while keys:
+        key, j = heap.pop_min()
+        assert key == min(keys.values()) == keys.pop(j)
+    assert heap.empty() and heap.get_min() is None
+    print("<<< random operations test is good >>>")
+
+
+def peek_then_insert_test():
+    """ Tests that get_min doesn't raise the lowest key that can be inserted
+    above the last popped key, like Dijkstra peeking before relaxing edges,
+    and that pop_min pops the item get_min returned.
+    """
+    heap = RadixHeap()
+    heap.insert(0, "s")
+    heap.insert(10, "a")
+    assert heap.pop_min() == (0, "s")
+    assert heap.get_min() == (10, "a")
+    heap.insert(5, "b")
+    heap.decrease_key("a", 3)
+    assert heap.get_min() == (3, "a") and heap.pop_min() == (3, "a")
+    for key in (7, 7, 4):
+        heap.insert(key, ("c", len(heap.entries)))
+    while not heap.empty():
+        assert heap.get_min() == heap.get_min() == heap.pop_min()
+    print("<<< peek then insert test is good >>>")
+
+
+def errors_test():
+    """ Tests that keys below the last popped one, duplicate items and
+    increasing keys are rejected.
+    """
+    heap = RadixHeap()
+    heap.insert(5, "a")
+    heap.insert(9, "b")
+    assert heap.pop_min() == (5, "a")
+    for operation in (lambda: heap.insert(4, "c"), lambda: heap.insert(10, "b"),
+                      lambda: heap.decrease_key("b", 11), lambda: heap.decrease_key("b", 4),
+                      lambda: RadixHeap().pop_min()):
+        try:
+            operation()
+            flag = True
+        except Exception:
+            flag = False
+        assert not flag
+    assert heap.pop_min() == (9, "b") and "b" not in heap
+    print("<<< errors test is good >>>")
+
+
+if __name__ == "__main__":
+    random_operations_test()
+    peek_then_insert_test()
+    errors_test()
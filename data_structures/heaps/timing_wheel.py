@@ -0,0 +1,172 @@
+""" Implementing hierarchical timing wheel, a scheduler for millions of timers
+that are mostly cancelled before they expire, like timeouts.
+http://www.cs.columbia.edu/~nahum/w6998/papers/sosp87-timing-wheels.pdf
+
+Time is counted in integer ticks. Level 0 of the wheel has one bucket per
+tick, every next level has buckets slots times wider, so levels levels cover
+slots**levels ticks ahead. A timer goes into the bucket of the lowest level
+whose bucket holds only its deadline's range, when time reaches the start
+of a coarse bucket its timers are cascaded down into finer ones, and timers
+in the level 0 bucket of the current tick expire. Deadlines beyond the
+wheel go into a MinHeap and are moved into the wheel once they're in range.
+
+Schedule and cancel are O(1), instead of O(lg(n)) sifting a heap: buckets
+are dictionaries, so a timer is removed from its bucket directly. Timers in
+the overflow heap are cancelled lazily, they're dropped when they reach the
+top of the heap.
+
+Usage:
+wheel = TimingWheel(slots=256, levels=3, now=0)  # covers 256**3 ticks ahead
+timer = wheel.schedule(deadline, item)  # deadline in ticks, O(1)
+wheel.cancel(timer)  # returns False if timer already expired or was cancelled, O(1)
+wheel.advance(now)  # moves time forward, returns items of expired timers tick by tick
+wheel.tick()  # same as wheel.advance(wheel.now + 1)
+len(wheel)  # number of scheduled timers
+"""
+from itertools import count
+from .min_heap_class import MinHeap
+
+OVERFLOW = object()  # bucket of timers in the overflow heap
+
+
+class Timer:
+    __slots__ = ("deadline", "item", "bucket")
+
+    def __init__(self, deadline, item):
+        self.deadline = deadline
+        self.item = item
+        self.bucket = None  # dictionary it's in, OVERFLOW, or None when it's done
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.deadline}, {self.item})"
+
+
+class TimingWheel:
+    def __init__(self, slots=256, levels=3, now=0):
+        if slots < 2 or slots & (slots - 1):
+            raise Exception("Number of slots must be a power of 2.")
+        self.bits = slots.bit_length() - 1  # bits of a tick per level
+        self.mask = slots - 1
+        self.levels = levels
+        self.wheel = [[dict() for i in range(slots)] for j in range(levels)]
+        self.overflow = MinHeap()  # (deadline, sequence number, timer)
+        self.sequence = count()  # breaks ties between equal deadlines in the heap
+        self.now = now
+        self.size = 0  # scheduled timers
+        self.in_wheel = 0  # scheduled timers in the wheel, not in the overflow heap
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(now={self.now}, size={self.size})"
+
+    def _place(self, timer, deadline):
+        """ Puts timer into the bucket for deadline relative to the current
+        time, or into the overflow heap if it's beyond the wheel.
+        Time complexity: O(1) for the wheel, O(lg(n)) for the overflow heap.
+        """
+        level = max((deadline ^ self.now).bit_length() - 1, 0) // self.bits
+        if level >= self.levels:
+            timer.bucket = OVERFLOW
+            self.overflow.insert((deadline, next(self.sequence), timer))
+            return
+        bucket = self.wheel[level][(deadline >> (self.bits * level)) & self.mask]
+        bucket[timer] = None
+        timer.bucket = bucket
+        self.in_wheel += 1
+
+    def schedule(self, deadline, item):
+        """ Schedules item to expire at tick deadline, returns a timer that can
+        be cancelled. Time complexity: O(1).
+        """
+        timer = Timer(deadline, item)
+        self._place(timer, max(deadline, self.now + 1))  # overdue ones expire on the next tick
+        self.size += 1
+        return timer
+
+    def cancel(self, timer):
+        """ Cancels a scheduled timer. Returns True if it was cancelled, False
+        if it has already expired or been cancelled. Time complexity: O(1).
+        """
+        if timer.bucket is None:
+            return False
+        if timer.bucket is OVERFLOW:  # dropped when it gets to the top of the heap
+            timer.bucket = None
+        else:
+            del timer.bucket[timer]
+            timer.bucket = None
+            self.in_wheel -= 1
+        self.size -= 1
+        return True
+
+    def _cascade(self, level):
+        """ Moves timers of the current bucket of a level down into finer
+        levels. Time complexity: O(k), k is number of timers moved.
+        """
+        bucket = self.wheel[level][(self.now >> (self.bits * level)) & self.mask]
+        timers = list(bucket)
+        bucket.clear()
+        self.in_wheel -= len(timers)
+        for timer in timers:
+            self._place(timer, max(timer.deadline, self.now))
+
+    def _pull_overflow(self):
+        """ Moves timers from the overflow heap that are now within the wheel's
+        range into the wheel, drops cancelled ones.
+        """
+        end = ((self.now >> (self.bits * self.levels)) + 1) << (self.bits * self.levels)
+        overflow = self.overflow
+        while not overflow.empty() and overflow.get_min()[0] < end:
+            deadline, sequence, timer = overflow.pop_min()
+            if timer.bucket is OVERFLOW:  # not cancelled
+                self._place(timer, deadline)
+
+    def advance(self, now):
+        """ Moves current time forward to tick now, expiring every timer with
+        deadline <= now. Returns their items in order of the ticks they expire
+        at, overdue timers expire at the tick after they're scheduled. Empty
+        stretches of time are skipped. Time complexity: O(t + k), t is number
+        of ticks with timers in the wheel, k is number of timers moved.
+        """
+        expired = []
+        span = self.bits * self.levels  # bits of a tick covered by the wheel
+        while self.now < now:
+            if not self.in_wheel:  # skip to the next overflow range or to now
+                next_range = ((self.now >> span) + 1) << span
+                if self.overflow.empty() or next_range > now:
+                    self.now = now
+                    break
+                self.now = next_range - 1
+            self.now += 1
+            if self.now & ((1 << span) - 1) == 0:
+                self._pull_overflow()
+            for level in range(self.levels - 1, 0, -1):  # coarse buckets first
+                if self.now & ((1 << (self.bits * level)) - 1) == 0:
+                    self._cascade(level)
+            bucket = self.wheel[0][self.now & self.mask]
+            if bucket:
+                for timer in bucket:
+                    timer.bucket = None
+                    expired.append(timer.item)
+                self.in_wheel -= len(bucket)
+                self.size -= len(bucket)
+                bucket.clear()
+        return expired
+
+    def tick(self):
+        """ Moves current time one tick forward, returns items of expired timers.
+        """
+        return self.advance(self.now + 1)
+
+
+if __name__ == "__main__":
+    wheel = TimingWheel(slots=8, levels=2)  # covers 64 ticks, later ones overflow
+    timers = {name: wheel.schedule(deadline, name)
+              for name, deadline in [("a", 3), ("b", 10), ("c", 10), ("d", 70), ("e", 500)]}
+    print(f"scheduled: {wheel}")
+    print(f"cancelling c...{wheel.cancel(timers['c'])}")
+    print(f"cancelling e...{wheel.cancel(timers['e'])}")
+    for now in (5, 20, 100, 1000):
+        print(f"advancing to {now}...expired {wheel.advance(now)}")
+    print(wheel)
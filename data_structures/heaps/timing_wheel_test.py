@@ -0,0 +1,71 @@
+""" Testing timing_wheel.py.
+"""
+import heapq
+import random
+from data_structures.heaps.timing_wheel import TimingWheel
+
+
+def random_operations_test():
+    """ Tests TimingWheel against a heapq timer queue with random schedules,
+    cancels and advances. The wheel covers only 16 ticks, so most timers are
+    cascaded down from level 1 or pulled in from the overflow heap.
+    """
+    for trial in range(20):
+        wheel = TimingWheel(slots=4, levels=2, now=random.randrange(100))
+        heap, live, timers, due = [], set(), dict(), dict()
+        for i in range(2000):
+            operation = random.random()
+            if operation < 0.5:
+                deadline = wheel.now + random.randint(-5, 200 if random.random() < 0.3 else 20)
+                timers[i] = wheel.schedule(deadline, i)
+                due[i] = max(deadline, wheel.now + 1)  # overdue ones expire on the next tick
+                heapq.heappush(heap, (due[i], i))
+                live.add(i)
+            elif operation < 0.75 and timers:
+                j = random.choice(list(timers))
+                assert wheel.cancel(timers[j]) == (j in live)
+                live.discard(j)
+            else:
+                now = wheel.now + random.choice((0, 1, 1, random.randrange(100)))
+                expired = wheel.tick() if now == wheel.now + 1 else wheel.advance(now)
+                expected = []
+                while heap and heap[0][0] <= now:
+                    j = heapq.heappop(heap)[1]
+                    if j in live:
+                        live.discard(j)
+                        expected.append(j)
+                assert sorted(expired) == sorted(expected)
+                assert [due[j] for j in expired] == sorted(due[j] for j in expired)
+                assert wheel.now == now
+            assert len(wheel) == len(live)
+        assert sorted(wheel.advance(wheel.now + 10**4)) == sorted(live)
+        assert len(wheel) == 0 and wheel.in_wheel == 0
+    print("<<< random operations test is good >>>")
+
+
+def overflow_cancel_test():
+    """ Tests that timers cancelled in the overflow heap never expire and
+    that cancel returns False for expired and cancelled timers.
+    """
+    wheel = TimingWheel(slots=8, levels=2)  # covers 64 ticks
+    far = [wheel.schedule(1000 + k, k) for k in range(10)]
+    near = wheel.schedule(5, "near")
+    assert wheel.in_wheel == 1 and len(wheel) == 11
+    for timer in far[::2]:
+        assert wheel.cancel(timer)
+        assert not wheel.cancel(timer)
+    assert wheel.advance(999) == ["near"] and not wheel.cancel(near)
+    assert wheel.advance(2000) == [1, 3, 5, 7, 9]
+    assert len(wheel) == 0 and wheel.overflow.empty()
+    try:
+        TimingWheel(slots=6)
+        flag = True
+    except Exception:
+        flag = False
+    assert not flag
+    print("<<< overflow and cancel test is good >>>")
+
+
+if __name__ == "__main__":
+    random_operations_test()
+    overflow_cancel_test()
@@ -0,0 +1,368 @@
+""" Opt-in instrumentation of the core structures: drop-in subclasses with the
+same API that count the work every operation does and optionally time it.
+
+The structures themselves aren't changed, so stats cost nothing unless an
+instrumented class is used, switching the import turns them on. Counting
+versions of the hot methods take the same steps as the originals.
+
+Counters:
+MinHeap, MaxHeap  comparisons, swaps
+BinarySearchTree  comparisons, nodes_visited, max_depth (deepest node reached)
+DisjointSet, ArrayDisjointSet  hops (links followed to a root), compressions (links re-pointed)
+Queue, Deque  resizes, moves (elements copied by resizes)
+
+If timer is given, it's called as timer(operation, seconds) after every
+public operation, e.g. Histogram collects durations per operation.
+
+Instrumented classes subclass the pure Python ones. Interpreted classes
+can't inherit from compiled ones, so while the modules are built with
+build_compiled.py, the .py sources of the structures are loaded next to the
+compiled modules and subclassed instead.
+
+Usage:
+from data_structures.instrumented import MinHeap, Histogram
+histogram = Histogram()
+h = MinHeap(timer=histogram)  # the same arguments as the original, plus timer
+h.stats()  # {"comparisons": 120, "swaps": 31}, a snapshot of the counters
+h.reset_stats()
+histogram.percentile("pop_min", 99)  # seconds
+"""
+import functools
+import importlib
+import importlib.util
+import os
+import sys
+import time
+
+
+def _pure(package, *names):
+    """ Returns pure Python versions of modules of a package, in the order of
+    names. A module built with build_compiled.py is loaded from its .py file
+    as {package}._pure_{name}, and relative imports of it by the modules after
+    it get that version too, the others are imported as usual.
+    """
+    modules, replaced = [], {}
+    try:
+        for name in names:
+            full_name = f"{package}.{name}"
+            origin = importlib.util.find_spec(full_name).origin
+            if origin.endswith(".py"):
+                modules.append(importlib.import_module(full_name))
+                continue
+            path = os.path.join(os.path.dirname(origin), name + ".py")
+            spec = importlib.util.spec_from_file_location(f"{package}._pure_{name}", path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[spec.name] = module
+            spec.loader.exec_module(module)
+            replaced[full_name] = sys.modules.get(full_name)
+            sys.modules[full_name] = module
+            modules.append(module)
+    finally:
+        for full_name, module in replaced.items():
+            if module is None:
+                del sys.modules[full_name]
+            else:
+                sys.modules[full_name] = module
+    return modules
+
+
+disjoint_set_array, disjoint_set_class = _pure(
+    "data_structures.disjoint_sets", "disjoint_set_array", "disjoint_set_class")
+max_heap_class, min_heap_class = _pure("data_structures.heaps", "max_heap_class", "min_heap_class")
+queue_via_ring_buffer, deque_via_ring_buffer = _pure(
+    "data_structures.queues", "queue_via_ring_buffer", "deque_via_ring_buffer")
+binary_search_tree_class, = _pure(
+    "data_structures.trees.binary_search_trees", "binary_search_tree_class")
+
+
+def _timed(operation, method):
+    """ Returns method calling self.timer(operation, seconds) after each call.
+    Timed operations called by another one, e.g. enqueue by push_back or find
+    by union, aren't timed separately, only the outermost call is.
+    """
+    @functools.wraps(method)
+    def timed(self, *args, **kwargs):
+        if self.timer is None or self.timing:
+            return method(self, *args, **kwargs)
+        self.timing = True
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.timing = False
+            self.timer(operation, time.perf_counter() - start)
+    return timed
+
+
+class Instrumented:
+    """ Mixin with counters and timing for an instrumented structure. Subclasses
+    list their counters in COUNTERS and public operations to time in TIMED.
+    """
+    COUNTERS = ()
+    TIMED = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for operation in cls.TIMED:
+            setattr(cls, operation, _timed(operation, getattr(cls, operation)))
+
+    def __init__(self, *args, timer=None, **kwargs):
+        self.timer = timer
+        self.timing = False  # True while a timed operation runs
+        self.reset_stats()
+        super().__init__(*args, **kwargs)
+
+    def stats(self):
+        """ Returns a dictionary with the current counters.
+        """
+        return {name: getattr(self, name) for name in self.COUNTERS}
+
+    def reset_stats(self):
+        """ Sets all counters to zero.
+        """
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+
+
+class MinHeap(Instrumented, min_heap_class.MinHeap):
+    COUNTERS = ("comparisons", "swaps")
+    TIMED = ("insert", "pop_min", "remove", "set_value", "build_heap")
+
+    def sift_up(self, i):
+        heaplist = self.heaplist
+        while i // 2 > 0:
+            self.comparisons += 1
+            if not heaplist[i // 2] > heaplist[i]:
+                break
+            heaplist[i // 2], heaplist[i] = heaplist[i], heaplist[i // 2]
+            self.swaps += 1
+            i //= 2
+
+    def min_child_index(self, i):
+        if 2 * i + 1 > self.size:
+            return 2 * i
+        self.comparisons += 1
+        if self.heaplist[2 * i] < self.heaplist[2 * i + 1]:
+            return 2 * i
+        return 2 * i + 1
+
+    def sift_down(self, i):
+        heaplist = self.heaplist
+        while 2 * i <= self.size:
+            min_index = self.min_child_index(i)
+            self.comparisons += 1
+            if heaplist[i] > heaplist[min_index]:
+                heaplist[i], heaplist[min_index] = heaplist[min_index], heaplist[i]
+                self.swaps += 1
+            i = min_index
+
+
+class MaxHeap(Instrumented, max_heap_class.MaxHeap):
+    COUNTERS = ("comparisons", "swaps")
+    TIMED = ("insert", "pop_max", "remove", "set_value", "build_heap")
+
+    def sift_up(self, i):
+        heaplist = self.heaplist
+        while i // 2 > 0:
+            self.comparisons += 1
+            if not heaplist[i // 2] < heaplist[i]:
+                break
+            heaplist[i // 2], heaplist[i] = heaplist[i], heaplist[i // 2]
+            self.swaps += 1
+            i //= 2
+
+    def max_child_index(self, i):
+        if 2 * i + 1 > self.size:
+            return 2 * i
+        self.comparisons += 1
+        if self.heaplist[2 * i] > self.heaplist[2 * i + 1]:
+            return 2 * i
+        return 2 * i + 1
+
+    def sift_down(self, i):
+        heaplist = self.heaplist
+        while 2 * i <= self.size:
+            max_index = self.max_child_index(i)
+            self.comparisons += 1
+            if heaplist[i] < heaplist[max_index]:
+                heaplist[i], heaplist[max_index] = heaplist[max_index], heaplist[i]
+                self.swaps += 1
+            i = max_index
+
+
+class BinarySearchTree(Instrumented, binary_search_tree_class.BinarySearchTree):
+    COUNTERS = ("comparisons", "nodes_visited", "max_depth")
+    TIMED = ("put", "get", "delete")
+
+    def _visit(self, depth):
+        """ Counts a node visited at the given depth, the root is at depth 1.
+        """
+        self.nodes_visited += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def put(self, key, val):
+        if not self.root:  # the new node is the root
+            self.max_depth = max(self.max_depth, 1)
+        super().put(key, val)
+
+    def _get(self, key, curr):
+        depth = 0
+        while curr:
+            depth += 1
+            self._visit(depth)
+            self.comparisons += 1
+            if key == curr.key:
+                return curr
+            self.comparisons += 1
+            curr = curr.right if key > curr.key else curr.left
+        return None
+
+    def _put(self, key, val, curr):
+        depth = 1
+        while True:
+            self._visit(depth)
+            self.comparisons += 1
+            if key == curr.key:
+                curr.val = val
+                return False
+            self.comparisons += 1
+            if key < curr.key:
+                if not curr.left:
+                    curr.left = binary_search_tree_class.TreeNode(key=key, val=val, parent=curr)
+                    break
+                curr = curr.left
+            else:
+                if not curr.right:
+                    curr.right = binary_search_tree_class.TreeNode(key=key, val=val, parent=curr)
+                    break
+                curr = curr.right
+            depth += 1
+        self.max_depth = max(self.max_depth, depth + 1)  # depth of the new node
+        return True
+
+
+class DisjointSet(Instrumented, disjoint_set_class.DisjointSet):
+    COUNTERS = ("hops", "compressions")
+    TIMED = ("make_set", "find", "union")
+
+    def find_parent(self, node):
+        """ Same as the original, but iterative, deep chains don't hit the
+        recursion limit while they're measured.
+        """
+        root = node
+        while root.parent != root:
+            root = root.parent
+            self.hops += 1
+        while node.parent != root:
+            node.parent, node = root, node.parent
+            self.compressions += 1
+        return root
+
+
+class ArrayDisjointSet(Instrumented, disjoint_set_array.DisjointSet):
+    COUNTERS = ("hops", "compressions")
+    TIMED = ("make_set", "find", "union")
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+            self.hops += 1
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+            self.compressions += 1
+        return root
+
+
+class _Resizes:
+    """ Counts resizes of the ring buffer and elements they move.
+    """
+    COUNTERS = ("resizes", "moves")
+
+    def _resize(self, capacity):
+        self.resizes += 1
+        self.moves += self.size
+        super()._resize(capacity)
+
+
+class Queue(Instrumented, _Resizes, queue_via_ring_buffer.Queue):
+    COUNTERS = _Resizes.COUNTERS
+    TIMED = ("enqueue", "dequeue", "enqueue_many", "dequeue_many")
+
+
+class Deque(Instrumented, _Resizes, deque_via_ring_buffer.Deque):
+    COUNTERS = _Resizes.COUNTERS
+    TIMED = ("enqueue", "dequeue", "enqueue_many", "dequeue_many",
+             "push_front", "push_back", "pop_front", "pop_back")
+
+
+class Histogram:
+    """ Timer callback collecting durations of every operation in buckets of
+    powers of two nanoseconds: bucket b holds durations in [2**(b-1), 2**b).
+    """
+
+    def __init__(self):
+        self.buckets = {}  # operation: {bucket: count}
+
+    def __call__(self, operation, seconds):
+        bucket = int(seconds * 1e9).bit_length()
+        counts = self.buckets.setdefault(operation, {})
+        counts[bucket] = counts.get(bucket, 0) + 1
+
+    def __repr__(self):
+        lines = [f"{self.__class__.__name__}("]
+        for operation in sorted(self.buckets):
+            lines.append(f"  {operation}: n={self.count(operation)}, "
+                         f"p50<={self.percentile(operation, 50) * 1e6:.2f}us, "
+                         f"p99<={self.percentile(operation, 99) * 1e6:.2f}us")
+        return "\n".join(lines + [")"])
+
+    def count(self, operation):
+        """ Returns number of timed calls of an operation.
+        """
+        return sum(self.buckets.get(operation, {}).values())
+
+    def percentile(self, operation, q):
+        """ Returns upper bound in seconds of the bucket holding the q-th
+        percentile of durations of an operation, 0 if it wasn't called.
+        """
+        counts = self.buckets.get(operation, {})
+        rank = q / 100 * sum(counts.values())
+        seen = 0
+        for bucket in sorted(counts):
+            seen += counts[bucket]
+            if seen >= rank:
+                return 2**bucket / 1e9
+        return 0
+
+
+if __name__ == "__main__":
+    import random
+
+    histogram = Histogram()
+    heap = MinHeap(timer=histogram)
+    for n in range(1000):
+        heap.insert(random.random())
+    print(f"after 1000 inserts: {heap.stats()}")
+    heap.reset_stats()
+    while not heap.empty():
+        heap.pop_min()
+    print(f"after 1000 pops: {heap.stats()}")
+
+    bst = BinarySearchTree(timer=histogram)
+    for key in random.sample(range(10**6), 1000):
+        bst[key] = key
+    print(f"tree of 1000 random keys: {bst.stats()}")
+
+    ds = ArrayDisjointSet(1000, timer=histogram)
+    for n in range(1000):
+        ds.union(random.randrange(1000), random.randrange(1000))
+    print(f"1000 unions: {ds.stats()}")
+
+    q = Queue(timer=histogram)
+    q.enqueue_many(range(1000))
+    q.dequeue_many(1000)
+    print(f"1000 enqueues and dequeues: {q.stats()}")
+    print(histogram)
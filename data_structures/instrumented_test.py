@@ -0,0 +1,143 @@
+""" Testing instrumented.py.
+"""
+import random
+from data_structures import instrumented
+from data_structures.disjoint_sets import disjoint_set_array
+from data_structures.heaps import max_heap_class, min_heap_class
+from data_structures.trees.binary_search_trees import binary_search_tree_class
+
+
+def heap_test():
+    """ Tests that instrumented heaps behave as the originals and count work.
+    """
+    for cls, original, pop in ((instrumented.MinHeap, min_heap_class.MinHeap, "pop_min"),
+                               (instrumented.MaxHeap, max_heap_class.MaxHeap, "pop_max")):
+        heap, reference = cls(), original()
+        data = [random.randrange(1000) for i in range(1000)]
+        for x in data:
+            heap.insert(x)
+            reference.insert(x)
+        assert heap.heaplist == reference.heaplist
+        assert heap.stats()["comparisons"] >= heap.stats()["swaps"] > 0
+        assert [getattr(heap, pop)() for i in range(1000)] == \
+            [getattr(reference, pop)() for i in range(1000)]
+        heap.reset_stats()
+        assert heap.stats() == {"comparisons": 0, "swaps": 0}
+    heap = instrumented.MinHeap()
+    for x in range(100):  # already in heap order, nothing to swap
+        heap.insert(x)
+    assert heap.stats() == {"comparisons": 99, "swaps": 0}
+    print("<<< heap test is good >>>")
+
+
+def bst_test():
+    """ Tests depth and visit counts of the instrumented tree.
+    """
+    bst = instrumented.BinarySearchTree()
+    bst[0] = 0
+    assert bst.stats() == {"comparisons": 0, "nodes_visited": 0, "max_depth": 1}
+    bst = instrumented.BinarySearchTree()
+    for key in range(10):  # degenerate tree, a chain of 10 nodes
+        bst[key] = key
+    assert bst.stats()["max_depth"] == 10
+    assert bst.stats()["nodes_visited"] == sum(range(10))
+    bst.reset_stats()
+    assert bst[9] == 9 and bst.get(10) is None
+    assert bst.stats() == {"comparisons": 39, "nodes_visited": 20, "max_depth": 10}
+    reference = binary_search_tree_class.BinarySearchTree()
+    bst = instrumented.BinarySearchTree()
+    for key in random.sample(range(1000), 500):
+        bst[key] = reference[key] = str(key)
+    for key in random.sample(range(1000), 300):
+        assert bst.get(key) == reference.get(key)
+        if key in reference:
+            del bst[key]
+            del reference[key]
+    assert list(bst) == list(reference)
+    print("<<< bst test is good >>>")
+
+
+def disjoint_set_test():
+    """ Tests hops and compressions on a chain built by hand.
+    """
+    ds = instrumented.ArrayDisjointSet(5)
+    ds.parent = [0, 0, 1, 2, 3]  # 4 -> 3 -> 2 -> 1 -> 0
+    assert ds.find(4) == 0
+    assert ds.stats() == {"hops": 4, "compressions": 3}
+    assert ds.parent == [0, 0, 0, 0, 0]
+    n = 1000
+    ds, reference = instrumented.ArrayDisjointSet(n), disjoint_set_array.DisjointSet(n)
+    for i in range(n):
+        x, y = random.randrange(n), random.randrange(n)
+        assert ds.union(x, y) == reference.union(x, y)
+    assert ds.parent == reference.parent and ds.rank == reference.rank
+    elements = list("abcdefgh")
+    ds = instrumented.DisjointSet()
+    for x in elements:
+        ds.make_set(x)
+    for x, y in zip(elements, elements[1:]):
+        ds.union(x, y)
+    assert len({ds.find(x) for x in elements}) == 1
+    assert ds.stats()["hops"] > 0
+    print("<<< disjoint set test is good >>>")
+
+
+def timer_test():
+    """ Tests timer callback, resize counters and the histogram.
+    """
+    calls = []
+    q = instrumented.Queue(timer=lambda operation, seconds: calls.append(operation))
+    for i in range(64):
+        q.enqueue(i)
+    assert q.stats() == {"resizes": 3, "moves": 8 + 16 + 32}
+    assert [q.dequeue() for i in range(64)] == list(range(64))
+    assert calls == ["enqueue"] * 64 + ["dequeue"] * 64
+    deque = instrumented.Deque()
+    for i in range(9):
+        deque.push_front(i)
+    assert deque.stats()["resizes"] == 1 and deque.pop_back() == 0
+    histogram = instrumented.Histogram()
+    heap = instrumented.MinHeap(timer=histogram)
+    for i in range(100):
+        heap.insert(i)
+    assert histogram.count("insert") == 100 and histogram.count("pop_min") == 0
+    assert 0 < histogram.percentile("insert", 50) <= histogram.percentile("insert", 100)
+    assert histogram.percentile("pop_min", 50) == 0
+    print("<<< timer test is good >>>")
+
+
+def nested_timing_test():
+    """ Tests that operations calling other timed operations are recorded
+    once, as the outermost operation.
+    """
+    histogram = instrumented.Histogram()
+    deque = instrumented.Deque(timer=histogram)
+    for i in range(10):
+        deque.push_back(i)
+    for i in range(4):
+        deque.pop_front()
+    deque.enqueue(10)
+    assert {operation: histogram.count(operation) for operation in histogram.buckets} == \
+        {"push_back": 10, "pop_front": 4, "enqueue": 1}
+    histogram = instrumented.Histogram()
+    ds = instrumented.ArrayDisjointSet(10, timer=histogram)
+    for i in range(9):
+        ds.union(i, i + 1)
+    ds.find(0)
+    assert {operation: histogram.count(operation) for operation in histogram.buckets} == \
+        {"union": 9, "find": 1}
+    try:
+        ds.find(100)  # a failed operation is still timed, timing goes on after it
+    except Exception:
+        pass
+    ds.find(1)
+    assert histogram.count("find") == 3
+    print("<<< nested timing test is good >>>")
+
+
+if __name__ == "__main__":
+    heap_test()
+    bst_test()
+    disjoint_set_test()
+    timer_test()
+    nested_timing_test()
@@ -0,0 +1,18 @@
+""" Linked lists: singly, doubly and unrolled linked lists, a skip list
+ordered map, and LRU/LFU caches built on the doubly linked list.
+
+Usage:
+from data_structures.linked_lists import SinglyLinkedList  # singly_linked_list_2.py
+from data_structures.linked_lists.singly_linked_list_1 import SinglyLinkedList
+"""
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, globals(), {
+    "SinglyLinkedList": "singly_linked_list_2",
+    "DoublyLinkedList": "doubly_linked_list",
+    "UnrolledLinkedList": "unrolled_linked_list",
+    "SkipList": "skip_list",
+    "LRUCache": "caches",
+    "LFUCache": "caches",
+    "memoize": "caches",
+})
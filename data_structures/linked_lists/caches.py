@@ -0,0 +1,340 @@
+""" Bounded LRU and LFU caches built on the Doubly Linked List.
+https://en.wikipedia.org/wiki/Cache_replacement_policies
+
+Both caches keep a dictionary from key to a node of a doubly linked list, so
+get, put and eviction take O(1) time:
+- LRUCache keeps entries in a single list ordered by recency of use, the least
+  recently used entry sits at the back of the list.
+- LFUCache keeps a list of frequency buckets in increasing order of frequency,
+  every bucket holds a list of entries used that many times. Eviction takes
+  the least recently used entry of the lowest frequency bucket. See
+  http://dhruvbird.com/lfu.pdf for the details.
+
+Usage:
+cache = LRUCache(capacity=128)  # keeps at most 128 entries
+cache = LFUCache(max_weight=2**20)  # keeps entries of total size up to 1 MiB, any number of them
+cache = LRUCache(capacity=128, max_weight=2**20)  # both limits at once
+cache = LRUCache(capacity=128, ttl=60)  # entries expire after 60 seconds
+cache.put(key, val)  # same as cache[key] = val, put(key, val, ttl) overrides ttl
+cache.get(key, default)  # returns value of a key, default if there's no such key
+cache.hits, cache.misses, cache.evictions, cache.expirations  # counters
+
+@memoize(LRUCache(capacity=1024))  # caches results of a function
+def f(x): ...
+"""
+import functools
+import sys
+import time
+
+from .doubly_linked_list import DoublyLinkedList
+
+
+class Entry:
+    __slots__ = ("key", "val", "weight", "expires", "bucket")
+
+    def __init__(self, key, val, weight, expires):
+        self.key = key
+        self.val = val
+        self.weight = weight
+        self.expires = expires  # time after which entry is expired, None if never
+        self.bucket = None  # node of LFUCache frequency list
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.key}, {self.val})"
+
+
+class Cache:
+    """ Base class of the caches. Keeps track of capacity, weight, expiry and
+    counters, subclasses decide which entry gets evicted. At least one of
+    capacity and max_weight must be given.
+    """
+
+    def __init__(self, capacity=None, max_weight=None, weigher=sys.getsizeof,
+                 ttl=None, clock=time.monotonic):
+        if capacity is None and max_weight is None:
+            raise Exception("Cache needs a capacity, a max_weight or both.")
+        self.nodes = dict()  # key: node of a list, node.data is an Entry
+        self.capacity = capacity  # max number of entries, None if unbounded
+        self.max_weight = max_weight  # max total weight of entries, None if unbounded
+        self.weigher = weigher  # returns weight of a value
+        self.weight = 0  # current total weight of entries
+        self.ttl = ttl  # default time to live of entries in seconds, None if forever
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(size={len(self)}, hits={self.hits}, "
+                f"misses={self.misses}, evictions={self.evictions})")
+
+    def __contains__(self, key):
+        """ Allows membership check like: key in cache. Doesn't count as a use
+        of the key.
+        """
+        node = self.nodes.get(key)
+        return node is not None and not self._expired(node.data)
+
+    def __getitem__(self, key):
+        """ Allows usage like Python dictionary: x = cache[key]. Raises an error
+        if there's no such key.
+        """
+        missing = object()
+        val = self.get(key, missing)
+        if val is missing:
+            raise KeyError(key)
+        return val
+
+    def __setitem__(self, key, val):
+        """ Allows usage like Python dictionary: cache[key] = val.
+        """
+        self.put(key, val)
+
+    def __delitem__(self, key):
+        """ Allows usage: del cache[key].
+        """
+        self.delete(key)
+
+    def _expired(self, entry):
+        return entry.expires is not None and entry.expires <= self.clock()
+
+    def get(self, key, default=None):
+        """ Returns value of a key and marks the key as used, returns default
+        if there's no such key or it has expired. Time complexity: O(1).
+        """
+        node = self.nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        if self._expired(node.data):
+            self._discard(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.data.val
+
+    def put(self, key, val, ttl=None):
+        """ Sets value of a key and marks the key as used, evicts entries if the
+        cache is over capacity. ttl overrides default time to live of the cache.
+        Time complexity: O(1) amortized.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires = None if ttl is None else self.clock() + ttl
+        weight = 0 if self.max_weight is None else self.weigher(val)
+        node = self.nodes.get(key)
+        if self.max_weight is not None and weight > self.max_weight:
+            if node is not None:  # value would never fit, drop the old one too
+                self._discard(node)
+            return
+
+        if node is None:  # make room first, so the new entry isn't the victim
+            self._evict(1, weight)
+            self.nodes[key] = self._insert(Entry(key, val, weight, expires))
+            self.weight += weight
+        else:
+            entry = node.data
+            self.weight += weight - entry.weight
+            entry.val, entry.weight, entry.expires = val, weight, expires
+            self._touch(node)
+            self._evict()
+
+    def delete(self, key):
+        """ Removes key from the cache, raises an error if there's no such key.
+        Time complexity: O(1).
+        """
+        node = self.nodes.get(key)
+        if node is None:
+            raise KeyError(key)
+        self._discard(node)
+
+    def clear(self):
+        """ Removes all entries from the cache, keeps the counters.
+        """
+        for node in list(self.nodes.values()):
+            self._discard(node)
+
+    def expire(self):
+        """ Removes all expired entries from the cache. Expired entries are
+        otherwise removed lazily, once they're accessed or evicted.
+        Time complexity: O(n).
+        """
+        for node in list(self.nodes.values()):
+            if self._expired(node.data):
+                self._discard(node)
+                self.expirations += 1
+
+    def stats(self):
+        """ Returns a dictionary with the current counters.
+        """
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "expirations": self.expirations,
+                "size": len(self), "weight": self.weight}
+
+    def _discard(self, node):
+        """ Removes node from the cache. Method shouldn't be used directly.
+        """
+        entry = node.data
+        self._unlink(node)
+        del self.nodes[entry.key]
+        self.weight -= entry.weight
+
+    def _evict(self, count=0, weight=0):
+        """ Evicts entries until count more entries of the given total weight
+        fit into the cache.
+        """
+        while self.nodes and (
+                (self.capacity is not None and len(self.nodes) + count > self.capacity) or
+                (self.max_weight is not None and self.weight + weight > self.max_weight)):
+            self._discard(self._victim())
+            self.evictions += 1
+
+    def _insert(self, entry):
+        """ Adds a new entry to the eviction order, returns its node.
+        """
+        raise NotImplementedError
+
+    def _touch(self, node):
+        """ Marks entry of a node as used.
+        """
+        raise NotImplementedError
+
+    def _unlink(self, node):
+        """ Removes node from the eviction order.
+        """
+        raise NotImplementedError
+
+    def _victim(self):
+        """ Returns node of the entry that should be evicted next.
+        """
+        raise NotImplementedError
+
+
+class LRUCache(Cache):
+    """ Cache evicting the least recently used entry.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.order = DoublyLinkedList()  # most recently used entry at the front
+
+    def _insert(self, entry):
+        return self.order.push_front(entry)
+
+    def _touch(self, node):
+        self.order.move_to_front(node)
+
+    def _unlink(self, node):
+        self.order.remove(node)
+
+    def _victim(self):
+        return self.order.top_back()
+
+
+class Bucket:
+    __slots__ = ("freq", "entries")
+
+    def __init__(self, freq):
+        self.freq = freq  # number of uses of every entry in the bucket
+        self.entries = DoublyLinkedList()  # most recently used entry at the front
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.freq}, {self.entries})"
+
+
+class LFUCache(Cache):
+    """ Cache evicting the least frequently used entry, ties are broken by
+    evicting the least recently used one.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = DoublyLinkedList()  # buckets in increasing order of frequency
+
+    def _insert(self, entry):
+        first = self.buckets.top_front()
+        if first is None or first.data.freq != 1:
+            first = self.buckets.push_front(Bucket(1))
+        entry.bucket = first
+        return first.data.entries.push_front(entry)
+
+    def _touch(self, node):
+        entry = node.data
+        bucket = entry.bucket
+        following = bucket.next_node
+        if following is self.buckets.sentinel or following.data.freq != bucket.data.freq + 1:
+            following = self.buckets.insert_after(bucket, Bucket(bucket.data.freq + 1))
+        self._unlink(node)  # might remove bucket, but not the following one
+        entry.bucket = following
+        self.nodes[entry.key] = following.data.entries.push_front(entry)
+
+    def _unlink(self, node):
+        bucket = node.data.bucket
+        bucket.data.entries.remove(node)
+        if bucket.data.entries.is_empty():
+            self.buckets.remove(bucket)
+
+    def _victim(self):
+        return self.buckets.top_front().data.entries.top_back()
+
+
+_KWARGS_MARK = object()  # separates positional and keyword arguments in memoize keys
+
+
+def memoize(cache=None):
+    """ Decorator caching results of a function in cache, LRUCache(capacity=128)
+    by default.
+    Arguments of the function must be hashable. Can be used both as @memoize
+    and @memoize(cache). The cache is available as wrapper.cache.
+    """
+    if callable(cache) and not isinstance(cache, Cache):  # used as @memoize
+        return memoize()(cache)
+
+    def decorator(func):
+        store = LRUCache(capacity=128) if cache is None else cache
+        missing = object()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            val = store.get(key, missing)
+            if val is missing:
+                val = func(*args, **kwargs)
+                store.put(key, val)
+            return val
+
+        wrapper.cache = store
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    cache = LRUCache(capacity=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")  # "a" is now the most recently used key
+    cache["c"] = 3  # evicts "b"
+    print(f"LRU cache keys: {list(cache.nodes)}, {cache}")
+
+    cache = LFUCache(capacity=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("b")
+    cache.get("b")
+    cache.get("a")
+    cache["c"] = 3  # evicts "a", it was used less frequently than "b"
+    print(f"LFU cache keys: {list(cache.nodes)}, {cache}")
+
+    @memoize(LRUCache(capacity=1000))
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(f"fib(200) = {fib(200)}, {fib.cache}")
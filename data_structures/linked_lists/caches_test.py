@@ -0,0 +1,149 @@
+""" Testing caches.py.
+"""
+import random
+from collections import OrderedDict
+from data_structures.linked_lists.caches import LRUCache, LFUCache, memoize
+
+
+class Clock:
+    """ Fake clock, time moves only when told to.
+    """
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def lru_test():
+    """ Tests LRUCache against OrderedDict based reference implementation.
+    """
+    cache = LRUCache(capacity=10)
+    reference = OrderedDict()
+    for i in range(10**4):
+        key = random.randrange(30)
+        if random.random() < 0.5:
+            cache.put(key, i)
+            reference[key] = i
+            reference.move_to_end(key)
+            if len(reference) > 10:
+                reference.popitem(last=False)
+        else:
+            assert cache.get(key) == reference.get(key)
+            if key in reference:
+                reference.move_to_end(key)
+        assert len(cache) == len(reference)
+    assert cache.hits + cache.misses > 0
+    print("<<< lru test is good >>>")
+
+
+def lfu_test():
+    """ Tests LFUCache against a naive reference implementation.
+    """
+    cache = LFUCache(capacity=10)
+    reference = dict()  # key: [value, frequency, time of last use]
+    for i in range(10**4):
+        key = random.randrange(30)
+        if random.random() < 0.5:
+            if key in reference:
+                reference[key] = [i, reference[key][1] + 1, i]
+            else:
+                if len(reference) == 10:
+                    victim = min(reference, key=lambda k: reference[k][1:])
+                    del reference[victim]
+                reference[key] = [i, 1, i]
+            cache.put(key, i)
+        else:
+            expected = None
+            if key in reference:
+                expected = reference[key][0]
+                reference[key][1] += 1
+                reference[key][2] = i
+            assert cache.get(key) == expected
+        assert len(cache) == len(reference)
+    print("<<< lfu test is good >>>")
+
+
+def weight_test():
+    """ Tests that caches stay within max_weight.
+    """
+    for cls in (LRUCache, LFUCache):
+        cache = cls(capacity=None, max_weight=100, weigher=len)
+        for i in range(1000):
+            cache.put(i, "x" * random.randrange(60))
+            assert cache.weight <= 100
+            assert cache.weight == sum(len(node.data.val) for node in cache.nodes.values())
+        cache.put("big", "x" * 101)  # never fits
+        assert "big" not in cache
+    print("<<< weight test is good >>>")
+
+
+def weight_only_test():
+    """ Tests that a cache with only max_weight holds any number of entries
+    and evicts by weight, in eviction order of the cache.
+    """
+    for cls in (LRUCache, LFUCache):
+        cache = cls(max_weight=1000, weigher=len)
+        for i in range(500):
+            cache.put(i, "x")
+        assert len(cache) == 500 and cache.evictions == 0
+        cache.get(0)
+        cache.put("big", "x" * 600)  # evicts 1..100, 0 was used since
+        assert cache.weight == 1000 and cache.evictions == 100
+        assert set(cache.nodes) == set(range(101, 500)) | {0, "big"}
+    try:
+        LRUCache()  # neither capacity nor max_weight
+        flag = True
+    except Exception:
+        flag = False
+    assert not flag
+    print("<<< weight only test is good >>>")
+
+
+def ttl_test():
+    """ Tests expiry of entries.
+    """
+    for cls in (LRUCache, LFUCache):
+        clock = Clock()
+        cache = cls(capacity=10, ttl=10, clock=clock)
+        cache["a"] = 1
+        cache.put("b", 2, ttl=100)
+        clock.now = 50
+        assert cache.get("a") is None and cache.expirations == 1
+        assert cache.get("b") == 2
+        clock.now = 100
+        cache.expire()
+        assert len(cache) == 0 and cache.expirations == 2
+    print("<<< ttl test is good >>>")
+
+
+def memoize_test():
+    """ Tests memoize decorator.
+    """
+    calls = []
+
+    @memoize(LFUCache(capacity=5))
+    def square(x, power=2):
+        calls.append(x)
+        return x ** power
+
+    assert square(3) == 9 and square(3) == 9 and square(3, power=3) == 27
+    assert calls == [3, 3]
+    assert square.cache.hits == 1
+
+    @memoize
+    def double(x):
+        return 2 * x
+
+    assert double(4) == 8 and isinstance(double.cache, LRUCache)
+    print("<<< memoize test is good >>>")
+
+
+if __name__ == "__main__":
+    lru_test()
+    lfu_test()
+    weight_test()
+    weight_only_test()
+    ttl_test()
+    memoize_test()
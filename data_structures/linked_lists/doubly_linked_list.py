@@ -0,0 +1,197 @@
+""" Doubly Linked List with a sentinel node.
+
+The sentinel links the last node to the first one, so the list is never
+physically empty and push/pop at both ends as well as unlinking any node need
+no special cases. Every push and insert returns the new node, which can later
+be used as a handle for O(1) remove, move_to_front and move_to_back, e.g. for
+eviction lists of LRU caches.
+
+API naming is based on Coursera course Data Structures by
+University of California, San Diego &
+National Research University Higher School of Economics.
+"""
+
+
+class Node:
+    __slots__ = ("data", "prev_node", "next_node")
+
+    def __init__(self, data=None, prev_node=None, next_node=None):
+        self.data = data
+        self.prev_node = prev_node
+        self.next_node = next_node
+
+    def __repr__(self):
+        return f"{__class__.__name__}({self.data})"
+
+    def __str__(self):
+        return f"{self.data}"
+
+
+class DoublyLinkedList:
+    """ Doubly Linked List with a sentinel node.
+    """
+
+    def __init__(self):
+        self.sentinel = Node()  # sentinel.next_node is head, sentinel.prev_node is tail
+        self.sentinel.prev_node = self.sentinel.next_node = self.sentinel
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """ Yields data of every node from head to tail.
+        """
+        sentinel = self.sentinel
+        curr = sentinel.next_node
+        while curr is not sentinel:
+            yield curr.data
+            curr = curr.next_node
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def is_empty(self):
+        """ Returns True if list is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def _link(self, node, prev_node):
+        """ Links node right after prev_node. Method shouldn't be used directly.
+        """
+        next_node = prev_node.next_node
+        node.prev_node = prev_node
+        node.next_node = next_node
+        prev_node.next_node = node
+        next_node.prev_node = node
+
+    def _unlink(self, node):
+        """ Unlinks node from its neighbours. Method shouldn't be used directly.
+        """
+        node.prev_node.next_node = node.next_node
+        node.next_node.prev_node = node.prev_node
+
+    def insert_after(self, node, new_data):
+        """ Creates a new node with data = new_data, inserts it right after node
+        and returns it. Time complexity: O(1).
+        """
+        new_node = Node(new_data)
+        self._link(new_node, node)
+        self.size += 1
+        return new_node
+
+    def insert_before(self, node, new_data):
+        """ Creates a new node with data = new_data, inserts it right before node
+        and returns it. Time complexity: O(1).
+        """
+        return self.insert_after(node.prev_node, new_data)
+
+    def push_front(self, new_data):
+        """ Creates a new node with data = new_data, adds it to the beginning
+        of the list and returns it. Time complexity: O(1).
+        """
+        return self.insert_after(self.sentinel, new_data)
+
+    def push_back(self, new_data):
+        """ Creates a new node with data = new_data, adds it to the end of the
+        list and returns it. Time complexity: O(1).
+        """
+        return self.insert_after(self.sentinel.prev_node, new_data)
+
+    def top_front(self):
+        """ Returns the 1st node in the list, None if the list is empty.
+        Time complexity: O(1).
+        """
+        if self.is_empty():
+            return
+        return self.sentinel.next_node
+
+    def top_back(self):
+        """ Returns the last node in the list, None if the list is empty.
+        Time complexity: O(1).
+        """
+        if self.is_empty():
+            return
+        return self.sentinel.prev_node
+
+    def remove(self, node):
+        """ Removes node from the list and returns it. Node must belong to this
+        list. Time complexity: O(1).
+        """
+        if node is self.sentinel or node.next_node is None:
+            raise Exception("Node is not in the list.")
+
+        self._unlink(node)
+        node.prev_node = node.next_node = None  # node doesn't belong to the list anymore
+        self.size -= 1
+        return node
+
+    def pop_front(self):
+        """ Removes the 1st node from the list and returns it.
+        Raises an exception if the list is empty. Time complexity: O(1).
+        """
+        if self.is_empty():
+            raise Exception("Cannot pop a node from the empty list.")
+        return self.remove(self.sentinel.next_node)
+
+    def pop_back(self):
+        """ Removes the last node from the list and returns it.
+        Raises an exception if the list is empty. Time complexity: O(1).
+        """
+        if self.is_empty():
+            raise Exception("Cannot pop a node from the empty list.")
+        return self.remove(self.sentinel.prev_node)
+
+    def move_to_front(self, node):
+        """ Moves node of this list to the beginning of the list.
+        Time complexity: O(1).
+        """
+        self._unlink(node)
+        self._link(node, self.sentinel)
+
+    def move_to_back(self, node):
+        """ Moves node of this list to the end of the list.
+        Time complexity: O(1).
+        """
+        self._unlink(node)
+        self._link(node, self.sentinel.prev_node)
+
+    def find(self, key):
+        """ Returns the 1st node with data == key, None if there's no such node.
+        Time complexity: O(n).
+        """
+        sentinel = self.sentinel
+        curr = sentinel.next_node
+        while curr is not sentinel:
+            if curr.data == key:
+                return curr
+            curr = curr.next_node
+        return None
+
+    def erase(self, key):
+        """ Deletes the 1st node with data = key.
+        Raises an exception if node with such data doesn't exist.
+        Time complexity: O(n).
+        """
+        node = self.find(key)
+        if node is None:
+            raise Exception(f"Node with data = {key} is not in the list.")
+        self.remove(node)
+
+
+if __name__ == "__main__":
+    linked_list = DoublyLinkedList()
+    nodes = [linked_list.push_back(i) for i in range(5)]
+    print(f"list: {linked_list}")
+
+    print(f"removing node {nodes[2]}...")
+    linked_list.remove(nodes[2])
+    print(f"moving node {nodes[3]} to front...")
+    linked_list.move_to_front(nodes[3])
+    print(f"inserting 10 before node {nodes[1]}...")
+    linked_list.insert_before(nodes[1], 10)
+    print(f"list: {linked_list}")
+
+    print(f"popping back...{linked_list.pop_back()}")
+    print(f"popping front...{linked_list.pop_front()}")
+    print(f"list: {linked_list}, size: {len(linked_list)}")
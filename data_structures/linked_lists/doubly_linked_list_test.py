@@ -0,0 +1,80 @@
+""" Testing doubly_linked_list.py.
+"""
+import random
+from data_structures.linked_lists.doubly_linked_list import DoublyLinkedList
+
+
+def backwards(linked_list):
+    """ Returns data of every node from tail to head, following prev links.
+    """
+    result, curr = [], linked_list.sentinel.prev_node
+    while curr is not linked_list.sentinel:
+        result.append(curr.data)
+        curr = curr.prev_node
+    return result
+
+
+def handles_test():
+    """ Tests operations on node handles against Python list, checking links
+    in both directions.
+    """
+    linked_list = DoublyLinkedList()
+    reference, nodes = [], []  # nodes[i] holds data i
+    for i in range(3000):
+        operation = random.randrange(7)
+        node = random.choice(nodes) if nodes else None
+        if operation == 0 or not reference:
+            nodes.append(linked_list.push_front(len(nodes)))
+            reference.insert(0, len(nodes) - 1)
+        elif operation == 1:
+            nodes.append(linked_list.push_back(len(nodes)))
+            reference.append(len(nodes) - 1)
+        elif operation == 2 and node.data in reference:
+            nodes.append(linked_list.insert_before(node, len(nodes)))
+            reference.insert(reference.index(node.data), len(nodes) - 1)
+        elif operation == 3 and node.data in reference:
+            linked_list.remove(node)
+            reference.remove(node.data)
+        elif operation == 4 and node.data in reference:
+            linked_list.move_to_front(node)
+            reference.remove(node.data)
+            reference.insert(0, node.data)
+        elif operation == 5 and node.data in reference:
+            linked_list.move_to_back(node)
+            reference.remove(node.data)
+            reference.append(node.data)
+        elif operation == 6:
+            pop_front = random.random() < 0.5
+            popped = linked_list.pop_front() if pop_front else linked_list.pop_back()
+            assert popped.data == reference.pop(0 if pop_front else -1)
+        assert list(linked_list) == reference and len(linked_list) == len(reference)
+        assert backwards(linked_list) == reference[::-1]
+    print("<<< handles test is good >>>")
+
+
+def empty_test():
+    """ Tests the empty list and errors of removing nodes not in the list.
+    """
+    linked_list = DoublyLinkedList()
+    assert linked_list.is_empty() and list(linked_list) == []
+    assert linked_list.top_front() is None and linked_list.top_back() is None
+    node = linked_list.push_back(1)
+    assert linked_list.top_front() is node is linked_list.top_back()
+    linked_list.erase(1)
+    assert linked_list.find(1) is None
+    for operation in (linked_list.pop_front, linked_list.pop_back,
+                      lambda: linked_list.remove(node), lambda: linked_list.erase(1),
+                      lambda: linked_list.remove(linked_list.sentinel)):
+        try:
+            operation()
+            flag = True
+        except Exception:
+            flag = False
+        assert not flag
+    assert len(linked_list) == 0
+    print("<<< empty test is good >>>")
+
+
+if __name__ == "__main__":
+    handles_test()
+    empty_test()
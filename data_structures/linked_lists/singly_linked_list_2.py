@@ -0,0 +1,391 @@
+""" Singly Linked List with head and tail pointers.
+
+In the optional index mode, SinglyLinkedList(indexed=True), the list keeps a
+dictionary from data to the nodes with such data and their previous nodes. It
+makes find, erase, insert_after and pop_back O(1) at the cost of O(n) extra
+space, data must be hashable. With duplicate data erase and insert_after use
+the first such node in list order, same as without the index, found walking
+from the head.
+
+API naming is based on Coursera course Data Structures by
+University of California, San Diego &
+National Research University Higher School of Economics.
+"""
+
+
+class Node:
+    def __init__(self, data=None, next_node=None):
+        self.data = data
+        self.next_node = next_node
+
+    def __repr__(self):
+        return f"{__class__.__name__}({self.data})"
+
+    def __str__(self):
+        return f"{self.data}"
+
+
+def _split(node, k):
+    """ Cuts the chain of nodes starting at node after k nodes. Returns the
+    1st node of the rest of the chain, None if the chain is shorter.
+    """
+    for i in range(k - 1):
+        if node is None:
+            return None
+        node = node.next_node
+    if node is None:
+        return None
+    rest = node.next_node
+    node.next_node = None
+    return rest
+
+
+def _merge(a, b):
+    """ Merges two sorted chains of nodes starting at a and b by relinking
+    them, equal nodes of a go first. Returns the 1st and the last node of the
+    merged chain.
+    """
+    if b is None or not b.data < a.data:
+        head, a = a, a.next_node
+    else:
+        head, b = b, b.next_node
+    tail = head
+    while a and b:
+        if b.data < a.data:
+            tail.next_node, b = b, b.next_node
+        else:
+            tail.next_node, a = a, a.next_node
+        tail = tail.next_node
+    tail.next_node = a if a else b
+    while tail.next_node:  # walk to the end of the leftover chain
+        tail = tail.next_node
+    return head, tail
+
+
+class SinglyLinkedList:
+    """ Singly Linked List with head and tail pointers.
+    """
+
+    def __init__(self, indexed=False):
+        self.head = None
+        self.tail = None
+        self.size = 0  # number of nodes in the list
+        # data: dictionary of nodes with such data -> their previous nodes
+        self.index = dict() if indexed else None
+
+    def _index_add(self, node, prev):
+        """ Adds node with previous node prev to the index.
+        """
+        nodes = self.index.get(node.data)
+        if nodes is None:
+            nodes = self.index[node.data] = dict()
+        nodes[node] = prev
+
+    def _index_set_prev(self, node, prev):
+        """ Updates previous node of node in the index, node can be None.
+        """
+        if node is not None:
+            self.index[node.data][node] = prev
+
+    def _index_remove(self, node):
+        """ Removes node from the index.
+        """
+        nodes = self.index[node.data]
+        del nodes[node]
+        if not nodes:
+            del self.index[node.data]
+
+    def _index_first(self, key):
+        """ Returns the first node with data = key in list order and its
+        previous node, key must be in the index. O(1) if only one node has such
+        data, otherwise the first of them is found walking from the head.
+        """
+        nodes = self.index[key]
+        if len(nodes) == 1:
+            return next(iter(nodes.items()))
+        prev, curr = None, self.head
+        while curr not in nodes:
+            prev, curr = curr, curr.next_node
+        return curr, prev
+
+    def _index_rebuild(self):
+        """ Rebuilds the index from scratch after the list was relinked.
+        """
+        self.index.clear()
+        prev, curr = None, self.head
+        while curr:
+            self._index_add(curr, prev)
+            prev, curr = curr, curr.next_node
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """ Yields data of every node from head to tail.
+        """
+        curr = self.head
+        while curr:
+            yield curr.data
+            curr = curr.next_node
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def is_empty(self):
+        """ Returns True if list is empty, False otherwise.
+        """
+        return self.head is None
+
+    def push_front(self, new_data):
+        """ Creates a new node with data = new_data and adds it to the
+        beginning of the list.
+        Time complexity: O(1).
+        """
+        new_node = Node(new_data)  # allocate a new node
+        new_node.next_node = self.head  # connect new node to the 1st node
+        if self.index is not None:
+            self._index_add(new_node, None)
+            self._index_set_prev(self.head, new_node)
+        self.head = new_node  # change the head pointer
+        self.size += 1
+        if self.tail is None:  # update tail pointer if the list was empty
+            self.tail = new_node
+
+    def top_front(self):
+        """ Returns the 1st node in the list.
+        Time complexity: O(1).
+        """
+        return self.head
+
+    def pop_front(self):
+        """ Removes the 1st node from the list and returns it.
+        Raises an exception if the list is empty.
+        Time complexity: O(1).
+        """
+        # raise exception if the list is empty
+        if self.is_empty():
+            raise Exception("Cannot pop a node from the empty list.")
+
+        removed = self.head  # save the link to the to-be-removed node
+        self.head = self.head.next_node  # remove node
+        self.size -= 1
+        if self.index is not None:
+            self._index_remove(removed)
+            self._index_set_prev(self.head, None)
+        if self.head is None:  # list had only 1 node, update the tail pointer
+            self.tail = None
+        return removed
+
+    def push_back(self, new_data):
+        """ Creates a new node with data = new_data and adds it to the end
+        of the list.
+        Time complexity: O(1).
+        """
+        new_node = Node(new_data)  # allocate a new node
+        if self.index is not None:
+            self._index_add(new_node, self.tail)
+        if self.is_empty():  # list was empty, update both pointers
+            self.head = self.tail = new_node
+        else:
+            self.tail.next_node = new_node
+            self.tail = new_node
+        self.size += 1
+
+    def top_back(self):
+        """ Returns the last node in the list.
+        Time complexity: O(1).
+        """
+        return self.tail
+
+    def pop_back(self):
+        """ Removes the last node from the list and returns it.
+        Raises an exception if the list is empty.
+        Time complexity: O(n), O(1) in the index mode.
+        """
+        # raise an exception if the list is empty
+        if self.is_empty():
+            raise Exception("Cannot pop a node from the empty list.")
+
+        # list has only 1 node
+        if self.head == self.tail:
+            removed = self.head
+            self.head = self.tail = None  # update both pointers
+            self.size -= 1
+            if self.index is not None:
+                self._index_remove(removed)
+            return removed
+
+        if self.index is not None:  # index knows the previous node
+            removed = self.tail
+            prev = self.index[removed.data][removed]
+            self._index_remove(removed)
+            prev.next_node = None  # unlink the last node
+            self.tail = prev  # update the tail pointer
+            self.size -= 1
+            return removed
+
+        # traverse the list till the last node, keep track of current pointer
+        # and the previous pointer
+        prev, curr = None, self.head
+        while curr.next_node:  # while the next node is not None
+            prev, curr = curr, curr.next_node
+        prev.next_node = None  # unlink the last node
+        self.tail = prev  # update the tail pointer
+        self.size -= 1
+        return curr  # return removed node
+
+    def find(self, key):
+        """ Returns True if there's node on the list with data == key,
+        False otherwise.
+        Time complexity: O(n), O(1) in the index mode.
+        """
+        if self.index is not None:
+            return key in self.index
+
+        curr = self.head
+        while curr:
+            if curr.data == key:
+                return True
+            curr = curr.next_node
+        return False
+
+    def erase(self, key):
+        """ Deletes the node with data = key.
+        Raises an exception if node with such data doesn't exist.
+        Time complexity: O(n), O(1) in the index mode.
+        """
+        if self.index is not None:
+            if key not in self.index:
+                raise Exception(f"Node with data = {key} is not in the list.")
+            curr, prev = self._index_first(key)
+            self._unlink(prev, curr)
+            return
+
+        prev = None
+        curr = self.head
+        while curr:
+            if curr.data == key:  # found the node
+                self._unlink(prev, curr)
+                return
+
+            # node with data = key wasn't found, check the next node
+            prev, curr = curr, curr.next_node
+
+        # node is not in the list, raise an exception
+        raise Exception(f"Node with data = {key} is not in the list.")
+
+    def _unlink(self, prev, curr):
+        """ Unlinks node curr with previous node prev from the list.
+        """
+        if prev is None:  # special case, wanted node is the 1st one
+            self.head = curr.next_node
+        else:
+            prev.next_node = curr.next_node  # unlink the node
+        self.size -= 1
+
+        if self.tail is curr:  # removed node was the last one
+            self.tail = prev  # update the tail
+
+        if self.index is not None:
+            self._index_remove(curr)
+            self._index_set_prev(curr.next_node, prev)
+
+    def insert_after(self, key, new_data):
+        """ Creates a new node with data = new_data and adds it right after the
+        node with data = key. Raises an exception if node with such data
+        doesn't exist.
+        Time complexity: O(n), O(1) in the index mode.
+        """
+        if self.index is not None:
+            if key not in self.index:
+                raise Exception(f"Node with data = {key} is not in the list.")
+            curr = self._index_first(key)[0]
+        else:
+            curr = self.head
+            while curr and curr.data != key:
+                curr = curr.next_node
+            if curr is None:
+                raise Exception(f"Node with data = {key} is not in the list.")
+
+        new_node = Node(new_data, curr.next_node)  # allocate a new node
+        curr.next_node = new_node  # link it right after the found node
+        self.size += 1
+        if self.tail is curr:  # new node is the last one
+            self.tail = new_node
+        if self.index is not None:
+            self._index_add(new_node, curr)
+            self._index_set_prev(new_node.next_node, new_node)
+
+    def extend(self, iterable):
+        """ Creates a new node for every element of iterable and adds them to
+        the end of the list.
+        Time complexity: O(k), k is a number of added elements.
+        """
+        for new_data in iterable:
+            self.push_back(new_data)
+
+    def concat(self, other):
+        """ Moves all nodes of other list to the end of this list, other list
+        becomes empty.
+        Time complexity: O(1), O(k) if this list is in the index mode, k is
+        a length of other list.
+        """
+        if other is self:
+            raise Exception("Cannot concatenate a list with itself.")
+        if other.is_empty():
+            return
+        if self.index is not None:
+            prev, curr = self.tail, other.head
+            while curr:
+                self._index_add(curr, prev)
+                prev, curr = curr, curr.next_node
+        if self.is_empty():
+            self.head = other.head
+        else:
+            self.tail.next_node = other.head
+        self.tail = other.tail
+        self.size += other.size
+        other.head = other.tail = None
+        other.size = 0
+        if other.index is not None:
+            other.index.clear()
+
+    def reverse(self):
+        """ Reverses the list in-place by relinking its nodes.
+        Time complexity: O(n).
+        """
+        prev, curr = None, self.head
+        self.tail = curr
+        while curr:
+            curr.next_node, prev, curr = prev, curr, curr.next_node
+        self.head = prev
+        if self.index is not None:
+            self._index_rebuild()
+
+    def sort(self):
+        """ Sorts the list in non-descending order of data in-place with bottom
+        up merge sort, relinks the nodes without allocating new ones. Sorting
+        is stable. Time complexity: O(n * lg(n)). Space complexity: O(1).
+        """
+        width = 1
+        while width < self.size:
+            curr = self.head
+            self.head = tail = None
+            while curr:  # merge every pair of adjacent runs of length width
+                left = curr
+                right = _split(left, width)
+                curr = _split(right, width)
+                head, last = _merge(left, right)
+                if tail is None:
+                    self.head = head
+                else:
+                    tail.next_node = head
+                tail = last
+            self.tail = tail
+            width *= 2
+        if self.index is not None:
+            self._index_rebuild()
+
+
+if __name__ == "__main__":
+    linked_list = SinglyLinkedList()
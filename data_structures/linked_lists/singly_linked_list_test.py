@@ -0,0 +1,125 @@
+""" Testing singly_linked_list_1.py and singly_linked_list_2.py, with and
+without the index.
+"""
+import random
+from data_structures.linked_lists import singly_linked_list_1, singly_linked_list_2
+
+MODULES = (singly_linked_list_1, singly_linked_list_2)
+
+
+class Item:
+    """ Element compared by key only, tells equal elements apart.
+    """
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def duplicates_test():
+    """ Tests that erase and insert_after use the first node with such data
+    in list order in both modes.
+    """
+    for module in MODULES:
+        for indexed in (False, True):
+            linked_list = module.SinglyLinkedList(indexed=indexed)
+            linked_list.push_back(1)
+            linked_list.push_front(2)
+            linked_list.push_front(1)  # the 1st node in list order, added last
+            linked_list.erase(1)
+            assert list(linked_list) == [2, 1]
+            linked_list.push_front(1)
+            linked_list.insert_after(1, 3)
+            assert list(linked_list) == [1, 3, 2, 1]
+    print("<<< duplicates test is good >>>")
+
+
+def random_operations_test():
+    """ Tests both lists in both modes against Python list with random
+    operations on few distinct values, so there are many duplicates.
+    """
+    for module in MODULES:
+        for indexed in (False, True):
+            linked_list = module.SinglyLinkedList(indexed=indexed)
+            reference = []
+            for i in range(3000):
+                x, y = random.randrange(5), random.randrange(5)
+                operation = random.randrange(6)
+                if operation == 0:
+                    linked_list.push_front(x)
+                    reference.insert(0, x)
+                elif operation == 1:
+                    linked_list.push_back(x)
+                    reference.append(x)
+                elif operation == 2 and reference:
+                    assert linked_list.pop_front().data == reference.pop(0)
+                elif operation == 3 and reference:
+                    assert linked_list.pop_back().data == reference.pop()
+                elif operation == 4 and x in reference:
+                    linked_list.erase(x)
+                    reference.remove(x)
+                elif operation == 5 and x in reference:
+                    linked_list.insert_after(x, y)
+                    reference.insert(reference.index(x) + 1, y)
+                assert linked_list.find(x) == (x in reference)
+                assert list(linked_list) == reference and len(linked_list) == len(reference)
+            try:
+                linked_list.erase(5)  # never added
+                flag = True
+            except Exception:
+                flag = False
+            assert not flag
+    print("<<< random operations test is good >>>")
+
+
+def bulk_operations_test():
+    """ Tests extend, concat, reverse and sort in both modes, the lists and
+    their indexes keep working after them.
+    """
+    for module in MODULES:
+        for indexed in (False, True):
+            a = module.SinglyLinkedList(indexed=indexed)
+            b = module.SinglyLinkedList(indexed=indexed)
+            data = [random.randrange(100) for i in range(300)]
+            a.extend(data[:100])
+            b.extend(data[100:])
+            a.concat(b)
+            assert list(a) == data and len(a) == 300
+            assert list(b) == [] and len(b) == 0 and not b.find(data[-1])
+            a.concat(b)  # concatenating an empty list changes nothing
+            a.reverse()
+            data.reverse()
+            assert list(a) == data
+            a.sort()
+            data.sort()
+            assert list(a) == data
+            a.push_back(1000)  # tail is right after relinking
+            a.erase(data[150])
+            data.append(1000)
+            data.remove(data[150])
+            assert list(a) == data and a.find(1000) and a.pop_back().data == 1000
+            try:
+                a.concat(a)
+                flag = True
+            except Exception:
+                flag = False
+            assert not flag
+
+            items = module.SinglyLinkedList()
+            items.extend(Item(random.randrange(10), i) for i in range(200))
+            items.sort()
+            assert [(x.key, x.tag) for x in items] == sorted((x.key, x.tag) for x in items)
+            empty = module.SinglyLinkedList()
+            empty.sort()
+            empty.reverse()
+            assert list(empty) == []
+    print("<<< bulk operations test is good >>>")
+
+
+if __name__ == "__main__":
+    duplicates_test()
+    random_operations_test()
+    bulk_operations_test()
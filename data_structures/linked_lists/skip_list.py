@@ -0,0 +1,175 @@
+""" Skip list, an ordered map of linked lists stacked in levels.
+https://en.wikipedia.org/wiki/Skip_list
+
+Level 0 is a sorted singly linked list of every node, every next level
+links about half of the nodes of the level below, chosen at random, so a
+search skips over long runs of nodes at the top and walks down. Operations
+take expected O(lg(n)) time without any rebalancing: a put or delete only
+relinks the neighbours of one node, and range scans walk level 0.
+
+Levels are drawn from a random.Random of its own, seeded with seed, so runs
+with the same seed build the same list. Nodes use __slots__.
+
+Same mapping API as BinarySearchTree:
+sl = SkipList(seed=None)  # initializes an empty skip list
+sl["a"] = 97  # sets key("a") in the list equal to value(97), O(lg(n)) expected
+"a" in sl  # checks if key is in the list
+sl["a"]  # returns value of a key if it's present, None otherwise
+del sl["a"]  # deletes key from the list, raises an error if it doesn't exist
+list(sl)  # keys in sorted order
+sl.range(lo, hi)  # yields (key, value) pairs with lo <= key < hi, O(lg(n) + k)
+"""
+import random
+
+
+class Node:
+    __slots__ = ("key", "val", "next_nodes")
+
+    def __init__(self, key, val, next_nodes):
+        self.key = key
+        self.val = val
+        self.next_nodes = next_nodes  # next node on every level of the node
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.key}, {self.val})"
+
+
+class SkipList:
+    MAX_LEVEL = 32  # enough for 2**32 nodes
+
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+        self.head = Node(None, None, [None] * self.MAX_LEVEL)  # before every node
+        self.level = 1  # number of levels in use
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self.range())})"
+
+    def __iter__(self):
+        curr = self.head.next_nodes[0]
+        while curr:
+            yield curr.key
+            curr = curr.next_nodes[0]
+
+    def _random_level(self):
+        """ Returns 1 + number of heads in a row tossing a coin, a level is
+        half as likely as the one below it. Time complexity: O(1).
+        """
+        bits = self.random.getrandbits(self.MAX_LEVEL - 1)
+        return (~bits & (bits + 1)).bit_length()  # 1 + number of trailing 1 bits
+
+    def _find(self, key, prev_nodes=None):
+        """ Returns the last node with a key less than key on level 0, the head
+        if there's none. If prev_nodes is given, stores the last such node of
+        every level in it. Time complexity: O(lg(n)) expected.
+        """
+        curr = self.head
+        for level in range(self.level - 1, -1, -1):
+            next_node = curr.next_nodes[level]
+            while next_node and next_node.key < key:
+                curr = next_node
+                next_node = curr.next_nodes[level]
+            if prev_nodes is not None:
+                prev_nodes[level] = curr
+        return curr
+
+    def _get(self, key):
+        """ Helper function for get. Returns link to the node with key=key if
+        there's one, returns None otherwise.
+        """
+        node = self._find(key).next_nodes[0]
+        if node and node.key == key:
+            return node
+        return None
+
+    def get(self, key):
+        """ Returns a value of a node with key=key if there's one,
+        returns None if there's no such node. Time complexity: O(lg(n)) expected.
+        """
+        node = self._get(key)
+        if node:
+            return node.val
+        return None
+
+    def __getitem__(self, key):
+        """ Allows usage like Python dictionary: x = sl[key].
+        """
+        return self.get(key)
+
+    def __contains__(self, key):
+        """ Allows membership check like: key in sl / key not in sl.
+        """
+        return self._get(key) is not None
+
+    def put(self, key, val):
+        """ Inserts a new node with key=key and value=val. If node with such key
+        is already present in the list, updates its value.
+        Time complexity: O(lg(n)) expected.
+        """
+        prev_nodes = [self.head] * self.MAX_LEVEL
+        node = self._find(key, prev_nodes).next_nodes[0]
+        if node and node.key == key:  # update node's value
+            node.val = val
+            return
+        level = self._random_level()
+        if level > self.level:
+            self.level = level  # prev_nodes of the new levels are the head
+        node = Node(key, val, [prev_nodes[i].next_nodes[i] for i in range(level)])
+        for i in range(level):  # level 0 first, so every linked node is in level 0
+            prev_nodes[i].next_nodes[i] = node
+        self.size += 1
+
+    def __setitem__(self, key, val):
+        """ Allows usage like Python dictionary: sl[key]=val.
+        """
+        return self.put(key, val)
+
+    def delete(self, key):
+        """ Removes node with key=key from the list, raises an error if there's
+        no such node. Time complexity: O(lg(n)) expected.
+        """
+        prev_nodes = [self.head] * self.MAX_LEVEL
+        node = self._find(key, prev_nodes).next_nodes[0]
+        if not node or node.key != key:
+            raise KeyError(f"Skip list doesn't have a node with key={key}.")
+        for i in range(len(node.next_nodes) - 1, -1, -1):  # top level first
+            prev_nodes[i].next_nodes[i] = node.next_nodes[i]
+        while self.level > 1 and not self.head.next_nodes[self.level - 1]:
+            self.level -= 1
+        self.size -= 1
+
+    def __delitem__(self, key):
+        """ Allows usage: del sl[key].
+        """
+        return self.delete(key)
+
+    def range(self, lo=None, hi=None):
+        """ Yields (key, value) pairs with lo <= key < hi in sorted order, from
+        the first key if lo is None, up to the last one if hi is None.
+        Time complexity: O(lg(n) + k), k is number of pairs.
+        """
+        curr = self.head if lo is None else self._find(lo)
+        curr = curr.next_nodes[0]
+        while curr and (hi is None or curr.key < hi):
+            yield curr.key, curr.val
+            curr = curr.next_nodes[0]
+
+
+if __name__ == "__main__":
+    sl = SkipList(seed=1)
+    for k in [5, 30, 2, 40, 25, 4]:
+        sl[k] = str(k)
+    print(sl)
+    print(f"keys: {list(sl)}, levels: {sl.level}")
+    print(f"sl[25] = {sl[25]}, 3 in sl: {3 in sl}")
+    print(f"keys in [4, 30): {list(sl.range(4, 30))}")
+    del sl[30]
+    print(f"deleting 30...{sl}")
+    big = SkipList(seed=1)
+    for k in range(10**5):  # sorted keys are fine, no rebalancing needed
+        big[k] = k
+    print(f"10**5 keys, levels: {big.level}, sum of keys in [10, 20): {sum(dict(big.range(10, 20)))}")
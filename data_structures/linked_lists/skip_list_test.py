@@ -0,0 +1,92 @@
+""" Testing skip_list.py.
+"""
+import random
+from data_structures.linked_lists.skip_list import SkipList
+
+
+def levels_are_valid(sl):
+    """ Returns True if every level is sorted and links only nodes of the
+    level below it.
+    """
+    below = None
+    for level in range(sl.MAX_LEVEL):
+        keys, curr = [], sl.head.next_nodes[level]
+        while curr:
+            keys.append(curr.key)
+            curr = curr.next_nodes[level]
+        if keys != sorted(set(keys)) or (below is not None and not set(keys) <= below):
+            return False
+        if level >= sl.level and keys:
+            return False
+        below = set(keys)
+    return True
+
+
+def random_operations_test():
+    """ Tests put, get, contains and delete against a dictionary.
+    """
+    sl, expected = SkipList(seed=0), dict()
+    for i in range(10**4):
+        k = random.randrange(500)
+        operation = random.randrange(3)
+        if operation == 0:
+            sl[k] = i
+            expected[k] = i
+        elif operation == 1:
+            assert sl[k] == expected.get(k)
+            assert (k in sl) == (k in expected)
+        elif k in expected:
+            del sl[k]
+            del expected[k]
+        else:
+            try:
+                del sl[k]
+                deleted = True
+            except KeyError:
+                deleted = False
+            assert not deleted
+    assert levels_are_valid(sl)
+    assert list(sl) == sorted(expected) and len(sl) == len(expected)
+    print("<<< random operations test is good >>>")
+
+
+def range_test():
+    """ Tests range method of SkipList class.
+    """
+    sl = SkipList(seed=0)
+    keys = sorted(random.sample(range(10**6), 10**3))
+    for k in random.sample(keys, len(keys)):
+        sl[k] = -k
+    assert list(sl.range()) == [(k, -k) for k in keys]
+    for i in range(100):
+        lo, hi = sorted(random.sample(range(-10, 10**6 + 10), 2))
+        assert list(sl.range(lo, hi)) == [(k, -k) for k in keys if lo <= k < hi]
+        assert list(sl.range(lo)) == [(k, -k) for k in keys if lo <= k]
+        assert list(sl.range(hi=hi)) == [(k, -k) for k in keys if k < hi]
+    print("<<< range test is good >>>")
+
+
+def seed_test():
+    """ Tests that skip lists with the same seed and keys have the same levels.
+    """
+    keys = random.sample(range(10**6), 10**3)
+
+    def levels(seed):
+        sl = SkipList(seed=seed)
+        for k in keys:
+            sl[k] = k
+        result, curr = [], sl.head.next_nodes[0]
+        while curr:
+            result.append(len(curr.next_nodes))
+            curr = curr.next_nodes[0]
+        return result
+
+    assert levels(1) == levels(1)
+    assert levels(1) != levels(2)
+    print("<<< seed test is good >>>")
+
+
+if __name__ == "__main__":
+    random_operations_test()
+    range_test()
+    seed_test()
@@ -0,0 +1,262 @@
+""" Unrolled Linked List, a doubly linked list of blocks of elements.
+https://en.wikipedia.org/wiki/Unrolled_linked_list
+
+Every node holds a Python list of up to block_size elements, so there's one
+node object and one pointer hop per block instead of per element. Iteration
+walks whole blocks at C speed and find uses list.index inside a block.
+Blocks are split in half once they overflow on insert and merged with the
+next block once they drop below half full on erase.
+
+Usage:
+ul = UnrolledLinkedList(block_size=64)  # initializes an empty list
+ul.push_front(x), ul.push_back(x)  # add element x to the front/back, O(1)
+ul.pop_front(), ul.pop_back()  # remove and return an element, O(1)
+ul.top_front(), ul.top_back()  # return an element without removing it, O(1)
+ul.extend(iterable)  # add all elements to the back, O(k)
+ul.insert(i, x)  # insert element x at index i, O(n / block_size + block_size)
+ul.find(x)  # checks if there's an element equal to x
+ul.erase(x)  # deletes the 1st element equal to x
+ul[i]  # returns element at index i
+"""
+
+
+class Node:
+    __slots__ = ("items", "prev_node", "next_node")
+
+    def __init__(self, items=None, prev_node=None, next_node=None):
+        self.items = [] if items is None else items
+        self.prev_node = prev_node
+        self.next_node = next_node
+
+    def __repr__(self):
+        return f"{__class__.__name__}({self.items})"
+
+
+class UnrolledLinkedList:
+    """ Unrolled Linked List with head and tail pointers.
+    """
+
+    def __init__(self, iterable=(), block_size=64):
+        if block_size < 2:
+            raise Exception("Block size must be at least 2.")
+        self.block_size = block_size
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.extend(iterable)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        curr = self.head
+        while curr:
+            yield from curr.items
+            curr = curr.next_node
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self)})"
+
+    def is_empty(self):
+        """ Returns True if list is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def _link_after(self, node, prev_node):
+        """ Links a new block node right after prev_node, at the front if
+        prev_node is None.
+        """
+        next_node = self.head if prev_node is None else prev_node.next_node
+        node.prev_node, node.next_node = prev_node, next_node
+        if prev_node is None:
+            self.head = node
+        else:
+            prev_node.next_node = node
+        if next_node is None:
+            self.tail = node
+        else:
+            next_node.prev_node = node
+
+    def _unlink(self, node):
+        """ Unlinks a block node from the list.
+        """
+        if node.prev_node is None:
+            self.head = node.next_node
+        else:
+            node.prev_node.next_node = node.next_node
+        if node.next_node is None:
+            self.tail = node.prev_node
+        else:
+            node.next_node.prev_node = node.prev_node
+
+    def push_front(self, new_data):
+        """ Adds new_data to the beginning of the list. Time complexity: O(1).
+        """
+        if self.head is None or len(self.head.items) == self.block_size:
+            self._link_after(Node(), None)
+        self.head.items.insert(0, new_data)  # O(block_size), i.e. O(1)
+        self.size += 1
+
+    def push_back(self, new_data):
+        """ Adds new_data to the end of the list. Time complexity: O(1).
+        """
+        if self.tail is None or len(self.tail.items) == self.block_size:
+            self._link_after(Node(), self.tail)
+        self.tail.items.append(new_data)
+        self.size += 1
+
+    def extend(self, iterable):
+        """ Adds all elements of iterable to the end of the list.
+        Time complexity: O(k), k is a number of added elements.
+        """
+        items = list(iterable)
+        block_size = self.block_size
+        start = 0
+        if self.tail is not None:  # fill up the last block first
+            start = block_size - len(self.tail.items)
+            self.tail.items.extend(items[:start])
+        for i in range(start, len(items), block_size):
+            self._link_after(Node(items[i:i + block_size]), self.tail)
+        self.size += len(items)
+
+    def top_front(self):
+        """ Returns the 1st element of the list. Time complexity: O(1).
+        """
+        if self.is_empty():
+            raise Exception("Cannot get an element of the empty list.")
+        return self.head.items[0]
+
+    def top_back(self):
+        """ Returns the last element of the list. Time complexity: O(1).
+        """
+        if self.is_empty():
+            raise Exception("Cannot get an element of the empty list.")
+        return self.tail.items[-1]
+
+    def pop_front(self):
+        """ Removes the 1st element from the list and returns it.
+        Raises an exception if the list is empty. Time complexity: O(1).
+        """
+        if self.is_empty():
+            raise Exception("Cannot pop an element from the empty list.")
+        removed = self.head.items.pop(0)  # O(block_size), i.e. O(1)
+        if not self.head.items:
+            self._unlink(self.head)
+        self.size -= 1
+        return removed
+
+    def pop_back(self):
+        """ Removes the last element from the list and returns it.
+        Raises an exception if the list is empty. Time complexity: O(1).
+        """
+        if self.is_empty():
+            raise Exception("Cannot pop an element from the empty list.")
+        removed = self.tail.items.pop()
+        if not self.tail.items:
+            self._unlink(self.tail)
+        self.size -= 1
+        return removed
+
+    def _locate(self, i):
+        """ Returns block node containing element at index i and the index
+        of the element inside the block. Time complexity: O(n / block_size).
+        """
+        if i < 0:
+            i += self.size
+        if i < 0 or i >= self.size:
+            raise IndexError("List index out of range.")
+        if i < self.size // 2:  # walk from the closest end
+            curr = self.head
+            while i >= len(curr.items):
+                i -= len(curr.items)
+                curr = curr.next_node
+        else:
+            i = self.size - i  # position counted from the back, 1-based
+            curr = self.tail
+            while i > len(curr.items):
+                i -= len(curr.items)
+                curr = curr.prev_node
+            i = len(curr.items) - i
+        return curr, i
+
+    def __getitem__(self, i):
+        node, j = self._locate(i)
+        return node.items[j]
+
+    def __setitem__(self, i, val):
+        node, j = self._locate(i)
+        node.items[j] = val
+
+    def insert(self, i, new_data):
+        """ Inserts new_data at index i, splits the block if it overflows.
+        Time complexity: O(n / block_size + block_size).
+        """
+        if i >= self.size:
+            return self.push_back(new_data)
+        if i <= -self.size or i == 0:
+            return self.push_front(new_data)
+        node, j = self._locate(i)
+        node.items.insert(j, new_data)
+        self.size += 1
+        if len(node.items) > self.block_size:  # split the block in half
+            half = len(node.items) // 2
+            self._link_after(Node(node.items[half:]), node)
+            del node.items[half:]
+
+    def find(self, key):
+        """ Returns True if there's an element equal to key, False otherwise.
+        Time complexity: O(n).
+        """
+        curr = self.head
+        while curr:
+            if key in curr.items:
+                return True
+            curr = curr.next_node
+        return False
+
+    def erase(self, key):
+        """ Deletes the 1st element equal to key, merges the block with the next
+        one if it becomes less than half full. Raises an exception if there's
+        no such element. Time complexity: O(n).
+        """
+        curr = self.head
+        while curr:
+            if key in curr.items:
+                curr.items.remove(key)
+                self.size -= 1
+                self._rebalance(curr)
+                return
+            curr = curr.next_node
+        raise Exception(f"Element {key} is not in the list.")
+
+    def _rebalance(self, node):
+        """ Restores the block of node after removal: unlinks an empty block,
+        merges an underflowing block with the next one or borrows elements
+        from it.
+        """
+        if not node.items:
+            self._unlink(node)
+            return
+        half = self.block_size // 2
+        following = node.next_node
+        if len(node.items) >= half or following is None:
+            return
+        if len(node.items) + len(following.items) <= self.block_size:  # merge
+            node.items.extend(following.items)
+            self._unlink(following)
+        else:  # borrow elements from the next block
+            borrow = half - len(node.items)
+            node.items.extend(following.items[:borrow])
+            del following.items[:borrow]
+
+
+if __name__ == "__main__":
+    ul = UnrolledLinkedList(range(10), block_size=4)
+    print(f"list: {ul}, size: {len(ul)}")
+    ul.push_front(-1)
+    ul.insert(5, 100)
+    ul.erase(7)
+    print(f"list: {ul}, size: {len(ul)}")
+    print(f"popping front...{ul.pop_front()}")
+    print(f"popping back...{ul.pop_back()}")
+    print(f"element at index 3: {ul[3]}")
@@ -0,0 +1,88 @@
+""" Testing unrolled_linked_list.py.
+"""
+import random
+from data_structures.linked_lists.unrolled_linked_list import UnrolledLinkedList
+
+
+def blocks_are_valid(ul):
+    """ Returns True if blocks are non-empty, not over block_size, linked in
+    both directions and hold size elements.
+    """
+    count, prev, curr = 0, None, ul.head
+    while curr:
+        assert 0 < len(curr.items) <= ul.block_size
+        assert curr.prev_node is prev
+        count += len(curr.items)
+        prev, curr = curr, curr.next_node
+    assert prev is ul.tail and count == ul.size
+    return True
+
+
+def random_operations_test():
+    """ Tests UnrolledLinkedList against Python list with random operations.
+    """
+    for block_size in (2, 3, 8):
+        ul = UnrolledLinkedList(range(20), block_size=block_size)
+        reference = list(range(20))
+        for i in range(1500):
+            x = random.randrange(50)
+            operation = random.randrange(8)
+            if operation == 0:
+                ul.push_front(x)
+                reference.insert(0, x)
+            elif operation == 1:
+                ul.push_back(x)
+                reference.append(x)
+            elif operation == 2:
+                j = random.randint(-len(reference) - 2, len(reference) + 2)
+                ul.insert(j, x)
+                reference.insert(j, x)
+            elif operation == 3 and x in reference:
+                ul.erase(x)
+                reference.remove(x)
+            elif operation == 4 and reference:
+                assert ul.pop_front() == reference.pop(0)
+            elif operation == 5 and reference:
+                assert ul.pop_back() == reference.pop()
+            elif operation == 6 and reference:
+                j = random.randrange(-len(reference), len(reference))
+                assert ul[j] == reference[j]
+                ul[j] = reference[j] = x
+            elif operation == 7:
+                data = [random.randrange(50) for j in range(random.randrange(10))]
+                ul.extend(data)
+                reference.extend(data)
+            assert ul.find(x) == (x in reference)
+            assert list(ul) == reference and len(ul) == len(reference)
+            assert blocks_are_valid(ul)
+    print("<<< random operations test is good >>>")
+
+
+def errors_test():
+    """ Tests errors on the empty list, indexes out of range and missing
+    elements.
+    """
+    ul = UnrolledLinkedList()
+    for operation in (ul.pop_front, ul.pop_back, ul.top_front, ul.top_back,
+                      lambda: ul[0], lambda: ul.erase(1),
+                      lambda: UnrolledLinkedList(block_size=1)):
+        try:
+            operation()
+            flag = True
+        except Exception:
+            flag = False
+        assert not flag
+    ul.extend([1, 2, 3])
+    for i in (3, -4):
+        try:
+            ul[i]
+            flag = True
+        except IndexError:
+            flag = False
+        assert not flag
+    print("<<< errors test is good >>>")
+
+
+if __name__ == "__main__":
+    random_operations_test()
+    errors_test()
@@ -0,0 +1,23 @@
+""" Queues: FIFO queues via ring buffer, linked list and stacks, a deque,
+blocking bounded queues for threads and asyncio, a shared memory queue
+between processes, and sliding window minimum/maximum.
+
+Usage:
+from data_structures.queues import Queue  # queue_via_ring_buffer.py
+from data_structures.queues.queue_via_stacks import Queue
+"""
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, globals(), {
+    "Queue": "queue_via_ring_buffer",
+    "Deque": "deque_via_ring_buffer",
+    "BoundedQueue": "bounded_queue",
+    "AsyncBoundedQueue": "async_bounded_queue",
+    "Full": "bounded_queue",
+    "Empty": "bounded_queue",
+    "SharedMemoryQueue": "shared_memory_queue",
+    "SlidingWindowMin": "sliding_window",
+    "SlidingWindowMax": "sliding_window",
+    "TimeWindowMin": "sliding_window",
+    "TimeWindowMax": "sliding_window",
+})
@@ -0,0 +1,114 @@
+""" Implementing a bounded queue for asyncio on top of the ring buffer queue,
+the coroutine sibling of bounded_queue.py. Kept in its own module, so that
+importing the thread-safe queue doesn't import asyncio.
+
+Coroutines putting elements wait while the queue is full, coroutines getting
+elements wait while it's empty. get_many takes a whole batch of elements at
+once.
+
+Usage:
+q = AsyncBoundedQueue(maxsize=1024)  # maxsize <= 0 means the queue is unbounded
+await q.put(x)  # waits while the queue is full
+await q.put(x, timeout=1.0)  # raises Full if there's still no room after 1 second
+await q.get(timeout=None)
+await q.get_many(64, timeout=None)  # returns a list of 1 to 64 elements, raises Empty on timeout
+"""
+import asyncio
+from .bounded_queue import Empty, Full
+from .queue_via_ring_buffer import Queue
+
+
+class AsyncBoundedQueue:
+    """ Bounded queue for coroutines running in the same event loop. Not
+    thread-safe, use BoundedQueue to hand elements between threads.
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.items = Queue()
+        self.lock = self.not_empty = self.not_full = None  # made by _conditions
+
+    def _conditions(self):
+        """ Creates the lock and conditions on first use. Python < 3.10 binds
+        them to the event loop running when they're made, so making them in
+        __init__ breaks queues built before asyncio.run().
+        """
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+            self.not_empty = asyncio.Condition(self.lock)
+            self.not_full = asyncio.Condition(self.lock)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(maxsize={self.maxsize}, size={len(self)})"
+
+    def _has_room(self):
+        return self.maxsize <= 0 or len(self.items) < self.maxsize
+
+    def _has_items(self):
+        return len(self.items) > 0
+
+    def empty(self):
+        """ Returns True if queue is empty, False otherwise.
+        """
+        return len(self.items) == 0
+
+    async def put(self, x, timeout=None):
+        """ Adds element x to the queue, waits for a free slot if the queue is
+        full. Raises Full if there's no room after timeout seconds.
+        """
+        self._conditions()
+        async with self.not_full:
+            if not self._has_room():
+                try:
+                    await asyncio.wait_for(self.not_full.wait_for(self._has_room), timeout)
+                except asyncio.TimeoutError:
+                    raise Full("Queue is full.") from None
+            self.items.enqueue(x)
+            self.not_empty.notify()
+
+    async def get(self, timeout=None):
+        """ Removes the 1st element from the queue and returns it, waits for an
+        element if the queue is empty. Raises Empty if there's no element after
+        timeout seconds.
+        """
+        return (await self.get_many(1, timeout))[0]
+
+    async def get_many(self, max_n, timeout=None):
+        """ Removes up to max_n elements from the queue and returns them as a
+        list. Waits until there's at least one element, raises Empty if there's
+        none after timeout seconds. Raises ValueError if max_n is less than 1.
+        """
+        if max_n < 1:
+            raise ValueError(f"max_n must be at least 1, got {max_n}.")
+        self._conditions()
+        async with self.not_empty:
+            if not self._has_items():
+                try:
+                    await asyncio.wait_for(self.not_empty.wait_for(self._has_items), timeout)
+                except asyncio.TimeoutError:
+                    raise Empty("Queue is empty.") from None
+            removed = self.items.dequeue_many(max_n)
+            self.not_full.notify(len(removed))
+            return removed
+
+
+if __name__ == "__main__":
+    async def main():
+        q = AsyncBoundedQueue(maxsize=2)
+
+        async def produce():
+            for n in range(5):
+                await q.put(n)  # waits while the consumer is behind
+
+        task = asyncio.create_task(produce())
+        print(f"received: {[await q.get() for n in range(5)]}")
+        await task
+        try:
+            await q.get(timeout=0.01)
+        except Empty:
+            print("queue is empty")
+
+    asyncio.run(main())
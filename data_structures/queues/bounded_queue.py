@@ -0,0 +1,120 @@
+""" Implementing a thread-safe bounded blocking queue on top of the ring
+buffer queue. Its asyncio sibling is in async_bounded_queue.py.
+https://en.wikipedia.org/wiki/Producer%E2%80%93consumer_problem
+
+Producers block while the queue is full, consumers block while it's empty.
+get_many takes a whole batch of elements under a single lock acquisition,
+so consumers pay for locking and waking up once per batch instead of once
+per element.
+
+Usage:
+q = BoundedQueue(maxsize=1024)  # maxsize <= 0 means the queue is unbounded
+q.put(x)  # blocks while the queue is full
+q.put(x, timeout=1.0)  # raises Full if there's still no room after 1 second
+q.put(x, block=False)  # raises Full right away if there's no room
+q.get()  # blocks while the queue is empty, same block and timeout arguments
+q.get_many(64, timeout=1.0)  # returns a list of 1 to 64 elements, raises Empty on timeout
+"""
+import threading
+from .queue_via_ring_buffer import Queue
+
+
+class Full(Exception):
+    """ Raised when there's no room in the queue in time.
+    """
+
+
+class Empty(Exception):
+    """ Raised when there're no elements in the queue in time.
+    """
+
+
+class BoundedQueue:
+    """ Thread-safe bounded blocking queue.
+    """
+
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.items = Queue()
+        self.lock = threading.Lock()
+        # both conditions share the lock, so the state is guarded by one lock
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.items)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(maxsize={self.maxsize}, size={len(self)})"
+
+    def _has_room(self):
+        return self.maxsize <= 0 or len(self.items) < self.maxsize
+
+    def _has_items(self):
+        return len(self.items) > 0
+
+    def empty(self):
+        """ Returns True if queue is empty, False otherwise. The answer might be
+        outdated by the time it's used.
+        """
+        return len(self) == 0
+
+    def put(self, x, block=True, timeout=None):
+        """ Adds element x to the queue, waits for a free slot if the queue is
+        full. Raises Full if there's no room when block is False or after
+        timeout seconds.
+        """
+        with self.not_full:
+            if not self._has_room():
+                if not block or not self.not_full.wait_for(self._has_room, timeout):
+                    raise Full("Queue is full.")
+            self.items.enqueue(x)
+            self.not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """ Removes the 1st element from the queue and returns it, waits for an
+        element if the queue is empty. Raises Empty if there's no element when
+        block is False or after timeout seconds.
+        """
+        with self.not_empty:
+            if not self._has_items():
+                if not block or not self.not_empty.wait_for(self._has_items, timeout):
+                    raise Empty("Queue is empty.")
+            removed = self.items.dequeue()
+            self.not_full.notify()
+            return removed
+
+    def get_many(self, max_n, timeout=None):
+        """ Removes up to max_n elements from the queue and returns them as a
+        list. Waits until there's at least one element, raises Empty if there's
+        none after timeout seconds. Raises ValueError if max_n is less than 1.
+        """
+        if max_n < 1:
+            raise ValueError(f"max_n must be at least 1, got {max_n}.")
+        with self.not_empty:
+            if not self.not_empty.wait_for(self._has_items, timeout):
+                raise Empty("Queue is empty.")
+            removed = self.items.dequeue_many(max_n)
+            self.not_full.notify(len(removed))
+            return removed
+
+
+if __name__ == "__main__":
+    q = BoundedQueue(maxsize=4)
+
+    def produce():
+        for n in range(10):
+            q.put(n)  # blocks while the consumer is behind
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    received = []
+    while len(received) < 10:
+        received.extend(q.get_many(3))
+    producer.join()
+    print(f"received: {received}")
+    try:
+        q.get(timeout=0.01)
+    except Empty:
+        print("queue is empty")
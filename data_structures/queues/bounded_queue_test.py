@@ -0,0 +1,132 @@
+""" Testing bounded_queue.py and async_bounded_queue.py.
+"""
+import asyncio
+import threading
+import time
+from data_structures.queues.bounded_queue import BoundedQueue, Empty, Full
+from data_structures.queues.async_bounded_queue import AsyncBoundedQueue
+
+
+def blocking_test():
+    """ Tests that a producer blocks on a full queue until consumers make
+    room, and every element arrives once, in order.
+    """
+    q = BoundedQueue(maxsize=3)
+    n = 2000
+
+    def produce():
+        for x in range(n):
+            q.put(x)
+            assert len(q) <= 3
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    received = []
+    while len(received) < n:
+        if len(received) % 2:
+            received.extend(q.get_many(5, timeout=10))
+        else:
+            received.append(q.get(timeout=10))
+    producer.join()
+    assert received == list(range(n)) and q.empty()
+    print("<<< blocking test is good >>>")
+
+
+def timeout_test():
+    """ Tests that put and get raise Full and Empty without blocking or after
+    the timeout.
+    """
+    q = BoundedQueue(maxsize=1)
+    for get in (lambda: q.get(block=False), lambda: q.get(timeout=0.01),
+                lambda: q.get_many(4, timeout=0.01)):
+        start = time.monotonic()
+        try:
+            get()
+            flag = True
+        except Empty:
+            flag = False
+        assert not flag and time.monotonic() - start < 5
+    q.put(1)
+    for put in (lambda: q.put(2, block=False), lambda: q.put(2, timeout=0.01)):
+        try:
+            put()
+            flag = True
+        except Full:
+            flag = False
+        assert not flag
+    assert q.get() == 1
+    print("<<< timeout test is good >>>")
+
+
+def get_many_test():
+    """ Tests that get_many takes up to max_n elements at once, waits for the
+    first one, and rejects max_n < 1.
+    """
+    q = BoundedQueue()
+    for x in range(10):
+        q.put(x)
+    assert q.get_many(4) == [0, 1, 2, 3]
+    assert q.get_many(100) == [4, 5, 6, 7, 8, 9]
+    timer = threading.Timer(0.05, q.put, args=("late",))
+    timer.start()
+    assert q.get_many(10, timeout=10) == ["late"]  # waits for the 1st element
+    timer.join()
+    q.put(1)
+    for max_n in (0, -1):
+        try:
+            q.get_many(max_n)
+            flag = True
+        except ValueError:
+            flag = False
+        assert not flag
+    assert len(q) == 1
+    print("<<< get many test is good >>>")
+
+
+def async_queue_test():
+    """ Tests AsyncBoundedQueue with a producer and a batch consumer.
+    """
+    async def run():
+        q = AsyncBoundedQueue(maxsize=3)
+
+        async def produce():
+            for x in range(100):
+                await q.put(x)
+
+        producer = asyncio.create_task(produce())
+        received = []
+        while len(received) < 100:
+            received.extend(await q.get_many(7, timeout=10))
+        await producer
+        assert received == list(range(100))
+        try:
+            await q.get_many(1, timeout=0.01)
+            flag = True
+        except Empty:
+            flag = False
+        assert not flag
+        try:
+            await q.get_many(0)
+            flag = True
+        except ValueError:
+            flag = False
+        assert not flag
+
+    asyncio.run(run())
+    q = AsyncBoundedQueue(maxsize=1)  # built outside of the event loop
+
+    async def run_outside():
+        getter = asyncio.create_task(q.get(timeout=10))
+        await q.put(1)
+        await q.put(2)
+        assert await getter == 1 and await q.get() == 2
+
+    asyncio.run(run_outside())
+    print("<<< async queue test is good >>>")
+
+
+if __name__ == "__main__":
+    blocking_test()
+    timeout_test()
+    get_many_test()
+    async_queue_test()
@@ -0,0 +1,96 @@
+""" Implementing double-ended queue (deque) using a ring buffer.
+https://en.wikipedia.org/wiki/Double-ended_queue
+
+Extends queue_via_ring_buffer.Queue: besides adding to the back and removing
+from the front, elements can be added to the front and removed from the back.
+All operations at both ends are O(1) worst case between resizes.
+
+API naming follows the linked lists of this repository.
+
+Usage:
+d = Deque()  # initializes an empty deque
+d.push_front(x), d.push_back(x)  # adds element x to the front/back
+d.pop_front(), d.pop_back()  # removes an element from the front/back and returns it
+d.top_front(), d.top_back()  # returns an element from the front/back
+d[i]  # returns i-th element counting from the front, O(1)
+len(d)  # number of elements in the deque
+"""
+from .queue_via_ring_buffer import Queue
+
+
+class Deque(Queue):
+    def __iter__(self):
+        items, mask = self.items, self.mask
+        for i in range(self.head, self.head + self.size):
+            yield items[i & mask]
+
+    def __getitem__(self, i):
+        """ Returns i-th element counting from the front, negative i counts
+        from the back. Time complexity: O(1).
+        """
+        if i < 0:
+            i += self.size
+        if i < 0 or i >= self.size:
+            raise IndexError("Deque index out of range.")
+        return self.items[(self.head + i) & self.mask]
+
+    def push_back(self, element):
+        """ Adds element to the back of the deque. Time complexity: O(1) amortized.
+        """
+        self.enqueue(element)
+
+    def pop_front(self):
+        """ Removes an element from the front of the deque and returns it.
+        Time complexity: O(1) amortized.
+        """
+        return self.dequeue()
+
+    def push_front(self, element):
+        """ Adds element to the front of the deque. Time complexity: O(1) amortized.
+        """
+        if self.size == len(self.items):  # buffer is full
+            self._resize(2 * len(self.items))
+        self.head = (self.head - 1) & self.mask
+        self.items[self.head] = element
+        self.size += 1
+
+    def pop_back(self):
+        """ Removes an element from the back of the deque and returns it.
+        Time complexity: O(1) amortized.
+        """
+        if self.size == 0:
+            raise Exception("Cannot pop an element from an empty deque.")
+        self.size -= 1
+        tail = (self.head + self.size) & self.mask
+        removed = self.items[tail]
+        self.items[tail] = None  # don't keep a reference to removed element
+        if self.size <= len(self.items) // 4:
+            self._shrink()
+        return removed
+
+    def top_front(self):
+        """ Returns an element from the front of the deque. Time complexity: O(1).
+        """
+        if self.size == 0:
+            raise Exception("Cannot get an element of an empty deque.")
+        return self.items[self.head]
+
+    def top_back(self):
+        """ Returns an element from the back of the deque. Time complexity: O(1).
+        """
+        if self.size == 0:
+            raise Exception("Cannot get an element of an empty deque.")
+        return self.items[(self.head + self.size - 1) & self.mask]
+
+
+if __name__ == "__main__":
+    d = Deque()
+    for n in range(1, 4):
+        print(f"push front...{n}")
+        d.push_front(n)
+        print(f"push back...{-n}")
+        d.push_back(-n)
+    print(f"deque: {list(d)}")
+    print(f"pop front...{d.pop_front()}")
+    print(f"pop back...{d.pop_back()}")
+    print(f"front: {d.top_front()}, back: {d.top_back()}, size: {len(d)}")
@@ -0,0 +1,147 @@
+""" Implementing queue using a ring buffer, i.e. a preallocated array whose
+indices wrap around. No node is allocated per element.
+https://en.wikipedia.org/wiki/Circular_buffer
+
+Capacity is always a power of two, so wrapping an index is a bitwise and with
+capacity - 1. The buffer doubles once it's full and halves once it's at most a
+quarter full, so enqueue and dequeue are O(1) worst case between resizes and
+O(1) amortized overall.
+
+Usage:
+q = Queue()  # initializes an empty queue
+q.enqueue(x)  # adds element x to the end of the queue
+q.dequeue()  # removes the 1st element from the queue and returns it
+q.peek()  # returns the 1st element without removing it
+q.enqueue_many(iterable)  # adds all elements of iterable
+q.dequeue_many(k)  # removes up to k elements and returns them as a list
+len(q)  # number of elements in the queue
+"""
+
+MIN_CAPACITY = 8
+
+
+class Queue:
+    def __init__(self, capacity=MIN_CAPACITY):
+        capacity = max(MIN_CAPACITY, 1 << (capacity - 1).bit_length())
+        self.items = [None] * capacity
+        self.mask = capacity - 1  # index & mask wraps index around the buffer
+        self.head = 0  # index of the 1st element
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._ordered()})"
+
+    def empty(self):
+        """ Returns True if queue is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def _ordered(self):
+        """ Returns a list of elements of the queue from the 1st to the last.
+        """
+        end = self.head + self.size
+        if end <= len(self.items):
+            return self.items[self.head:end]
+        return self.items[self.head:] + self.items[:end & self.mask]
+
+    def _resize(self, capacity):
+        """ Moves elements to a new buffer of the given capacity.
+        Time complexity: O(n).
+        """
+        self.items = self._ordered() + [None] * (capacity - self.size)
+        self.mask = capacity - 1
+        self.head = 0
+
+    def _shrink(self):
+        """ Halves the buffer while it's at most a quarter full.
+        """
+        capacity = len(self.items)
+        while capacity > MIN_CAPACITY and self.size <= capacity // 4:
+            capacity //= 2
+        if capacity != len(self.items):
+            self._resize(capacity)
+
+    def enqueue(self, element):
+        """ Adds element to the end of the queue.
+        Time complexity: O(1) amortized.
+        """
+        if self.size == len(self.items):  # buffer is full
+            self._resize(2 * len(self.items))
+        self.items[(self.head + self.size) & self.mask] = element
+        self.size += 1
+
+    def dequeue(self):
+        """ Removes the 1st element from the queue and returns it.
+        Time complexity: O(1) amortized.
+        """
+        if self.size == 0:
+            raise Exception("Cannot dequeue from an empty queue.")
+        removed = self.items[self.head]
+        self.items[self.head] = None  # don't keep a reference to removed element
+        self.head = (self.head + 1) & self.mask
+        self.size -= 1
+        if self.size <= len(self.items) // 4:
+            self._shrink()
+        return removed
+
+    def peek(self):
+        """ Returns the 1st element of the queue without removing it.
+        Time complexity: O(1).
+        """
+        if self.size == 0:
+            raise Exception("Cannot peek into an empty queue.")
+        return self.items[self.head]
+
+    def enqueue_many(self, iterable):
+        """ Adds all elements of iterable to the end of the queue with at most
+        one resize and two slice assignments.
+        Time complexity: O(k), k is a number of added elements.
+        """
+        elements = list(iterable)
+        k = len(elements)
+        capacity = len(self.items)
+        if self.size + k > capacity:
+            while self.size + k > capacity:
+                capacity *= 2
+            self._resize(capacity)
+        tail = (self.head + self.size) & self.mask
+        first = min(k, capacity - tail)  # elements that fit before wrapping
+        self.items[tail:tail + first] = elements[:first]
+        self.items[:k - first] = elements[first:]
+        self.size += k
+
+    def dequeue_many(self, k):
+        """ Removes up to k elements from the queue and returns them as a list.
+        Time complexity: O(k).
+        """
+        k = min(k, self.size)
+        capacity = len(self.items)
+        end = self.head + k
+        if end <= capacity:
+            removed = self.items[self.head:end]
+            self.items[self.head:end] = [None] * k
+        else:
+            removed = self.items[self.head:] + self.items[:end - capacity]
+            self.items[self.head:] = [None] * (capacity - self.head)
+            self.items[:end - capacity] = [None] * (end - capacity)
+        self.head = end & self.mask
+        self.size -= k
+        self._shrink()
+        return removed
+
+
+if __name__ == "__main__":
+    q = Queue()
+    print(f"Is queue empty? {q.empty()}")
+    print(f"Enqueue a few integers...")
+    q.enqueue_many(range(1, 11))
+    print(f"Is queue empty? {q.empty()}, size: {len(q)}")
+    print(f"dequeue {q.dequeue()}")
+    print(f"peek {q.peek()}")
+    print(f"dequeue many {q.dequeue_many(5)}")
+    while not q.empty():
+        print(f"dequeue {q.dequeue()}")
+    print(f"Is queue empty? {q.empty()}")
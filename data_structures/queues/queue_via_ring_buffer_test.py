@@ -0,0 +1,76 @@
+""" Testing queue_via_ring_buffer.py and the empty queue of queue_via_stacks.py.
+"""
+import random
+from collections import deque
+from data_structures.queues import queue_via_stacks
+from data_structures.queues.queue_via_ring_buffer import Queue, MIN_CAPACITY
+
+
+def buffer_is_valid(q):
+    """ Returns True if capacity is a power of two of at least MIN_CAPACITY
+    and slots outside of the queue hold no references.
+    """
+    capacity = len(q.items)
+    assert capacity >= MIN_CAPACITY and capacity & (capacity - 1) == 0
+    assert q.mask == capacity - 1
+    live = {(q.head + i) & q.mask for i in range(q.size)}
+    assert all(q.items[i] is None for i in range(capacity) if i not in live)
+    return True
+
+
+def random_operations_test():
+    """ Tests Queue against deque with single and bulk operations, the queue
+    grows and shrinks many times.
+    """
+    q, reference = Queue(), deque()
+    for i in range(3000):
+        operation = random.randrange(4)
+        if operation == 0:
+            q.enqueue(i)
+            reference.append(i)
+        elif operation == 1:
+            data = list(range(i, i + random.randrange(40)))
+            q.enqueue_many(iter(data))
+            reference.extend(data)
+        elif operation == 2 and reference:
+            assert q.peek() == reference[0]
+            assert q.dequeue() == reference.popleft()
+        elif operation == 3:
+            k = random.randrange(60)
+            assert q.dequeue_many(k) == [reference.popleft() for j in range(min(k, len(reference)))]
+        assert len(q) == len(reference) and q.empty() == (not reference)
+        assert q._ordered() == list(reference)
+        assert buffer_is_valid(q)
+    print("<<< random operations test is good >>>")
+
+
+def capacity_test():
+    """ Tests that the buffer grows to powers of two and shrinks back once
+    the queue drains.
+    """
+    q = Queue(capacity=100)
+    assert len(q.items) == 128
+    q.enqueue_many(range(1000))
+    assert len(q.items) == 1024
+    assert q.dequeue_many(1000) == list(range(1000))
+    assert len(q.items) == MIN_CAPACITY
+    print("<<< capacity test is good >>>")
+
+
+def empty_test():
+    """ Tests that both queues raise an error on an empty queue.
+    """
+    for operation in (Queue().dequeue, Queue().peek, queue_via_stacks.Queue().dequeue):
+        try:
+            operation()
+            assert False
+        except Exception as e:
+            assert "empty queue" in str(e)
+    assert Queue().dequeue_many(5) == []
+    print("<<< empty test is good >>>")
+
+
+if __name__ == "__main__":
+    random_operations_test()
+    capacity_test()
+    empty_test()
@@ -40,7 +40,7 @@ class Queue:
         """ Removes an element from the queue.
         Amortized time complexity: O(1).
         """
-        if queue.empty():
+        if self.empty():
             raise Exception("Cannot dequeue from an empty queue.")
 
         if self.pop_stack.empty():
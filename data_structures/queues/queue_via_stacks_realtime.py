@@ -0,0 +1,123 @@
+""" Implementing real-time queue using stacks, i.e. queue with worst case O(1)
+enqueue and dequeue. Inspired by Hood-Melville queue and Okasaki's real-time
+queue, see "Purely Functional Data Structures" by Chris Okasaki.
+
+queue_via_stacks.Queue moves the whole push stack into the pop stack at once,
+so a single dequeue after a burst of n enqueues takes O(n) time. Here the
+elements are kept in two stacks as well, front for dequeue and back for
+enqueue, but once back grows longer than front a rotation starts: a new front
+stack is built from the elements of back reversed, placed below the elements
+of front. Every operation performs a constant number of rotation steps, and
+the rotation is finished before front runs out of elements.
+
+Python lists are used as stacks, the top of a stack is the end of a list.
+While the rotation copies front, dequeues still pop from front, so elements
+copied earlier might become stale. They're always on top of the new stack and
+get removed by the following rotation steps.
+
+Usage:
+q = Queue()  # initializes an empty queue
+q.enqueue(x)  # adds element x to the queue, worst case O(1)
+q.dequeue()  # removes the 1st element from the queue and returns it, worst case O(1)
+q.peek()  # returns the 1st element of the queue without removing it
+len(q)  # number of elements in the queue
+"""
+
+STEPS = 4  # rotation steps per operation, enough to finish before front is empty
+
+
+class Queue:
+    def __init__(self):
+        self.front = []  # stack for dequeue, top is the 1st element of the queue
+        self.back = []  # stack for enqueue, top is the last element of the queue
+        self.size = 0
+        # state of the rotation, rotating is False when there's no rotation
+        self.rotating = False
+        self.old_back = None  # back stack being reversed onto the new front
+        self.new_front = None  # new front stack being built
+        self.copied = 0  # number of elements of front copied to new front
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={self.size})"
+
+    def empty(self):
+        """ Returns True if queue is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def _start_rotation(self):
+        """ Starts a rotation if back has become longer than front.
+        """
+        if not self.rotating and len(self.back) > len(self.front):
+            self.rotating = True
+            self.old_back, self.back = self.back, []
+            self.new_front = []
+            self.copied = 0
+
+    def _step(self):
+        """ Performs up to STEPS steps of the rotation. Time complexity: O(1).
+        """
+        for i in range(STEPS):
+            if not self.rotating:
+                return
+            if self.old_back:  # 1st phase: reverse old back
+                self.new_front.append(self.old_back.pop())
+            elif self.copied > len(self.front):  # drop an element dequeued after copying
+                self.new_front.pop()
+                self.copied -= 1
+            elif self.copied < len(self.front):  # 2nd phase: copy front, bottom first
+                self.new_front.append(self.front[self.copied])
+                self.copied += 1
+            if not self.old_back and self.copied == len(self.front):  # done
+                self.front = self.new_front
+                self.rotating = False
+                self.old_back = self.new_front = None
+                self._start_rotation()
+
+    def enqueue(self, x):
+        """ Adds element x to the queue. Time complexity: O(1).
+        """
+        self.back.append(x)
+        self.size += 1
+        self._start_rotation()
+        self._step()
+
+    def dequeue(self):
+        """ Removes the 1st element from the queue and returns it.
+        Time complexity: O(1).
+        """
+        if self.size == 0:
+            raise Exception("Cannot dequeue from an empty queue.")
+
+        self._step()
+        removed = self.front.pop()
+        self.size -= 1
+        self._start_rotation()
+        return removed
+
+    def peek(self):
+        """ Returns the 1st element of the queue without removing it. Steps
+        the rotation like dequeue does, front might have run out right
+        before the rotation finishes. Time complexity: O(1).
+        """
+        if self.size == 0:
+            raise Exception("Cannot peek into an empty queue.")
+        self._step()
+        return self.front[-1]
+
+
+if __name__ == "__main__":
+    queue = Queue()
+    print(f"Is queue empty? {queue.empty()}")
+
+    for n in range(1, 6):
+        print(f"Enqueue...{n}")
+        queue.enqueue(n)
+    print(f"Is queue empty? {queue.empty()}")
+
+    while not queue.empty():
+        print(f"Dequeue... {queue.dequeue()}")
+    print(f"Is queue empty? {queue.empty()}")
@@ -0,0 +1,62 @@
+""" Testing queue_via_stacks_realtime.py.
+"""
+import random
+from collections import deque
+from data_structures.queues.queue_via_stacks_realtime import Queue
+
+
+def peek_test():
+    """ Tests peek right after a dequeue that empties front mid-rotation.
+    """
+    queue = Queue()
+    queue.enqueue(1)
+    queue.enqueue(2)
+    assert queue.dequeue() == 1
+    assert queue.peek() == 2 and len(queue) == 1
+    assert queue.dequeue() == 2 and queue.empty()
+    print("<<< peek test is good >>>")
+
+
+def random_operations_test():
+    """ Tests enqueue, dequeue and peek against collections.deque, in bursts
+    of random length that mostly enqueue or mostly dequeue, so the queue
+    often runs close to empty.
+    """
+    queue, reference = Queue(), deque()
+    for i in range(2000):
+        enqueues = random.random() * 2 / 3  # share of enqueues, 1/3 on average like dequeues
+        for j in range(random.randrange(20)):
+            operation = random.random()
+            if operation < enqueues:
+                queue.enqueue(i * 100 + j)
+                reference.append(i * 100 + j)
+            elif reference and random.random() < 0.5:
+                assert queue.dequeue() == reference.popleft()
+            elif reference:
+                assert queue.peek() == reference[0]
+            assert len(queue) == len(reference)
+    while reference:
+        assert queue.peek() == reference[0]
+        assert queue.dequeue() == reference.popleft()
+    assert queue.empty()
+    print("<<< random operations test is good >>>")
+
+
+def empty_test():
+    """ Tests that dequeue and peek on an empty queue raise an exception.
+    """
+    queue = Queue()
+    for operation in (queue.dequeue, queue.peek):
+        try:
+            operation()
+            raised = False
+        except Exception:
+            raised = True
+        assert raised
+    print("<<< empty test is good >>>")
+
+
+if __name__ == "__main__":
+    peek_test()
+    random_operations_test()
+    empty_test()
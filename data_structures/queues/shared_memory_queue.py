@@ -0,0 +1,223 @@
+""" Implementing single-producer/single-consumer queue of fixed-size records
+in shared memory, for handing data between processes without pickling.
+https://en.wikipedia.org/wiki/Circular_buffer
+
+The whole queue lives in one multiprocessing.shared_memory block:
+- header: capacity and record size, so another process can attach by name
+- head: number of records dequeued so far, written only by the consumer
+- tail: number of records enqueued so far, written only by the producer
+- ring buffer of capacity records of record_size bytes each
+
+Head and tail sit on separate cache lines and only grow, a record lives in
+slot counter & (capacity - 1). The producer writes a record and only then
+publishes the new tail, the consumer reads a record and only then publishes
+the new head, so no lock and no system call is needed. This relies on aligned
+64-bit stores being atomic and not reordered with earlier stores, which holds
+on x86-64. There must be at most one producer and one consumer at a time.
+
+Usage:
+q = SharedMemoryQueue.create(record_size=64, capacity=1024)  # in one process
+q = SharedMemoryQueue.attach(name)  # in another process, name is q.name
+q.enqueue(record)  # spins while the queue is full, len(record) == record_size
+q.try_enqueue(record)  # returns False right away if the queue is full
+q.dequeue()  # spins while the queue is empty, returns a copy of the record as bytes
+q.try_dequeue()  # returns None right away if the queue is empty
+view = q.peek()  # zero-copy memoryview of the 1st record, None if empty
+q.advance()  # removes the 1st record once the view isn't needed anymore
+view = q.reserve()  # zero-copy writable memoryview of the next free slot
+q.commit()  # publishes the record written to the reserved slot
+q.close()  # every process closes its handle, all views must be released first
+q.unlink()  # the creator frees the shared memory
+"""
+import multiprocessing
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+CACHE_LINE = 64  # bytes
+CAPACITY, RECORD_SIZE = 0, 1  # indices of header fields in the array of counters
+HEAD = CACHE_LINE // 8  # index of head counter, on its own cache line
+TAIL = 2 * CACHE_LINE // 8  # index of tail counter, on its own cache line
+DATA = 3 * CACHE_LINE  # offset of the ring buffer in bytes
+
+
+class SharedMemoryQueue:
+    def __init__(self, shm):
+        """ Wraps a shared memory block that already holds a queue, use create
+        or attach instead of calling it directly.
+        """
+        self.shm = shm
+        self.name = shm.name
+        self.counters = shm.buf[:DATA].cast("Q")  # 64-bit unsigned integers
+        self.capacity = self.counters[CAPACITY]
+        self.record_size = self.counters[RECORD_SIZE]
+        self.mask = self.capacity - 1
+        self.data = shm.buf[DATA:DATA + self.capacity * self.record_size]
+
+    @classmethod
+    def create(cls, record_size, capacity=1024):
+        """ Creates a new queue in a new shared memory block. Capacity is
+        rounded up to a power of two.
+        """
+        if record_size < 1:
+            raise Exception("Record size must be positive.")
+        capacity = 1 << (max(capacity, 1) - 1).bit_length()
+        shm = shared_memory.SharedMemory(create=True, size=DATA + capacity * record_size)
+        counters = shm.buf[:DATA].cast("Q")
+        counters[CAPACITY] = capacity
+        counters[RECORD_SIZE] = record_size
+        counters[HEAD] = counters[TAIL] = 0
+        counters.release()
+        return cls(shm)
+
+    @classmethod
+    def attach(cls, name):
+        """ Attaches to a queue created by another process.
+        """
+        try:  # Python 3.13+ lets the creator alone track the block
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+            # children started by multiprocessing share the resource tracker of
+            # the creator, any other process would unlink the block on exit
+            if multiprocessing.parent_process() is None:
+                resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm)
+
+    def __len__(self):
+        return self.counters[TAIL] - self.counters[HEAD]
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(name={self.name!r}, capacity={self.capacity}, "
+                f"record_size={self.record_size}, size={len(self)})")
+
+    def empty(self):
+        """ Returns True if queue is empty, False otherwise.
+        """
+        return self.counters[TAIL] == self.counters[HEAD]
+
+    def _slot(self, counter):
+        """ Returns memoryview of the slot of a record with the given counter.
+        """
+        start = (counter & self.mask) * self.record_size
+        return self.data[start:start + self.record_size]
+
+    def reserve(self):
+        """ Returns a writable memoryview of the next free slot, None if the
+        queue is full. The record becomes visible to the consumer on commit.
+        Producer only. Time complexity: O(1).
+        """
+        tail = self.counters[TAIL]
+        if tail - self.counters[HEAD] == self.capacity:
+            return None
+        return self._slot(tail)
+
+    def commit(self):
+        """ Publishes the record written into the slot returned by reserve.
+        Producer only. Time complexity: O(1).
+        """
+        self.counters[TAIL] += 1  # only the producer writes tail
+
+    def try_enqueue(self, record):
+        """ Copies record into the queue. Returns False if the queue is full.
+        Producer only. Time complexity: O(record_size).
+        """
+        if len(record) != self.record_size:
+            raise Exception(f"Record must be exactly {self.record_size} bytes long.")
+        slot = self.reserve()
+        if slot is None:
+            return False
+        slot[:] = record
+        self.commit()
+        return True
+
+    def enqueue(self, record):
+        """ Copies record into the queue, spins while the queue is full.
+        Producer only.
+        """
+        while not self.try_enqueue(record):
+            time.sleep(0)  # let the consumer run
+
+    def peek(self):
+        """ Returns a read-only memoryview of the 1st record without copying it,
+        None if the queue is empty. The slot can be overwritten once advance is
+        called. Consumer only. Time complexity: O(1).
+        """
+        head = self.counters[HEAD]
+        if head == self.counters[TAIL]:
+            return None
+        return self._slot(head).toreadonly()
+
+    def advance(self):
+        """ Removes the 1st record, its slot is handed back to the producer.
+        Consumer only. Time complexity: O(1).
+        """
+        if self.empty():
+            raise Exception("Cannot dequeue from an empty queue.")
+        self.counters[HEAD] += 1  # only the consumer writes head
+
+    def try_dequeue(self):
+        """ Removes the 1st record from the queue and returns a copy of it as
+        bytes, None if the queue is empty. Consumer only.
+        Time complexity: O(record_size).
+        """
+        view = self.peek()
+        if view is None:
+            return None
+        record = bytes(view)
+        view.release()
+        self.advance()
+        return record
+
+    def dequeue(self):
+        """ Removes the 1st record from the queue and returns a copy of it as
+        bytes, spins while the queue is empty. Consumer only.
+        """
+        record = self.try_dequeue()
+        while record is None:
+            time.sleep(0)  # let the producer run
+            record = self.try_dequeue()
+        return record
+
+    def close(self):
+        """ Closes this process' handle of the shared memory. Views returned by
+        peek and reserve must be released before.
+        """
+        self.counters.release()
+        self.data.release()
+        self.shm.close()
+
+    def unlink(self):
+        """ Frees the shared memory, call it once in the creating process.
+        """
+        self.shm.unlink()
+
+
+def consume(name, n):
+    """ Dequeues n records in a child process, used by the example below.
+    """
+    q = SharedMemoryQueue.attach(name)
+    view = q.peek()
+    while view is None:
+        view = q.peek()
+    print(f"peek without copying: {int.from_bytes(view, 'little')}")
+    view.release()
+    q.advance()
+    for i in range(n - 1):
+        print(f"dequeue {int.from_bytes(q.dequeue(), 'little')}")
+    q.close()
+
+
+if __name__ == "__main__":
+    q = SharedMemoryQueue.create(record_size=8, capacity=4)
+    print(q)
+    for n in range(4):
+        print(f"enqueue {n}: {q.try_enqueue(n.to_bytes(8, 'little'))}")
+    print(f"enqueue 4 into a full queue: {q.try_enqueue((4).to_bytes(8, 'little'))}")
+
+    consumer = multiprocessing.Process(target=consume, args=(q.name, 6))
+    consumer.start()
+    for n in range(4, 6):
+        q.enqueue(n.to_bytes(8, "little"))  # spins until the consumer makes room
+    consumer.join()
+    q.close()
+    q.unlink()
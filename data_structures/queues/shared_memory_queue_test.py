@@ -0,0 +1,87 @@
+""" Testing shared_memory_queue.py.
+"""
+import multiprocessing
+from data_structures.queues.shared_memory_queue import SharedMemoryQueue
+
+
+def record(n):
+    return n.to_bytes(8, "little")
+
+
+def produce(name, n):
+    """ Enqueues records 0..n-1 in a child process.
+    """
+    q = SharedMemoryQueue.attach(name)
+    for i in range(n):
+        if i % 2:
+            q.enqueue(record(i))
+        else:
+            view = q.reserve()
+            while view is None:
+                view = q.reserve()
+            view[:] = record(i)
+            view.release()
+            q.commit()
+    q.close()
+
+
+def single_process_test():
+    """ Tests full and empty queue, wrapping around the ring buffer and
+    zero-copy peek and reserve in one process.
+    """
+    q = SharedMemoryQueue.create(record_size=8, capacity=3)
+    try:
+        assert q.capacity == 4 and q.empty()
+        assert q.peek() is None and q.try_dequeue() is None
+        expected = []
+        for n in range(50):  # wraps around the buffer many times
+            for i in range(n % 6):
+                added = q.try_enqueue(record(10 * n + i))
+                assert added == (len(expected) < 4)
+                if added:
+                    expected.append(10 * n + i)
+            assert len(q) == len(expected)
+            assert (q.reserve() is None) == (len(expected) == 4)
+            view = q.peek()
+            if expected:
+                assert int.from_bytes(view, "little") == expected.pop(0)
+                view.release()
+                q.advance()
+            for i in range(len(expected) // 2):
+                assert int.from_bytes(q.dequeue(), "little") == expected.pop(0)
+        while expected:
+            assert int.from_bytes(q.dequeue(), "little") == expected.pop(0)
+        for operation in (lambda: q.try_enqueue(b"short"), q.advance):  # q is empty
+            try:
+                operation()
+                flag = True
+            except Exception:
+                flag = False
+            assert not flag
+    finally:
+        q.close()
+        q.unlink()
+    print("<<< single process test is good >>>")
+
+
+def two_processes_test():
+    """ Tests a child process producing records for this one, with a small
+    queue, so both sides wait for each other.
+    """
+    q = SharedMemoryQueue.create(record_size=8, capacity=8)
+    try:
+        producer = multiprocessing.Process(target=produce, args=(q.name, 5000))
+        producer.start()
+        received = [int.from_bytes(q.dequeue(), "little") for i in range(5000)]
+        producer.join()
+        assert producer.exitcode == 0
+        assert received == list(range(5000)) and q.empty()
+    finally:
+        q.close()
+        q.unlink()
+    print("<<< two processes test is good >>>")
+
+
+if __name__ == "__main__":
+    single_process_test()
+    two_processes_test()
@@ -0,0 +1,145 @@
+""" Rolling minimum and maximum over a sliding window using a monotonic deque.
+https://en.wikipedia.org/wiki/Sliding_window_protocol
+
+The deque keeps only the candidates for the answer: elements that aren't
+dominated by a later element of the window. For the minimum the values in the
+deque are strictly increasing from front to back, so the answer is at the
+front. A new element pops all the candidates it dominates from the back, an
+element that's left the window is popped from the front. Every element is
+pushed and popped at most once, so a push takes O(1) amortized time.
+
+The window either holds the last size elements, or the elements pushed within
+the last span seconds (or any other units of the timestamps).
+
+Usage:
+w = SlidingWindowMin(size=100)  # minimum of the last 100 elements
+w = SlidingWindowMax(size=100)  # maximum of the last 100 elements
+w.push(x)  # adds element x, returns the current minimum/maximum
+w.get()  # returns the current minimum/maximum, raises an error if window is empty
+
+w = TimeWindowMin(span=60.0)  # minimum of the elements pushed in the last 60 seconds
+w = TimeWindowMax(span=60.0)
+w.push(x, timestamp)  # timestamps must not decrease, time.monotonic() if omitted
+w.get(now)  # same, evicts elements older than now - span first, now defaults to the clock
+"""
+import time
+from .deque_via_ring_buffer import Deque
+
+
+class SlidingWindowMin:
+    """ Minimum of the last size elements.
+    """
+
+    def __init__(self, size):
+        if size < 1:
+            raise Exception("Window size must be positive.")
+        self.size = size
+        self.candidates = Deque()  # (position, element), increasing elements
+        self.count = 0  # number of elements pushed so far
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={self.size})"
+
+    def dominates(self, x, y):
+        """ Returns True if later element x makes earlier element y useless.
+        """
+        return x <= y
+
+    def push(self, x):
+        """ Adds element x to the window, removes the oldest one if the window is
+        full. Returns the current answer. Time complexity: O(1) amortized.
+        """
+        candidates = self.candidates
+        while len(candidates) and self.dominates(x, candidates.top_back()[1]):
+            candidates.pop_back()
+        candidates.push_back((self.count, x))
+        self.count += 1
+        if candidates.top_front()[0] <= self.count - 1 - self.size:  # left the window
+            candidates.pop_front()
+        return candidates.top_front()[1]
+
+    def get(self):
+        """ Returns the current answer. Time complexity: O(1).
+        """
+        if self.candidates.empty():
+            raise Exception("Window is empty.")
+        return self.candidates.top_front()[1]
+
+
+class SlidingWindowMax(SlidingWindowMin):
+    """ Maximum of the last size elements.
+    """
+
+    def dominates(self, x, y):
+        return x >= y
+
+
+class TimeWindowMin:
+    """ Minimum of the elements pushed within the last span time units.
+    """
+
+    def __init__(self, span, clock=time.monotonic):
+        if span <= 0:
+            raise Exception("Window span must be positive.")
+        self.span = span
+        self.clock = clock
+        self.candidates = Deque()  # (timestamp, element), increasing elements
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(span={self.span})"
+
+    def dominates(self, x, y):
+        """ Returns True if later element x makes earlier element y useless.
+        """
+        return x <= y
+
+    def evict(self, now):
+        """ Removes elements with timestamps not greater than now - span.
+        Time complexity: O(1) amortized.
+        """
+        candidates = self.candidates
+        while len(candidates) and candidates.top_front()[0] <= now - self.span:
+            candidates.pop_front()
+
+    def push(self, x, timestamp=None):
+        """ Adds element x with timestamp, which must not be less than the
+        previous one. Returns the current answer. Time complexity: O(1) amortized.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        candidates = self.candidates
+        while len(candidates) and self.dominates(x, candidates.top_back()[1]):
+            candidates.pop_back()
+        candidates.push_back((timestamp, x))
+        self.evict(timestamp)
+        return candidates.top_front()[1]
+
+    def get(self, now=None):
+        """ Returns the current answer, raises an error if there're no elements
+        within the window. Time complexity: O(1) amortized.
+        """
+        self.evict(self.clock() if now is None else now)
+        if self.candidates.empty():
+            raise Exception("Window is empty.")
+        return self.candidates.top_front()[1]
+
+
+class TimeWindowMax(TimeWindowMin):
+    """ Maximum of the elements pushed within the last span time units.
+    """
+
+    def dominates(self, x, y):
+        return x >= y
+
+
+if __name__ == "__main__":
+    samples = [5, 3, 8, 1, 9, 2, 7, 4]
+    window_min = SlidingWindowMin(size=3)
+    window_max = SlidingWindowMax(size=3)
+    for x in samples:
+        print(f"push {x}: min = {window_min.push(x)}, max = {window_max.push(x)}")
+
+    window = TimeWindowMin(span=10)
+    for t, x in enumerate(samples):
+        window.push(x, timestamp=5 * t)
+    print(f"min within the last 10 time units at t = 35: {window.get(now=35)}")
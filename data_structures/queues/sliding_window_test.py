@@ -0,0 +1,72 @@
+""" Testing sliding_window.py.
+"""
+import random
+from data_structures.queues.sliding_window import (SlidingWindowMin, SlidingWindowMax,
+                                                   TimeWindowMin, TimeWindowMax)
+
+
+def sliding_window_test():
+    """ Tests windows of the last size elements against min and max of slices.
+    """
+    for size in (1, 2, 7, 50):
+        window_min, window_max = SlidingWindowMin(size), SlidingWindowMax(size)
+        data = []
+        for i in range(1000):
+            x = random.randrange(100)
+            data.append(x)
+            assert window_min.push(x) == min(data[-size:]) == window_min.get()
+            assert window_max.push(x) == max(data[-size:]) == window_max.get()
+    print("<<< sliding window test is good >>>")
+
+
+def time_window_test():
+    """ Tests windows of the last span time units against min and max of the
+    elements with timestamps within the span.
+    """
+    window_min, window_max = TimeWindowMin(span=10), TimeWindowMax(span=10)
+    data = []  # (timestamp, element)
+    timestamp = 0
+    for i in range(1000):
+        timestamp += random.randrange(4)
+        x = random.randrange(100)
+        data.append((timestamp, x))
+        within = [y for t, y in data if t > timestamp - 10]
+        assert window_min.push(x, timestamp) == min(within)
+        assert window_max.push(x, timestamp) == max(within)
+        now = timestamp + random.randrange(12)
+        within = [y for t, y in data if t > now - 10]
+        if within:
+            assert window_min.get(now) == min(within)
+            assert window_max.get(now) == max(within)
+            timestamp = now  # evicted elements are gone, time can't go back
+    print("<<< time window test is good >>>")
+
+
+def errors_test():
+    """ Tests that windows reject sizes and spans that aren't positive, and
+    that get raises an error on an empty window.
+    """
+    for make in (lambda: SlidingWindowMin(0), lambda: SlidingWindowMax(-1),
+                 lambda: TimeWindowMin(0), lambda: TimeWindowMax(-1.5),
+                 lambda: SlidingWindowMin(3).get(), lambda: TimeWindowMin(5).get(now=0)):
+        try:
+            make()
+            flag = True
+        except Exception:
+            flag = False
+        assert not flag
+    window = TimeWindowMin(span=5, clock=lambda: 100)
+    window.push(1, timestamp=90)  # already out of the window at time 100
+    try:
+        window.get()
+        flag = True
+    except Exception:
+        flag = False
+    assert not flag
+    print("<<< errors test is good >>>")
+
+
+if __name__ == "__main__":
+    sliding_window_test()
+    time_window_test()
+    errors_test()
@@ -0,0 +1,155 @@
+""" Compact binary snapshot format for saving structures to a file and loading
+them back, without replaying millions of inserts and without pickling the
+node graphs, which is slow and hits the recursion limit on deep structures.
+
+A snapshot is a header followed by length-prefixed sections, every section is
+one flat array of the structure, e.g. the heaplist of a heap. Integers and
+floats are stored as raw little-endian machine arrays, anything else as a
+pickled list. Everything is aligned to 8 bytes.
+
+    header:   magic b"DSSN" | version u16 | sections u16 | kind length u16 | kind
+    section:  typecode 1 byte | 7 pad bytes | payload length u64 | payload
+
+Numeric sections are loaded through a copy-on-write mmap and returned as
+memoryviews over it, without copying: pages are read from the file on first
+access, and writing to them, e.g. path compression, never changes the file.
+A memoryview has a fixed size, so structures copy it into a list the first
+time they need to grow or shrink.
+
+Usage:
+dump(path, "MinHeap", [(typecode(heaplist, start=1), heaplist)])  # writes a snapshot
+[heaplist] = load(path, "MinHeap")  # returns sections, raises an exception for another kind
+"""
+import os
+import struct
+import sys
+from array import array
+from itertools import islice
+
+MAGIC = b"DSSN"
+VERSION = 1
+HEADER = struct.Struct("<4sHHH")
+SECTION = struct.Struct("<c7xQ")
+PICKLE = "p"
+NUMERIC = "bBhHiIqQfd"  # typecodes of the same size on every platform
+INT64 = (-2**63, 2**63 - 1)
+ALIGN = 8
+
+
+def _padding(size):
+    return -size % ALIGN
+
+
+def typecode(seq, start=0):
+    """ Returns the most compact typecode seq starting at index start can be
+    stored with: "q" for integers, "d" for floats, PICKLE for anything else.
+    Time complexity: O(n).
+    """
+    kinds = set(map(type, islice(seq, start, None)))
+    if kinds <= {int}:
+        if not kinds or INT64[0] <= min(islice(seq, start, None)) and \
+                max(islice(seq, start, None)) <= INT64[1]:
+            return "q"
+    elif kinds <= {float}:
+        return "d"
+    return PICKLE
+
+
+def _encode(code, seq):
+    """ Returns payload of a section: raw little-endian array or pickled list.
+    """
+    if code == PICKLE:
+        import pickle  # imported on use, it's the slowest import here
+        return pickle.dumps(list(seq), protocol=pickle.HIGHEST_PROTOCOL)
+    if code not in NUMERIC:
+        raise Exception(f"Unsupported typecode {code!r}.")
+    if isinstance(seq, memoryview) and seq.format == code and sys.byteorder == "little":
+        return seq  # loaded from a snapshot, written as is
+    data = array(code, seq)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
+
+
+def dump(path, kind, sections):
+    """ Writes a snapshot of a structure named kind, sections is an iterable
+    of (typecode, sequence) pairs. The file is written next to path and then
+    renamed, so an existing snapshot, maybe still mapped by a loaded
+    structure, is replaced atomically. Time complexity: O(n).
+    """
+    kind = kind.encode("ascii")
+    payloads = [(code, _encode(code, seq)) for code, seq in sections]
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        header = HEADER.pack(MAGIC, VERSION, len(payloads), len(kind)) + kind
+        f.write(header + bytes(_padding(len(header))))
+        for code, payload in payloads:
+            size = memoryview(payload).nbytes
+            f.write(SECTION.pack(code.encode("ascii"), size))
+            f.write(payload)
+            f.write(bytes(_padding(size)))
+    os.replace(tmp, path)
+
+
+def _decode(code, payload):
+    """ Returns a section: memoryview over the payload for numeric
+    typecodes, list for pickled ones.
+    """
+    if code == PICKLE:
+        import pickle
+        return pickle.loads(payload)
+    if code not in NUMERIC:
+        raise Exception(f"Unsupported typecode {code!r}.")
+    if sys.byteorder == "big":  # can't be used in place, copy and swap
+        data = array(code, payload)
+        data.byteswap()
+        return memoryview(data)
+    return payload.cast(code)
+
+
+def load(path, kind):
+    """ Reads a snapshot of a structure named kind and returns the list of
+    its sections. Numeric sections aren't copied, they're memoryviews over
+    a private copy-on-write mapping of the file. Time complexity: O(1) for
+    numeric sections, O(n) for pickled ones.
+    """
+    import mmap  # imported on use, structures import this module just for dump and load
+
+    with open(path, "rb") as f:
+        buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+    if len(buffer) < HEADER.size:
+        raise Exception(f"{path} is not a snapshot.")
+    magic, version, count, length = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise Exception(f"{path} is not a snapshot.")
+    if version > VERSION:
+        raise Exception(f"Unsupported snapshot version {version}, expected at most {VERSION}.")
+    found = bytes(buffer[HEADER.size:HEADER.size + length]).decode("ascii")
+    if found != kind:
+        raise Exception(f"{path} is a snapshot of {found}, not {kind}.")
+    offset = HEADER.size + length
+    offset += _padding(offset)
+    sections = []
+    for i in range(count):
+        if offset + SECTION.size > len(buffer):
+            raise Exception(f"{path} is truncated.")
+        code, size = SECTION.unpack_from(buffer, offset)
+        offset += SECTION.size
+        if offset + size > len(buffer):
+            raise Exception(f"{path} is truncated.")
+        sections.append(_decode(code.decode("ascii"), buffer[offset:offset + size]))
+        offset += size + _padding(size)
+    return sections
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "example.snapshot")
+    dump(path, "Example", [("q", range(5)), ("d", [0.5, 1.5]), (PICKLE, ["a", None])])
+    numbers, floats, objects = load(path, "Example")
+    print(f"numbers: {numbers.tolist()}, floats: {floats.tolist()}, objects: {objects}")
+    numbers[0] = 10  # copy-on-write, the file stays as it is
+    print(f"reloaded: {load(path, 'Example')[0].tolist()}")
+    print(f"typecodes: {typecode([1, 2]), typecode([0, 0.5], start=1), typecode(['a'])}")
+    os.remove(path)
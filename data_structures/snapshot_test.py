@@ -0,0 +1,121 @@
+""" Testing snapshot.py and dump/load of the structures using it.
+"""
+import os
+import random
+import tempfile
+from data_structures import snapshot
+from data_structures.disjoint_sets import disjoint_set_array, disjoint_set_class
+from data_structures.heaps.max_heap_class import MaxHeap
+from data_structures.heaps.min_heap_class import MinHeap
+from data_structures.trees.binary_search_trees.binary_search_tree_class import BinarySearchTree
+
+PATH = os.path.join(tempfile.mkdtemp(), "test.snapshot")
+
+
+def format_test():
+    """ Tests sections of every typecode, mapped numeric sections and errors.
+    """
+    snapshot.dump(PATH, "Test", [("q", [-2**63, 2**63 - 1]), ("B", b"\x01\x02\x03"),
+                                 ("d", [0.5]), (snapshot.PICKLE, ["a", (1, 2)]), ("q", [])])
+    numbers, small, floats, objects, empty = snapshot.load(PATH, "Test")
+    assert isinstance(numbers, memoryview) and numbers.tolist() == [-2**63, 2**63 - 1]
+    assert small.tolist() == [1, 2, 3] and floats.tolist() == [0.5]
+    assert objects == ["a", (1, 2)] and len(empty) == 0
+    numbers[0] = 0  # copy-on-write, the file doesn't change
+    assert snapshot.load(PATH, "Test")[0][0] == -2**63
+    assert snapshot.typecode([1, 2**63]) == snapshot.PICKLE
+    assert snapshot.typecode([True]) == snapshot.PICKLE
+    assert snapshot.typecode([0, 1.5], start=1) == "d"
+    for kind, error in (("Other", "not Other"), ("Test", None)):
+        try:
+            snapshot.load(PATH, kind)
+            assert error is None
+        except Exception as e:
+            assert error in str(e)
+    with open(PATH, "r+b") as f:
+        f.truncate(40)
+    for path in (PATH, __file__):
+        try:
+            snapshot.load(path, "Test")
+            assert False
+        except Exception as e:
+            assert "truncated" in str(e) or "not a snapshot" in str(e)
+    print("<<< format test is good >>>")
+
+
+def heap_test():
+    """ Tests that heaps of numbers and of other objects come back the same and
+    keep working after load.
+    """
+    for cls, pop in ((MinHeap, "pop_min"), (MaxHeap, "pop_max")):
+        for data in ([random.randrange(10**12) for i in range(1000)],
+                     [random.random() for i in range(1000)],
+                     [str(random.random()) for i in range(100)], []):
+            heap = cls()
+            heap.build_heap(data)
+            heap.dump(PATH)
+            loaded = cls.load(PATH)
+            assert list(loaded.heaplist) == list(heap.heaplist)
+            assert loaded.size == heap.size
+            for i in range(10):
+                x = random.choice(data) if data else 0
+                loaded.insert(x)
+                data.append(x)
+            popped = [getattr(loaded, pop)() for i in range(loaded.size)]
+            assert popped == sorted(data, reverse=cls is MaxHeap)
+    print("<<< heap test is good >>>")
+
+
+def disjoint_set_test():
+    """ Tests both disjoint sets against the ones they were dumped from.
+    """
+    n = 1000
+    ds = disjoint_set_array.DisjointSet(n)
+    for i in range(n):
+        ds.union(random.randrange(n), random.randrange(n))
+    ds.dump(PATH)
+    loaded = disjoint_set_array.DisjointSet.load(PATH)
+    assert loaded.components == ds.components
+    for i in range(n):
+        x, y = random.randrange(n), random.randrange(n)
+        assert loaded.union(x, y) == ds.union(x, y)
+    assert loaded.make_set() == ds.make_set()
+    assert loaded.parent == ds.parent and loaded.rank == ds.rank
+
+    elements = [f"e{i}" for i in range(n)]
+    ds = disjoint_set_class.DisjointSet()
+    for x in elements:
+        ds.make_set(x)
+    for i in range(n):
+        ds.union(random.choice(elements), random.choice(elements))
+    ds.dump(PATH)
+    loaded = disjoint_set_class.DisjointSet.load(PATH)
+    for x in elements:
+        assert loaded.find(x) == ds.find(x)
+    print("<<< disjoint set test is good >>>")
+
+
+def bst_test():
+    """ Tests that a tree comes back with the same keys and values, balanced.
+    """
+    keys = random.sample(range(10**6), 1000)
+    bst = BinarySearchTree()
+    for key in keys:
+        bst[key] = str(key)
+    bst.dump(PATH)
+    loaded = BinarySearchTree.load(PATH)
+    assert len(loaded) == len(keys) and list(loaded) == sorted(keys)
+    assert all(loaded[key] == str(key) for key in keys)
+    for key in keys[:500]:
+        del loaded[key]
+    assert list(loaded) == sorted(keys[500:])
+    BinarySearchTree().dump(PATH)
+    assert BinarySearchTree.load(PATH).root is None
+    print("<<< bst test is good >>>")
+
+
+if __name__ == "__main__":
+    format_test()
+    heap_test()
+    disjoint_set_test()
+    bst_test()
@@ -0,0 +1,15 @@
+""" Stacks: via dynamic array, linked list and array chunks, and stacks
+with a running aggregate such as minimum, maximum or sum.
+
+Usage:
+from data_structures.stacks import Stack  # stack_via_array.py
+from data_structures.stacks.stack_via_chunks import Stack
+"""
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, globals(), {
+    "Stack": "stack_via_array",
+    "AggregateStack": "aggregate_stack",
+    "MinMaxSumStack": "aggregate_stack",
+    "AggregateQueue": "aggregate_stack",
+})
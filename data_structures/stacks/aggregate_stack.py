@@ -0,0 +1,176 @@
+""" Implementing stack with O(1) running aggregate of its elements, e.g.
+minimum, maximum or sum, and a queue of two such stacks.
+https://en.wikipedia.org/wiki/Monoid
+
+Together with every element the stack keeps the aggregate of this element and
+all the elements below it, so the aggregate of the whole stack is always on
+top. Aggregates are combined with any associative function op, elements are
+turned into aggregates with lift (identity by default).
+
+AggregateQueue keeps two aggregate stacks like queue_via_stacks.Queue does,
+so the aggregate of the whole queue, e.g. of a sliding window, is op of the
+two stack aggregates. Enqueue and the aggregate are O(1), dequeue is O(1)
+amortized.
+
+Usage:
+s = AggregateStack(min)  # stack with running minimum
+s = AggregateStack(op, lift)  # any monoid, op(a, b) must be associative
+s.push(x), s.pop(), s.top(), s.empty(), len(s)
+s.aggregate()  # aggregate of all elements in the stack, O(1)
+
+s = MinMaxSumStack()  # stack with running minimum, maximum and sum
+s.min(), s.max(), s.sum()  # O(1)
+
+q = AggregateQueue(op, lift)  # queue with the same aggregates
+q.enqueue(x), q.dequeue(), q.aggregate()
+"""
+
+
+class AggregateStack:
+    def __init__(self, op, lift=None, left=False):
+        self.op = op  # associative function combining two aggregates
+        self.lift = lift  # turns an element into an aggregate, None is identity
+        # if left is True, a new element goes to the left of op, i.e. the stack
+        # aggregates its elements from top to bottom instead of bottom to top
+        self.left = left
+        self.items = []
+        self.aggregates = []  # aggregates[i]: aggregate of items[0..i]
+
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.items})"
+
+    def empty(self):
+        """ Returns True if stack is empty, False otherwise.
+        Time complexity: O(1).
+        """
+        return len(self.items) == 0
+
+    def push(self, element):
+        """ Pushes element to the top of the stack.
+        Time complexity: O(1).
+        """
+        value = element if self.lift is None else self.lift(element)
+        if self.aggregates:
+            below = self.aggregates[-1]
+            value = self.op(value, below) if self.left else self.op(below, value)
+        self.items.append(element)
+        self.aggregates.append(value)
+
+    def top(self):
+        """ Returns the element from the top of the stack.
+        Time complexity: O(1).
+        """
+        return self.items[-1]
+
+    def pop(self):
+        """ Pops an element from top of the stack and returns it.
+        Time complexity: O(1).
+        """
+        if self.empty():
+            raise Exception("Cannot pop an element from an empty stack.")
+
+        self.aggregates.pop()
+        return self.items.pop()
+
+    def aggregate(self):
+        """ Returns aggregate of all elements in the stack.
+        Time complexity: O(1).
+        """
+        if self.empty():
+            raise Exception("Cannot aggregate an empty stack.")
+        return self.aggregates[-1]
+
+
+def _min_max_sum(a, b):
+    return min(a[0], b[0]), max(a[1], b[1]), a[2] + b[2]
+
+
+class MinMaxSumStack(AggregateStack):
+    """ Stack with running minimum, maximum and sum of its elements.
+    """
+
+    def __init__(self):
+        super().__init__(_min_max_sum, lambda x: (x, x, x))
+
+    def min(self):
+        """ Returns the minimum element of the stack. Time complexity: O(1).
+        """
+        return self.aggregate()[0]
+
+    def max(self):
+        """ Returns the maximum element of the stack. Time complexity: O(1).
+        """
+        return self.aggregate()[1]
+
+    def sum(self):
+        """ Returns the sum of the elements of the stack. Time complexity: O(1).
+        """
+        return self.aggregate()[2]
+
+
+class AggregateQueue:
+    """ Queue of two aggregate stacks with O(1) aggregate of all its elements.
+    """
+
+    def __init__(self, op, lift=None):
+        self.op = op
+        # the oldest element is on top of pop_stack, so it aggregates top to bottom
+        self.push_stack = AggregateStack(op, lift)
+        self.pop_stack = AggregateStack(op, lift, left=True)
+
+    def __len__(self):
+        return len(self.push_stack) + len(self.pop_stack)
+
+    def empty(self):
+        """ Returns True if queue is empty, False otherwise.
+        """
+        return self.push_stack.empty() and self.pop_stack.empty()
+
+    def enqueue(self, x):
+        """ Adds element x to the queue. Time complexity: O(1).
+        """
+        self.push_stack.push(x)
+
+    def dequeue(self):
+        """ Removes the 1st element from the queue and returns it.
+        Amortized time complexity: O(1).
+        """
+        if self.empty():
+            raise Exception("Cannot dequeue from an empty queue.")
+
+        if self.pop_stack.empty():
+            while not self.push_stack.empty():
+                self.pop_stack.push(self.push_stack.pop())
+        return self.pop_stack.pop()
+
+    def aggregate(self):
+        """ Returns aggregate of all elements in the queue, from the 1st to the
+        last one. Time complexity: O(1).
+        """
+        if self.pop_stack.empty():
+            return self.push_stack.aggregate()
+        if self.push_stack.empty():
+            return self.pop_stack.aggregate()
+        return self.op(self.pop_stack.aggregate(), self.push_stack.aggregate())
+
+
+if __name__ == "__main__":
+    stack = MinMaxSumStack()
+    for x in [3, -1, 4, 1, -5, 9]:
+        stack.push(x)
+        print(f"push {x}: min = {stack.min()}, max = {stack.max()}, sum = {stack.sum()}")
+    while not stack.empty():
+        print(f"pop {stack.pop()}", end="")
+        if not stack.empty():
+            print(f": min = {stack.min()}, max = {stack.max()}, sum = {stack.sum()}", end="")
+        print()
+
+    window = AggregateQueue(max)  # maximum of the last 3 elements
+    for x in [1, 3, 2, 5, 4, 1, 1]:
+        window.enqueue(x)
+        if len(window) > 3:
+            window.dequeue()
+        print(f"enqueue {x}: window max = {window.aggregate()}")
@@ -0,0 +1,73 @@
+""" Testing aggregate_stack.py.
+"""
+import operator
+import random
+from collections import deque
+from data_structures.stacks.aggregate_stack import AggregateStack, MinMaxSumStack, AggregateQueue
+
+
+def stack_test():
+    """ Tests aggregates of stacks against aggregating the elements directly.
+    String concatenation isn't commutative, so it checks the order too.
+    """
+    concat, reference = AggregateStack(operator.add, str), []
+    min_max_sum = MinMaxSumStack()
+    for i in range(2000):
+        if reference and random.random() < 0.4:
+            x = reference.pop()
+            assert concat.pop() == x and min_max_sum.pop() == x
+        else:
+            x = random.randrange(-50, 50)
+            concat.push(x)
+            min_max_sum.push(x)
+            reference.append(x)
+        assert len(concat) == len(reference) and concat.empty() == (not reference)
+        if reference:
+            assert concat.top() == reference[-1]
+            assert concat.aggregate() == "".join(map(str, reference))
+            assert (min_max_sum.min(), min_max_sum.max(), min_max_sum.sum()) == \
+                (min(reference), max(reference), sum(reference))
+    print("<<< stack test is good >>>")
+
+
+def queue_test():
+    """ Tests aggregates of AggregateQueue against aggregating the elements
+    directly, from the 1st to the last one.
+    """
+    concat, reference = AggregateQueue(operator.add, str), deque()
+    window_max = AggregateQueue(max)
+    for i in range(2000):
+        if reference and random.random() < 0.45:
+            x = reference.popleft()
+            assert concat.dequeue() == x and window_max.dequeue() == x
+        else:
+            x = random.randrange(100)
+            concat.enqueue(x)
+            window_max.enqueue(x)
+            reference.append(x)
+        assert len(concat) == len(reference)
+        if reference:
+            assert concat.aggregate() == "".join(map(str, reference))
+            assert window_max.aggregate() == max(reference)
+    print("<<< queue test is good >>>")
+
+
+def empty_test():
+    """ Tests errors on an empty stack and queue.
+    """
+    for operation in (AggregateStack(min).pop, AggregateStack(min).aggregate,
+                      MinMaxSumStack().min, AggregateQueue(min).dequeue,
+                      AggregateQueue(min).aggregate):
+        try:
+            operation()
+            flag = True
+        except Exception:
+            flag = False
+        assert not flag
+    print("<<< empty test is good >>>")
+
+
+if __name__ == "__main__":
+    stack_test()
+    queue_test()
+    empty_test()
@@ -0,0 +1,140 @@
+""" Implementing stack using a list of fixed-size chunks.
+
+Elements are stored in chunks of chunk_size elements. With a typecode the
+chunks are array.array objects that store raw machine values, e.g. 8 bytes per
+"q" integer instead of a pointer to a boxed int object. Without a typecode the
+chunks are plain lists, i.e. any objects can be stored.
+
+Chunks are allocated as the stack grows and released as soon as they're empty,
+so memory drops back after a deep burst of pushes. One empty chunk is kept as
+a spare, so pushing and popping around a chunk boundary doesn't allocate a new
+chunk every time.
+
+Usage:
+stack = Stack()  # stack of any objects
+stack = Stack("q", chunk_size=2**16)  # stack of 64-bit signed integers
+stack.push(x), stack.pop(), stack.top(), stack.empty(), len(stack)  # O(1)
+stack.push_many(seq)  # pushes elements of seq, the last one ends up on top
+stack.pop_many(k)  # pops up to k elements, returns them in the order of popping
+"""
+from array import array
+
+
+class Stack:
+    def __init__(self, typecode=None, chunk_size=4096):
+        if chunk_size < 1:
+            raise Exception("Chunk size must be positive.")
+        self.typecode = typecode  # typecode of array.array, None for lists
+        self.chunk_size = chunk_size
+        self.chunks = []  # all chunks but the last one are full
+        self.spare = None  # empty chunk kept for the next push
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(typecode={self.typecode!r}, size={self.size})"
+
+    def _new_chunk(self):
+        """ Returns an empty chunk, reuses the spare one if there's one.
+        """
+        if self.spare is not None:
+            chunk, self.spare = self.spare, None
+            return chunk
+        return [] if self.typecode is None else array(self.typecode)
+
+    def _release_last_chunk(self):
+        """ Removes the empty last chunk, keeps it as a spare one.
+        """
+        self.spare = self.chunks.pop()
+
+    def empty(self):
+        """ Returns True if stack is empty, False otherwise.
+        Time complexity: O(1).
+        """
+        return self.size == 0
+
+    def push(self, element):
+        """ Pushes element to the top of the stack.
+        Time complexity: O(1).
+        """
+        if not self.chunks or len(self.chunks[-1]) == self.chunk_size:
+            self.chunks.append(self._new_chunk())
+        self.chunks[-1].append(element)
+        self.size += 1
+
+    def top(self):
+        """ Returns the element from the top of the stack.
+        Time complexity: O(1).
+        """
+        if self.empty():
+            raise Exception("Cannot get an element of an empty stack.")
+        return self.chunks[-1][-1]
+
+    def pop(self):
+        """ Pops an element from top of the stack and returns it.
+        Time complexity: O(1).
+        """
+        if self.empty():
+            raise Exception("Cannot pop an element from an empty stack.")
+
+        chunk = self.chunks[-1]
+        removed = chunk.pop()
+        if not chunk:
+            self._release_last_chunk()
+        self.size -= 1
+        return removed
+
+    def push_many(self, seq):
+        """ Pushes all elements of seq, the last element ends up on top.
+        Time complexity: O(k), k is a number of pushed elements.
+        """
+        if self.typecode is not None and not (isinstance(seq, array) and
+                                              seq.typecode == self.typecode):
+            seq = array(self.typecode, seq)  # chunks can't extend by other typecodes
+        elif self.typecode is None and not isinstance(seq, list):
+            seq = list(seq)
+        start = 0
+        while start < len(seq):
+            if not self.chunks or len(self.chunks[-1]) == self.chunk_size:
+                self.chunks.append(self._new_chunk())
+            chunk = self.chunks[-1]
+            end = start + self.chunk_size - len(chunk)  # fill up the last chunk
+            chunk.extend(seq[start:end])
+            start = end
+        self.size += len(seq)
+
+    def pop_many(self, k):
+        """ Pops up to k elements and returns them in the order of popping, i.e.
+        the top element first, as an array of the stack typecode or a list.
+        Time complexity: O(k).
+        """
+        k = min(k, self.size)
+        removed = [] if self.typecode is None else array(self.typecode)
+        left = k
+        while left:
+            chunk = self.chunks[-1]
+            take = min(left, len(chunk))
+            part = chunk[len(chunk) - take:]
+            part.reverse()
+            removed.extend(part)
+            del chunk[len(chunk) - take:]
+            if not chunk:
+                self._release_last_chunk()
+            left -= take
+        self.size -= k
+        return removed
+
+
+if __name__ == "__main__":
+    stack = Stack("q", chunk_size=4)
+
+    print(f"Is stack empty? {stack.empty()}")
+    stack.push_many(range(10))
+    stack.push(10)
+    print(f"Is stack empty? {stack.empty()}, size: {len(stack)}, chunks: {len(stack.chunks)}")
+    print(f"top element: {stack.top()}")
+    print(f"pop: {stack.pop()}")
+    print(f"pop many: {stack.pop_many(6).tolist()}")
+    print(f"size: {len(stack)}, chunks: {len(stack.chunks)}")
@@ -0,0 +1,54 @@
+""" Testing stack_via_chunks.py.
+"""
+import random
+from array import array
+from data_structures.stacks.stack_via_chunks import Stack
+
+
+def push_pop_test():
+    """ Tests single and bulk pushes and pops against Python list, across
+    chunk boundaries.
+    """
+    for typecode in (None, "q"):
+        stack = Stack(typecode, chunk_size=7)
+        reference = []
+        for i in range(2000):
+            if random.random() < 0.5:
+                data = [random.randrange(1000) for j in range(random.randrange(20))]
+                stack.push_many(data)
+                reference.extend(data)
+            else:
+                k = random.randrange(20)  # can be more than the size
+                start = max(len(reference) - k, 0)
+                expected = reference[start:][::-1]
+                del reference[start:]
+                assert list(stack.pop_many(k)) == expected
+            assert len(stack) == len(reference)
+            if reference:
+                assert stack.top() == reference[-1]
+        assert [stack.pop() for i in range(len(stack))] == reference[::-1]
+        assert stack.empty()
+    print("<<< push and pop test is good >>>")
+
+
+def push_many_typecode_test():
+    """ Tests push_many of arrays with the stack's typecode and other ones.
+    """
+    stack = Stack("q", chunk_size=4)
+    stack.push_many(array("q", [1, 2, 3]))
+    stack.push_many(array("i", [4, 5, 6]))  # converted to "q"
+    stack.push_many(array("b", [7]))
+    assert list(stack.pop_many(7)) == [7, 6, 5, 4, 3, 2, 1]
+    assert all(chunk.typecode == "q" for chunk in stack.chunks)
+    try:
+        stack.push_many(array("d", [1.5]))  # floats don't fit "q"
+        flag = True
+    except TypeError:
+        flag = False
+    assert not flag
+    print("<<< push many typecode test is good >>>")
+
+
+if __name__ == "__main__":
+    push_pop_test()
+    push_many_typecode_test()
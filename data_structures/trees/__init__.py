@@ -0,0 +1,13 @@
+""" Trees.
+
+Usage:
+from data_structures.trees import BinarySearchTree
+"""
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, globals(), {
+    "BinarySearchTree": "binary_search_trees.binary_search_tree_class",
+    "SplayTree": "binary_search_trees.splay_tree_class",
+    "ConcurrentBinarySearchTree": "binary_search_trees.concurrent_tree_class",
+    "IntervalTree": "binary_search_trees.interval_tree_class",
+})
@@ -0,0 +1,15 @@
+""" Binary search trees: unbalanced, splay tree, interval tree, and a tree
+with lock-free readers for threads.
+
+Usage:
+from data_structures.trees.binary_search_trees import BinarySearchTree
+"""
+from ..._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, globals(), {
+    "TreeNode": "binary_search_tree_class",
+    "BinarySearchTree": "binary_search_tree_class",
+    "SplayTree": "splay_tree_class",
+    "ConcurrentBinarySearchTree": "concurrent_tree_class",
+    "IntervalTree": "interval_tree_class",
+})
@@ -11,10 +11,19 @@ bst["a"] = 97  # sets key("a") in tree equal to value(97)
 "a" in bst  # checks if key is in the tree
 bst["a"]  # returns value of a key if it's present, None otherwise
 del bst["a"]  # deletes key from the tree if it's present, raises an error if it doesn't
+left, right = bst.split(key)  # moves keys < key and the rest into two trees, O(h + m)
+bst = BinarySearchTree.join(left, right)  # moves keys of both trees into one, O(h)
+bst.delete_range(lo, hi)  # deletes keys lo <= key < hi, returns their number, O(h + k)
+bst.pop_lowest(k)  # deletes k lowest keys, returns their (key, value) pairs, O(h + k)
+bst.dump(path)  # writes sorted keys and values to a snapshot file
+bst = BinarySearchTree.load(path)  # reads them back as a balanced tree
 
 Following code implements unbalanced binary search tree so operations might take
-O(n) time in the worst case, where n is a total number of nodes.
+O(n) time in the worst case, where n is a total number of nodes. h is the height
+of the tree, m in split is the number of keys in the smaller of the two trees,
+they're counted to know the sizes of the trees.
 """
+from ... import snapshot
 
 
 class TreeNode:
@@ -98,6 +107,14 @@ class TreeNode:
             curr = curr.left
         return curr
 
+    def find_max(self):
+        """ Returns a node with maximum key for current tree.
+        """
+        curr = self
+        while curr.right:
+            curr = curr.right
+        return curr
+
     def remove_node(self):
         """ Removes node from the tree. Raises an exception if it's a root node.
         Method shouldn't be used directly.
@@ -125,6 +142,8 @@ class TreeNode:
 
 
 class BinarySearchTree:
+    node_class = TreeNode  # class of the nodes load builds, subclasses can use their own
+
     def __init__(self, root=None):
         self.root = root
         self.size = 0
@@ -145,26 +164,30 @@ class BinarySearchTree:
         with such key is already present in the tree, updates its value.
         """
         if self.root:  # tree already has a root
-            self._put(key, val, self.root)
+            if self._put(key, val, self.root):
+                self.size += 1
         else:
             self.root = TreeNode(key, val)
-        self.size += 1
+            self.size += 1
 
     def _put(self, key, val, curr):
-        """ Helper function for put.
+        """ Helper function for put. Returns True if a new node was inserted,
+        False if value of an existing one was updated.
         """
         if key == curr.key:  # update node's value
             curr.val = val
+            return False
         elif key < curr.key:
             if curr.left:  # search left subtree
-                self._put(key, val, curr.left)
+                return self._put(key, val, curr.left)
             else:  # doesn't have a left subtree, so insert node as a left subtree
                 curr.left = TreeNode(key=key, val=val, parent=curr)
         else:
             if curr.right:  # search right subtree
-                self._put(key, val, curr.right)
+                return self._put(key, val, curr.right)
             else:  # doesn't have a right subtree, so insert node as a right subtree
                 curr.right = TreeNode(key=key, val=val, parent=curr)
+        return True
 
     def __setitem__(self, key, val):
         """ Allows usage like Python list or dictionary: tree[key]=val.
@@ -262,6 +285,193 @@ class BinarySearchTree:
         """
         return self.delete(key)
 
+    @staticmethod
+    def _nodes(root):
+        """ Yields nodes of a subtree in key order, without recursion.
+        Takes O(h) time to get to the first node and O(1) amortized per node
+        after it, where h is the height of the subtree.
+        """
+        stack, curr = [], root
+        while stack or curr:
+            while curr:  # go as far left as possible
+                stack.append(curr)
+                curr = curr.left
+            curr = stack.pop()
+            yield curr
+            curr = curr.right
+
+    @staticmethod
+    def _split(root, key):
+        """ Helper function for split. Cuts a subtree along the search path for
+        key, returns roots of two subtrees: keys less than key and the rest.
+        Time complexity: O(h).
+        """
+        left = right = None  # roots of the two parts
+        left_end = right_end = None  # nodes where the next part is attached
+        curr = root
+        while curr:
+            if curr.key < key:  # curr and its left subtree go to the left part
+                if left_end:
+                    left_end.right = curr
+                else:
+                    left = curr
+                curr.parent = left_end
+                left_end, curr = curr, curr.right
+            else:  # curr and its right subtree go to the right part
+                if right_end:
+                    right_end.left = curr
+                else:
+                    right = curr
+                curr.parent = right_end
+                right_end, curr = curr, curr.left
+        if left_end:
+            left_end.right = None
+        if right_end:
+            right_end.left = None
+        return left, right
+
+    @staticmethod
+    def _join(left, right):
+        """ Helper function for join. Returns root of a subtree of both
+        subtrees, every key in left must be less than every key in right.
+        The maximum node of left becomes the root, so the height grows by
+        one at most. Time complexity: O(h).
+        """
+        if not left:
+            return right
+        if not right:
+            return left
+        top = left.find_max()
+        if top.parent:  # cut it out, its left subtree takes its place
+            top.parent.right = top.left
+            if top.left:
+                top.left.parent = top.parent
+            top.left = left
+            left.parent = top
+        top.parent = None
+        top.right = right
+        right.parent = top
+        return top
+
+    @staticmethod
+    def _smaller_size(left, right):
+        """ Counts nodes of two subtrees in lockstep until one of them runs out.
+        Returns its number of nodes and True if it's left, False if it's right.
+        Time complexity: O(h + m), m is number of nodes in the smaller subtree.
+        """
+        left, right = BinarySearchTree._nodes(left), BinarySearchTree._nodes(right)
+        count = 0
+        while True:
+            if next(left, None) is None:
+                return count, True
+            if next(right, None) is None:
+                return count, False
+            count += 1
+
+    def split(self, key):
+        """ Splits the tree into two trees, returns (keys less than key, keys
+        greater than or equal to key). Nodes are moved, not copied, so the
+        tree is left empty. Time complexity: O(h + m), h is the height of the
+        tree, m is the number of keys in the smaller part, which is counted.
+        """
+        left, right = self.__class__(), self.__class__()
+        left.root, right.root = self._split(self.root, key)
+        count, is_left = self._smaller_size(left.root, right.root)
+        left.size = count if is_left else self.size - count
+        right.size = self.size - left.size
+        self.root, self.size = None, 0
+        return left, right
+
+    @classmethod
+    def join(cls, left, right):
+        """ Returns a tree with nodes of both trees, every key in left must be
+        less than every key in right. Nodes are moved, not copied, so both
+        trees are left empty. Time complexity: O(h).
+        """
+        if left.root and right.root and left.root.find_max().key >= right.root.find_min().key:
+            raise Exception("Every key in the left tree must be less than every key in the right one.")
+        tree = cls()
+        tree.root = cls._join(left.root, right.root)
+        tree.size = left.size + right.size
+        left.root, left.size, right.root, right.size = None, 0, None, 0
+        return tree
+
+    def delete_range(self, lo, hi):
+        """ Removes every node with lo <= key < hi from the tree at once.
+        Returns number of removed nodes. Time complexity: O(h + k), k is
+        number of removed nodes.
+        """
+        left, rest = self._split(self.root, lo)
+        middle, right = self._split(rest, hi)
+        count = sum(1 for node in self._nodes(middle))
+        self.root = self._join(left, right)
+        self.size -= count
+        return count
+
+    def pop_lowest(self, k):
+        """ Removes k nodes with the lowest keys from the tree, or every node if
+        there're fewer. Returns their (key, value) pairs in key order. Raises an
+        error if k is negative. Time complexity: O(h + k).
+        """
+        if k < 0:
+            raise Exception(f"Cannot pop {k} nodes, k must not be negative.")
+        popped = []
+        for node in self._nodes(self.root):
+            if len(popped) == k:  # node has the lowest key left in the tree
+                self.root = self._split(self.root, node.key)[1]
+                break
+            popped.append((node.key, node.val))
+        else:  # every node is popped
+            self.root = None
+        self.size -= len(popped)
+        return popped
+
+    def dump(self, path):
+        """ Writes the tree to a snapshot file as two flat arrays, keys in
+        sorted order and their values, see snapshot.py. Traverses the tree
+        without recursion, so it works for degenerate trees of any height.
+        Time complexity: O(n).
+        """
+        keys, vals = [], []
+        for node in self._nodes(self.root):
+            keys.append(node.key)
+            vals.append(node.val)
+        snapshot.dump(path, self.__class__.__name__, [
+            (snapshot.typecode(keys), keys),
+            (snapshot.typecode(vals), vals),
+        ])
+
+    @classmethod
+    def load(cls, path):
+        """ Returns a tree read from a snapshot file written by dump. The tree
+        is built perfectly balanced from the sorted keys, whatever shape the
+        dumped one had. Time complexity: O(n).
+        """
+        keys, vals = snapshot.load(path, cls.__name__)
+        tree = cls()
+        tree.root = tree._build(keys, vals, 0, len(keys) - 1, None)
+        tree.size = len(keys)
+        return tree
+
+    def _build(self, keys, vals, lo, hi, parent):
+        """ Helper function for load. Returns root of a balanced subtree of
+        keys[lo..hi] made of node_class nodes, recursion depth is O(lg(n)).
+        """
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self.node_class(keys[mid], vals[mid], parent=parent)
+        node.left = self._build(keys, vals, lo, mid - 1, node)
+        node.right = self._build(keys, vals, mid + 1, hi, node)
+        self._fix(node)
+        return node
+
+    @staticmethod
+    def _fix(node):
+        """ Called by _build on every node once its subtrees are built, so
+        subclasses can set the data they keep in nodes. Does nothing here.
+        """
+
 
 if __name__ == "__main__":
     bst = BinarySearchTree()
@@ -0,0 +1,144 @@
+""" Testing binary_search_tree_class.py.
+"""
+import string
+import random
+from data_structures.trees.binary_search_trees.binary_search_tree_class import TreeNode, BinarySearchTree
+
+
+def inorder_traversal(bst):
+    """ Returns a string of inorder key traversal of a binary search tree.
+    """
+    result = []
+    for k in bst:
+        result.append(k)
+    return " ".join(map(str, result))
+
+
+def put_test(display=False):
+    """ Tests put method of BinarySearchTree class. If display == True, prints
+    out intermediate test results to the screen.
+    """
+    bst = BinarySearchTree()  # initialize empty tree
+    keys = [5, 30, 2, 40, 25, 4]
+    result = ["5", "5 30", "2 5 30", "2 5 30 40", "2 5 25 30 40", "2 4 5 25 30 40"]
+    for i, k in enumerate(keys):  # fill the tree with nodes
+        bst.put(k, "no value")
+        if display:
+            print(f"Adding TreeNode with key = {k}")
+        curr = inorder_traversal(bst)  # current inorder traversal of a tree
+        assert curr == result[i]
+        if display:
+            print(f"current result of inorder traversal: {curr}")
+            print()
+    print("<<< put test is good >>>")
+
+
+def setitem_test():
+    """ Tests __setitem__ and __getitem__ method of BinarySearchTree class.
+    """
+    bst = BinarySearchTree()
+    letters = string.ascii_uppercase
+    for i, char in enumerate(letters):
+        bst[i] = char
+        assert bst[i] == char
+    assert inorder_traversal(bst) == \
+        "0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 25"
+    print("<<< setitem test is good >>>")
+
+
+def contains_test():
+    """ Tests __contains__ method of BinarySearchTree class.
+    """
+    bst = BinarySearchTree()
+    keys = [random.randrange(1, 100) for i in range(10**3)]
+    for i, k in enumerate(keys):
+        bst[k] = i
+    for k in keys:
+        assert (k in bst) == True
+    print("<<< contains test is good >>>")
+
+
+def delete_test():
+    """ Tests __delitem__ method of BinarySearchTree class.
+    """
+    bst = BinarySearchTree()
+    keys = set()
+    while len(keys) < 10**3:
+        keys.add(random.randrange(1, 10**6))
+    for i, k in enumerate(keys):
+        bst[k] = i
+    for k in keys:
+        del bst[k]
+        assert (k not in bst) == True
+    print("<<< delete test is good >>>")
+
+
+def random_tree(n):
+    """ Returns a tree of n distinct random keys, each with its key as value,
+    and a sorted list of the keys.
+    """
+    bst = BinarySearchTree()
+    keys = random.sample(range(10**6), n)
+    for k in keys:
+        bst[k] = k
+    return bst, sorted(keys)
+
+
+def split_join_test():
+    """ Tests split and join methods of BinarySearchTree class.
+    """
+    bst, keys = random_tree(10**3)
+    assert len(bst) == len(keys)
+    bst[keys[0]] = "updated"  # updating a key doesn't change the size
+    assert len(bst) == len(keys)
+    key = keys[300]
+    left, right = bst.split(key)
+    assert len(bst) == 0 and not bst.root
+    assert list(left) == keys[:300] and len(left) == 300
+    assert list(right) == keys[300:] and len(right) == 700
+    try:
+        BinarySearchTree.join(right, left)  # keys of the trees overlap
+        joined = True
+    except Exception:
+        joined = False
+    assert not joined
+    bst = BinarySearchTree.join(left, right)
+    assert list(bst) == keys and len(bst) == len(keys)
+    assert len(left) == 0 and len(right) == 0
+    assert bst[keys[0]] == "updated" and bst[key] == key
+    print("<<< split and join test is good >>>")
+
+
+def delete_range_test():
+    """ Tests delete_range and pop_lowest methods of BinarySearchTree class.
+    """
+    bst, keys = random_tree(10**3)
+    lo, hi = keys[100], keys[400]
+    assert bst.delete_range(lo, hi) == 300
+    keys = keys[:100] + keys[400:]
+    assert list(bst) == keys and len(bst) == len(keys)
+    assert bst.delete_range(hi + 1, hi + 1) == 0
+    assert bst.pop_lowest(200) == [(k, k) for k in keys[:200]]
+    assert list(bst) == keys[200:] and len(bst) == len(keys) - 200
+    for k in keys[200:300]:
+        del bst[k]
+    assert list(bst) == keys[300:]
+    try:
+        bst.pop_lowest(-1)
+        flag = True
+    except Exception:
+        flag = False
+    assert not flag and list(bst) == keys[300:]
+    assert bst.pop_lowest(0) == [] and list(bst) == keys[300:]
+    assert bst.pop_lowest(10**4) == [(k, k) for k in keys[300:]]
+    assert len(bst) == 0 and not bst.root
+    print("<<< delete range test is good >>>")
+
+
+if __name__ == "__main__":
+    put_test()
+    setitem_test()
+    contains_test()
+    delete_test()
+    split_join_test()
+    delete_range_test()
@@ -0,0 +1,179 @@
+""" Implementation of an ADT map shared by many reader threads and a few
+writer threads, on top of binary_search_tree_class.py.
+
+Readers never take a lock. Nodes are never changed once they're in the
+tree: a writer copies the nodes on the search path of its key, links the
+copies to the untouched subtrees and publishes the new root with a single
+assignment (read-copy-update). A reader takes the current root once and
+searches or iterates over that version of the tree, whatever writers do
+meanwhile. Writers take a lock, so they're serialized among themselves,
+and replaced nodes are freed by the garbage collector once no reader holds
+an older root.
+
+https://en.wikipedia.org/wiki/Persistent_data_structure#Trees
+https://en.wikipedia.org/wiki/Read-copy-update
+
+Usage:
+tree = ConcurrentBinarySearchTree()  # initializes an empty tree
+tree["a"] = 97  # sets key("a") in tree equal to value(97), O(h) new nodes
+"a" in tree  # checks if key is in the tree, lock-free
+tree["a"]  # returns value of a key if it's present, None otherwise, lock-free
+del tree["a"]  # deletes key from the tree, raises an error if it doesn't exist
+list(tree)  # keys of one version of the tree in sorted order, lock-free
+
+Like BinarySearchTree the tree is unbalanced, h is its height. Nodes are
+TreeNodes without parent links, one node can be in several versions.
+"""
+import threading
+from .binary_search_tree_class import TreeNode, BinarySearchTree
+
+
+class ConcurrentBinarySearchTree:
+    def __init__(self):
+        self.root = None  # current version, replaced as a whole by writers
+        self.size = 0
+        self.lock = threading.Lock()  # serializes writers
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(root={self.root})"
+
+    def __iter__(self):
+        """ Yields keys of the version of the tree current when iteration
+        starts, in sorted order. Writes made meanwhile aren't seen.
+        """
+        return (node.key for node in BinarySearchTree._nodes(self.root))
+
+    def items(self):
+        """ Same as __iter__, but yields (key, value) pairs.
+        """
+        return ((node.key, node.val) for node in BinarySearchTree._nodes(self.root))
+
+    def _get(self, key):
+        """ Helper function for get. Returns link to the node with key=key if
+        there's one, returns None otherwise. Lock-free.
+        """
+        curr = self.root  # a reader sees one version from here on
+        while curr:
+            if key == curr.key:
+                return curr
+            curr = curr.right if key > curr.key else curr.left
+        return None
+
+    def get(self, key):
+        """ Returns a value of a node with key=key if there's one,
+        returns None if there's no such node. Lock-free.
+        Time complexity: O(h).
+        """
+        node = self._get(key)
+        if node:
+            return node.val
+        return None
+
+    def __getitem__(self, key):
+        """ Allows usage like Python list or dictionary: x = tree[key].
+        """
+        return self.get(key)
+
+    def __contains__(self, key):
+        """ Allows membership check like: key in tree / key not in tree.
+        """
+        return self._get(key) is not None
+
+    @staticmethod
+    def _path(root, key):
+        """ Returns nodes on the search path for key from the root, without
+        the node with key=key, and that node or None.
+        """
+        path, curr = [], root
+        while curr and key != curr.key:
+            path.append(curr)
+            curr = curr.right if key > curr.key else curr.left
+        return path, curr
+
+    @staticmethod
+    def _copy_path(path, key, subtree):
+        """ Returns root of a new version of the tree: copies of the nodes on
+        the path, with subtree in place of the path's end. Time complexity: O(h).
+        """
+        for node in reversed(path):
+            if key < node.key:
+                subtree = TreeNode(node.key, node.val, subtree, node.right)
+            else:
+                subtree = TreeNode(node.key, node.val, node.left, subtree)
+        return subtree
+
+    def put(self, key, val):
+        """ Inserts a new node in the tree with key=key and value=val. If node
+        with such key is already present in the tree, updates its value.
+        Time complexity: O(h).
+        """
+        with self.lock:
+            path, node = self._path(self.root, key)
+            if node:
+                subtree = TreeNode(key, val, node.left, node.right)
+            else:
+                subtree = TreeNode(key, val)
+            self.root = self._copy_path(path, key, subtree)  # publishes it
+            if not node:
+                self.size += 1
+
+    def __setitem__(self, key, val):
+        """ Allows usage like Python list or dictionary: tree[key]=val.
+        """
+        return self.put(key, val)
+
+    def delete(self, key):
+        """ Removes node with key=key from the tree, raises an error if there's
+        no such node. A node with two children is replaced by a copy of its
+        successor. Time complexity: O(h).
+        """
+        with self.lock:
+            path, node = self._path(self.root, key)
+            if not node:
+                raise KeyError(f"Tree doesn't have a node with key={key}.")
+            if not node.left:
+                subtree = node.right
+            elif not node.right:
+                subtree = node.left
+            else:
+                succ_path, succ = [], node.right
+                while succ.left:  # successor is the minimum of the right subtree
+                    succ_path.append(succ)
+                    succ = succ.left
+                right = self._copy_path(succ_path, succ.key, succ.right)
+                subtree = TreeNode(succ.key, succ.val, node.left, right)
+            self.root = self._copy_path(path, key, subtree)  # publishes it
+            self.size -= 1
+
+    def __delitem__(self, key):
+        """ Allows usage: del tree[key].
+        """
+        return self.delete(key)
+
+
+if __name__ == "__main__":
+    import random
+
+    tree = ConcurrentBinarySearchTree()
+    for k in [5, 30, 2, 40, 25, 4]:
+        tree[k] = str(k)
+    keys = iter(tree)  # iterates over the current version
+    del tree[30]
+    tree[1] = "1"
+    print(f"keys when iteration started: {list(keys)}")
+    print(f"keys now: {list(tree)}, size: {len(tree)}")
+
+    def write(keys):
+        for k in keys:
+            tree[k] = k
+
+    keys = random.sample(range(100, 10**6), 4000)
+    writers = [threading.Thread(target=write, args=(keys[i::4],)) for i in range(4)]
+    for thread in writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    print(f"after 4 writer threads, size: {len(tree)}, all keys in tree: {all(k in tree for k in keys)}")
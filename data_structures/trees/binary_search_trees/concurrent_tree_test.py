@@ -0,0 +1,70 @@
+""" Testing concurrent_tree_class.py.
+"""
+import random
+import threading
+from data_structures.trees.binary_search_trees.concurrent_tree_class import ConcurrentBinarySearchTree
+
+
+def random_operations_test():
+    """ Tests put, get and delete against a dictionary, and that versions
+    of the tree seen by iterators don't change.
+    """
+    tree, expected = ConcurrentBinarySearchTree(), dict()
+    versions = []
+    for i in range(10**4):
+        k = random.randrange(500)
+        operation = random.randrange(3)
+        if operation == 0:
+            tree[k] = i
+            expected[k] = i
+        elif operation == 1:
+            assert tree[k] == expected.get(k)
+            assert (k in tree) == (k in expected)
+        elif k in expected:
+            del tree[k]
+            del expected[k]
+        if i % 1000 == 0:
+            versions.append((tree.items(), sorted(expected.items())))
+    assert list(tree.items()) == sorted(expected.items())
+    assert len(tree) == len(expected)
+    for items, expected_items in versions:
+        assert list(items) == expected_items
+    print("<<< random operations test is good >>>")
+
+
+def threads_test():
+    """ Tests readers running alongside writers: keys that writers don't
+    touch are always found, and every write is applied.
+    """
+    tree = ConcurrentBinarySearchTree()
+    keys = random.sample(range(10**6), 2000)
+    stable, churned = keys[:1000], keys[1000:]
+    for k in stable:
+        tree[k] = k
+    missed = []
+
+    def read():
+        for i in range(20):
+            missed.extend(k for k in stable if tree[k] != k)
+
+    def write(own):
+        for k in own:
+            tree[k] = k
+        for k in own[::2]:
+            del tree[k]
+
+    threads = [threading.Thread(target=read) for i in range(3)] + \
+              [threading.Thread(target=write, args=(churned[i::4],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not missed
+    remaining = set(stable).union(*(churned[i::4][1::2] for i in range(4)))
+    assert list(tree) == sorted(remaining) and len(tree) == len(remaining)
+    print("<<< threads test is good >>>")
+
+
+if __name__ == "__main__":
+    random_operations_test()
+    threads_test()
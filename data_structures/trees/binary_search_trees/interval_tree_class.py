@@ -0,0 +1,180 @@
+""" Implementation of interval tree, a binary search tree of closed intervals
+that finds every interval overlapping a point or another interval:
+https://en.wikipedia.org/wiki/Interval_tree#Augmented_tree
+
+Keys are intervals (start, end), ordered by start, then by end. Every node
+also keeps the maximum end of the intervals in its subtree, so a search
+skips every subtree whose intervals all end before the query starts, and
+stops at the first interval that starts after the query ends.
+
+Same API as BinarySearchTree, it's a subclass of it, with intervals as keys:
+tree = IntervalTree()  # initializes an empty tree
+tree[(9, 12)] = "room 1"  # sets interval [9, 12] in tree equal to value("room 1")
+tree.overlapping(10)  # returns (interval, value) pairs of intervals containing 10
+tree.overlapping(8, 9)  # returns (interval, value) pairs of intervals overlapping [8, 9]
+del tree[(9, 12)]  # deletes interval from the tree, raises an error if it doesn't exist
+
+A query takes O(h * (k + 1)) time at most, where k is number of intervals
+found, usually close to O(h + k).
+"""
+from .binary_search_tree_class import TreeNode, BinarySearchTree
+
+
+class IntervalNode(TreeNode):
+    """ TreeNode with max_end, the maximum end of intervals in its subtree.
+    It's set by update, called on every new node, there's no __init__: mypyc
+    can't compile one that calls TreeNode's.
+    """
+
+    def update(self):
+        """ Recomputes max_end from the node's interval and its children.
+        Time complexity: O(1).
+        """
+        max_end = self.key[1]
+        if self.left and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+class IntervalTree(BinarySearchTree):
+    node_class = IntervalNode
+
+    def put(self, key, val):
+        """ Inserts a new node in the tree with interval key=(start, end) and
+        value=val. If node with such interval is already present in the tree,
+        updates its value.
+        """
+        if key[0] > key[1]:
+            raise Exception(f"Interval {key} starts after it ends.")
+        if self.root:
+            if self._put(key, val, self.root):
+                self.size += 1
+        else:
+            self.root = IntervalNode(key, val)
+            self.root.update()
+            self.size += 1
+
+    def _put(self, key, val, curr):
+        """ Helper function for put. Raises max_end of nodes on the way down.
+        Returns True if a new node was inserted, False if value of an
+        existing one was updated.
+        """
+        while True:
+            if key[1] > curr.max_end:
+                curr.max_end = key[1]
+            if key == curr.key:  # update node's value
+                curr.val = val
+                return False
+            if key < curr.key:
+                if not curr.left:
+                    curr.left = node = IntervalNode(key, val, parent=curr)
+                    break
+                curr = curr.left
+            else:
+                if not curr.right:
+                    curr.right = node = IntervalNode(key, val, parent=curr)
+                    break
+                curr = curr.right
+        node.update()
+        return True
+
+    @staticmethod
+    def _fix(node):
+        """ Sets max_end of a node built by load. Time complexity: O(1).
+        """
+        node.update()
+
+    @staticmethod
+    def _update_up(node):
+        """ Recomputes max_end of a node and every node above it.
+        Time complexity: O(h).
+        """
+        while node:
+            node.update()
+            node = node.parent
+
+    def remove(self, node):
+        """ Helper function for delete. Removes node from the tree, then fixes
+        max_end on the path from the lowest node that changed up to the root.
+        """
+        if node.left and node.right:  # the successor's node is cut out
+            lowest = node.right.find_min().parent
+        elif node.parent:  # node is cut out
+            lowest = node.parent
+        else:  # root with one child, the child's data is moved into it
+            lowest = node
+        super().remove(node)
+        self._update_up(lowest)
+
+    @staticmethod
+    def _split(root, key):
+        """ Same as BinarySearchTree._split, then fixes max_end of the nodes on
+        the search path, the only ones whose subtrees changed, bottom up.
+        Time complexity: O(h).
+        """
+        path, curr = [], root
+        while curr:
+            path.append(curr)
+            curr = curr.right if curr.key < key else curr.left
+        left, right = BinarySearchTree._split(root, key)
+        for node in reversed(path):
+            node.update()
+        return left, right
+
+    @staticmethod
+    def _join(left, right):
+        """ Same as BinarySearchTree._join, then fixes max_end of the nodes
+        above the new root's old place and of the new root.
+        Time complexity: O(h).
+        """
+        if not left or not right:
+            return left or right
+        top = left.find_max()
+        above, curr = [], top.parent
+        while curr:
+            above.append(curr)
+            curr = curr.parent
+        root = BinarySearchTree._join(left, right)
+        for node in above:
+            node.update()
+        root.update()
+        return root
+
+    def overlapping(self, lo, hi=None):
+        """ Returns (interval, value) pairs of every interval overlapping
+        [lo, hi], or containing point lo if hi isn't given, ordered by interval.
+        Time complexity: O(h * (k + 1)), k is number of intervals found.
+        """
+        if hi is None:
+            hi = lo
+        found = []
+        stack, curr = [], self.root
+        while stack or curr:
+            while curr and curr.max_end >= lo:  # skips subtrees ending before lo
+                stack.append(curr)
+                curr = curr.left
+            if not stack:
+                break
+            node = stack.pop()
+            if node.key[0] > hi:  # this and every next interval starts after hi
+                break
+            if node.key[1] >= lo:
+                found.append((node.key, node.val))
+            curr = node.right
+        return found
+
+
+if __name__ == "__main__":
+    tree = IntervalTree()
+    for interval, name in [((9, 12), "standup"), ((10, 11), "review"), ((13, 15), "lunch"),
+                           ((11, 14), "design"), ((16, 17), "demo")]:
+        tree[interval] = name
+    print(f"intervals: {list(tree)}")
+    print(f"at 11: {tree.overlapping(11)}")
+    print(f"within [14, 16]: {tree.overlapping(14, 16)}")
+    del tree[(11, 14)]
+    print(f"deleting (11, 14)...at 11: {tree.overlapping(11)}")
+    print(f"removing intervals starting before 12...{tree.delete_range((float('-inf'),), (12,))}")
+    print(f"intervals: {list(tree)}")
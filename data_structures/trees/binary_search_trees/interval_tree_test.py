@@ -0,0 +1,112 @@
+""" Testing interval_tree_class.py.
+"""
+import os
+import random
+import tempfile
+from data_structures.trees.binary_search_trees.interval_tree_class import IntervalTree
+
+
+def random_interval():
+    start = random.randrange(10**3)
+    return start, start + random.randrange(50)
+
+
+def max_end_is_valid(tree):
+    """ Returns True if every node's max_end is the maximum end of the
+    intervals in its subtree.
+    """
+    def max_end(node):
+        if not node:
+            return float("-inf")
+        result = max(node.key[1], max_end(node.left), max_end(node.right))
+        assert node.max_end == result
+        return result
+    max_end(tree.root)
+    return True
+
+
+def overlapping_test():
+    """ Tests overlapping method of IntervalTree class against a linear scan,
+    while intervals are added and deleted.
+    """
+    tree, expected = IntervalTree(), dict()
+    for i in range(10**3):
+        interval = random_interval()
+        tree[interval] = i
+        expected[interval] = i
+    for interval in random.sample(sorted(expected), 300):
+        del tree[interval]
+        del expected[interval]
+    assert max_end_is_valid(tree)
+    for i in range(100):
+        lo, hi = random_interval()
+        assert tree.overlapping(lo, hi) == \
+            sorted((k, v) for k, v in expected.items() if k[0] <= hi and k[1] >= lo)
+        assert tree.overlapping(lo) == \
+            sorted((k, v) for k, v in expected.items() if k[0] <= lo <= k[1])
+    print("<<< overlapping test is good >>>")
+
+
+def delete_range_test():
+    """ Tests that max_end stays valid after split, join, delete_range and
+    pop_lowest methods inherited from BinarySearchTree.
+    """
+    tree = IntervalTree()
+    for i in range(10**3):
+        tree[random_interval()] = i
+    intervals = list(tree)
+    tree.delete_range(intervals[100], intervals[400])
+    assert max_end_is_valid(tree)
+    tree.pop_lowest(100)
+    assert max_end_is_valid(tree)
+    left, right = tree.split(intervals[600])
+    assert max_end_is_valid(left) and max_end_is_valid(right)
+    tree = IntervalTree.join(left, right)
+    assert max_end_is_valid(tree) and list(tree) == intervals[400:]
+    lo, hi = random_interval()
+    assert tree.overlapping(lo, hi) == \
+        [(k, tree[k]) for k in intervals[400:] if k[0] <= hi and k[1] >= lo]
+    print("<<< delete range test is good >>>")
+
+
+def invalid_interval_test():
+    """ Tests that an interval can't end before it starts.
+    """
+    tree = IntervalTree()
+    try:
+        tree[(5, 3)] = "backwards"
+        added = True
+    except Exception:
+        added = False
+    assert not added and len(tree) == 0
+    print("<<< invalid interval test is good >>>")
+
+
+def load_test():
+    """ Tests that a tree loaded from a snapshot is made of IntervalNodes with
+    valid max_end and finds the same intervals.
+    """
+    tree = IntervalTree()
+    for i in range(10**3):
+        tree[random_interval()] = i
+    path = os.path.join(tempfile.gettempdir(), "interval_tree_test.snapshot")
+    try:
+        tree.dump(path)
+        loaded = IntervalTree.load(path)
+    finally:
+        os.remove(path)
+    assert isinstance(loaded, IntervalTree) and list(loaded) == list(tree)
+    assert max_end_is_valid(loaded)
+    for i in range(100):
+        lo, hi = random_interval()
+        assert loaded.overlapping(lo, hi) == tree.overlapping(lo, hi)
+    loaded[(2000, 2001)] = "new"
+    assert loaded.overlapping(2001) == [((2000, 2001), "new")]
+    print("<<< load test is good >>>")
+
+
+if __name__ == "__main__":
+    overlapping_test()
+    delete_range_test()
+    invalid_interval_test()
+    load_test()
@@ -0,0 +1,134 @@
+""" Implementation of an ADT map using splay tree, a self-adjusting binary
+search tree: https://en.wikipedia.org/wiki/Splay_tree
+
+Every access rotates the accessed node up to the root (splaying), so recently
+and frequently used keys stay near the top and keys close to the previous
+one are found within a few steps of it. Operations take O(lg(n)) amortized
+time, accessing a key that was accessed t accesses ago O(lg(t)) amortized,
+and a key d keys away from the previous one O(lg(d)) amortized, compared to
+O(h) from the root every time in BinarySearchTree.
+
+Same API as BinarySearchTree, it's a subclass of it:
+tree = SplayTree()  # initializes an empty tree
+tree["a"] = 97  # sets key("a") in tree equal to value(97), splays it
+tree["a"]  # returns value of a key if it's present, None otherwise, splays it
+"a" in tree  # checks if key is in the tree, splays it
+del tree["a"]  # deletes key from the tree, raises an error if it doesn't exist
+
+Lookups change the shape of the tree, so unlike BinarySearchTree it's not
+safe to read from several threads at once. The tree can temporarily be
+as deep as it's long, e.g. after inserting sorted keys, so every method is
+iterative.
+"""
+from .binary_search_tree_class import TreeNode, BinarySearchTree
+
+
+class SplayTree(BinarySearchTree):
+    def __iter__(self):
+        if not self.root:
+            raise Exception("Cannot iterate over an empty tree.")
+        return (node.key for node in self._nodes(self.root))
+
+    def _splay(self, node):
+        """ Moves node up to the root with zig, zig-zig and zig-zag steps, each
+        is one or two rotations. Time complexity: O(lg(n)) amortized.
+        """
+        while node.parent:
+            parent, grandparent = node.parent, node.parent.parent
+            if grandparent is None:  # zig
+                steps = (node,)
+            elif (grandparent.left is parent) == (parent.left is node):  # zig-zig
+                steps = (parent, node)
+            else:  # zig-zag
+                steps = (node, node)
+            for child in steps:  # rotates child above its parent
+                parent, grandparent = child.parent, child.parent.parent
+                if parent.left is child:
+                    moved = parent.left = child.right
+                    child.right = parent
+                else:
+                    moved = parent.right = child.left
+                    child.left = parent
+                if moved:
+                    moved.parent = parent
+                parent.parent = child
+                child.parent = grandparent
+                if grandparent is None:
+                    self.root = child
+                elif grandparent.left is parent:
+                    grandparent.left = child
+                else:
+                    grandparent.right = child
+
+    def _get(self, key, curr):
+        """ Helper function for get. Returns link to the node with key=key if
+        there's one, return None otherwise. Splays the node, or the last node
+        on the search path if there's no such key.
+        """
+        last = None
+        while curr:
+            last = curr
+            if key == curr.key:
+                break
+            curr = curr.right if key > curr.key else curr.left
+        if last:
+            self._splay(last)
+        return curr
+
+    def _put(self, key, val, curr):
+        """ Helper function for put. Returns True if a new node was inserted,
+        False if value of an existing one was updated. Splays the node.
+        """
+        while True:
+            if key == curr.key:  # update node's value
+                curr.val = val
+                self._splay(curr)
+                return False
+            if key < curr.key:
+                if not curr.left:
+                    curr.left = node = TreeNode(key=key, val=val, parent=curr)
+                    break
+                curr = curr.left
+            else:
+                if not curr.right:
+                    curr.right = node = TreeNode(key=key, val=val, parent=curr)
+                    break
+                curr = curr.right
+        self._splay(node)
+        return True
+
+    def delete(self, key):
+        """ Removes node with key=key from the tree, raises an error if there's
+        no such node. Splays the node to the root, then splays the maximum
+        of its left subtree, which becomes the new root over both subtrees.
+        Time complexity: O(lg(n)) amortized.
+        """
+        if not self._get(key, self.root):  # the node is the root now if it's found
+            raise KeyError(f"Tree doesn't have a node with key={key}.")
+        left, right = self.root.left, self.root.right
+        if left:
+            left.parent = None
+            self.root = left
+            self._splay(left.find_max())  # the new root has no right child
+            self.root.right = right
+            if right:
+                right.parent = self.root
+        else:
+            self.root = right
+            if right:
+                right.parent = None
+        self.size -= 1
+
+
+if __name__ == "__main__":
+    tree = SplayTree()
+    for k in [5, 30, 2, 40, 25, 4]:
+        tree[k] = f"v{k}"
+    print(f"keys: {list(tree)}, root: {tree.root}")
+    print(f"tree[25] = {tree[25]}, root: {tree.root}")
+    print(f"30 in tree: {30 in tree}, root: {tree.root}")
+    del tree[30]
+    print(f"deleting 30...keys: {list(tree)}, root: {tree.root}")
+    for k in range(10**4):  # sorted keys make a long path, it's fine
+        tree[k] = k
+    print(f"inserted sorted keys, size: {len(tree)}, root: {tree.root}")
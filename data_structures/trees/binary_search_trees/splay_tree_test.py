@@ -0,0 +1,86 @@
+""" Testing splay_tree_class.py.
+"""
+import random
+from data_structures.trees.binary_search_trees.splay_tree_class import SplayTree
+
+
+def is_valid(tree):
+    """ Returns True if keys are in order and parent links are consistent,
+    checks the tree without recursion.
+    """
+    stack = [(tree.root, None, None, None)]
+    count = 0
+    while stack:
+        node, lo, hi, parent = stack.pop()
+        if not node:
+            continue
+        if node.parent is not parent or (lo is not None and node.key <= lo) or \
+                (hi is not None and node.key >= hi):
+            return False
+        count += 1
+        stack.append((node.left, lo, node.key, node))
+        stack.append((node.right, node.key, hi, node))
+    return count == len(tree)
+
+
+def splay_test():
+    """ Tests that accessed keys are moved to the root.
+    """
+    tree = SplayTree()
+    keys = random.sample(range(10**6), 10**3)
+    for k in keys:
+        tree[k] = k
+        assert tree.root.key == k
+    for k in random.sample(keys, 100):
+        assert tree[k] == k and tree.root.key == k
+        assert k in tree and tree.root.key == k
+    assert is_valid(tree)
+    print("<<< splay test is good >>>")
+
+
+def random_operations_test():
+    """ Tests put, get and delete against a dictionary.
+    """
+    tree, expected = SplayTree(), dict()
+    for i in range(10**4):
+        k = random.randrange(500)
+        operation = random.randrange(3)
+        if operation == 0:
+            tree[k] = i
+            expected[k] = i
+        elif operation == 1:
+            assert tree[k] == expected.get(k)
+        elif k in expected:
+            del tree[k]
+            del expected[k]
+        else:
+            try:
+                del tree[k]
+                deleted = True
+            except KeyError:
+                deleted = False
+            assert not deleted
+    assert is_valid(tree)
+    assert list(tree) == sorted(expected)
+    print("<<< random operations test is good >>>")
+
+
+def sorted_keys_test():
+    """ Tests a tree that becomes a long path, deeper than the recursion limit.
+    """
+    tree = SplayTree()
+    n = 10**4
+    for k in range(n):
+        tree[k] = k
+    assert list(tree) == list(range(n))
+    assert tree[0] == 0 and tree.root.key == 0
+    for k in range(0, n, 2):
+        del tree[k]
+    assert list(tree) == list(range(1, n, 2)) and is_valid(tree)
+    print("<<< sorted keys test is good >>>")
+
+
+if __name__ == "__main__":
+    splay_test()
+    random_operations_test()
+    sorted_keys_test()